@@ -0,0 +1,79 @@
+import pytest
+
+from vengeance import flux_cls
+
+
+m = [['a', 'b', 'x'],
+     [1,   2,   1.5],
+     [1,   2,   None],
+     [1,   3,   2.0],
+     [2,   2,   4.0]]
+
+
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+def test_aggregate_by_columns(storage):
+    flux = flux_cls([[*row] for row in m], storage=storage)
+    flux = flux.aggregate(by=('a', 'b'),
+                          total=('x', 'sum'),
+                          avg=('x', 'mean'),
+                          c=('x', 'count'),
+                          n=('*', 'count'),
+                          lo=('x', 'min'),
+                          hi=('x', 'max'),
+                          fi=('x', 'first'),
+                          la=('x', 'last'),
+                          d=('x', 'count_distinct'),
+                          r=('b', lambda acc, v: acc * 10 + v))
+
+    assert list(flux.values()) == [['a', 'b', 'total', 'avg', 'c', 'n', 'lo',  'hi', 'fi', 'la', 'd', 'r'],
+                                   [1,   2,   1.5,     1.5,   1,   2,   1.5,   1.5,  1.5,  None, 1,   22],
+                                   [1,   3,   2.0,     2.0,   1,   1,   2.0,   2.0,  2.0,  2.0,  1,   3],
+                                   [2,   2,   4.0,     4.0,   1,   1,   4.0,   4.0,  4.0,  4.0,  1,   2]]
+
+
+def test_aggregate_by_single_column():
+    flux = flux_cls(m).aggregate(by='a', n=('*', 'count'))
+    assert list(flux.values()) == [['a', 'n'], [1, 3], [2, 1]]
+
+
+def test_aggregate_by_slice():
+    flux = flux_cls(m).aggregate(by=slice(0, 2), n=('*', 'count'))
+    assert list(flux.values()) == [['a', 'b', 'n'], [1, 2, 2], [1, 3, 1], [2, 2, 1]]
+
+
+def test_aggregate_by_indices():
+    flux = flux_cls(m).aggregate(by=(0, -2), n=('*', 'count'))
+    assert list(flux.values()) == [['a', 'b', 'n'], [1, 2, 2], [1, 3, 1], [2, 2, 1]]
+
+
+def test_aggregate_grand_total():
+    flux = flux_cls(m).aggregate(n=('*', 'count'), total=('x', 'sum'))
+    assert list(flux.values()) == [['n', 'total'], [4, 7.5]]
+
+
+def test_aggregate_grand_total_of_empty_flux():
+    flux = flux_cls([['a', 'b', 'x']]).aggregate(n=('*', 'count'),
+                                                  c=('x', 'count'),
+                                                  total=('x', 'sum'),
+                                                  avg=('x', 'mean'))
+    assert list(flux.values()) == [['n', 'c', 'total', 'avg'], [0, 0, None, None]]
+
+
+def test_aggregate_empty_flux_by_column():
+    flux = flux_cls([['a', 'b', 'x']]).aggregate(by='a', n=('*', 'count'))
+    assert list(flux.values()) == [['a', 'n']]
+
+
+def test_invalid_aggregations():
+    flux = flux_cls(m)
+
+    with pytest.raises(ValueError):
+        flux.aggregate(by='a')
+    with pytest.raises(ValueError):
+        flux.aggregate(by='a', n=('*', 'sum'))
+    with pytest.raises(ValueError):
+        flux.aggregate(by='a', n=('x', 'median'))
+    with pytest.raises(TypeError):
+        flux.aggregate(by='a', n='x')
+    with pytest.raises(ValueError):
+        flux.aggregate(by='c', n=('x', 'sum'))
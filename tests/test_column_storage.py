@@ -0,0 +1,165 @@
+import pytest
+
+from vengeance import flux_cls
+
+
+m = [['a', 'b', 'c'],
+     [3,   'x', 1.5],
+     [1,   'y', None],
+     [2,   'x', 0.5],
+     [1,   'z', 2.5]]
+
+
+def fluxes():
+    return (flux_cls([[*row] for row in m], storage='rows'),
+            flux_cls([[*row] for row in m], storage='columns'))
+
+
+def assert_equivalent(f):
+    flux_r, flux_c = fluxes()
+    result_r = f(flux_r)
+    result_c = f(flux_c)
+
+    assert flux_c.storage == 'columns'
+    assert list(flux_c.values()) == list(flux_r.values())
+    assert result_c == result_r
+
+
+@pytest.mark.parametrize('f', [
+    lambda flux: flux.append_rows([[4, 'w', 0.0], [5, 'v', 1.0]]),
+    lambda flux: flux.insert_rows(2, [[4, 'w', 0.0]]),
+    lambda flux: flux.append_columns('d', 'e'),
+    lambda flux: flux.insert_columns((0, 'd')),
+    lambda flux: flux.delete_columns('b'),
+    lambda flux: flux.rename_columns({'a': 'aa'}),
+    lambda flux: flux.sort('b', 'a', reverse=[True, False]),
+    lambda flux: flux.filter(lambda row: row.a > 1),
+    lambda flux: flux.filter_by_unique('a'),
+    lambda flux: flux.reverse(),
+    lambda flux: flux.shorten_to(2),
+    lambda flux: flux.__setitem__('a', [0, 0, 0, 0]),
+    lambda flux: flux.__setitem__((0, 'd'), [0, 0, 0, 0]),
+])
+def test_modifications(f):
+    assert_equivalent(lambda flux: f(flux) and None)
+
+
+@pytest.mark.parametrize('f', [
+    lambda flux: list(flux.columns('a')),
+    lambda flux: list(flux.columns('a', 'c')),
+    lambda flux: list(flux.columns()),
+    lambda flux: list(flux['b']),
+    lambda flux: list(flux.values(2, -1)),
+    lambda flux: list(flux.dicts()),
+    lambda flux: [row.values for row in reversed(flux)],
+    lambda flux: [list(row.values) for row in flux.sorted('c', reverse=True)],
+    lambda flux: list(flux.unique('b')),
+    lambda flux: {k: v.a for k, v in flux.map_rows('b').items()},
+    lambda flux: list(flux.aggregate(by='b', n=('*', 'count'), t=('c', 'sum')).values()),
+    lambda flux: list(flux.copy(deep=True).values()),
+    lambda flux: (flux.num_rows, flux.num_cols, flux.header_names()),
+])
+def test_reads(f):
+    assert_equivalent(f)
+
+
+def test_row_modifications():
+    def modify(flux):
+        for row in flux:
+            row.a = row.a * 10
+            row['b'] = row.b.upper()
+            row.values[2:] = [0]
+
+    assert_equivalent(modify)
+
+
+def test_iteration_includes_appended_rows():
+    def append_while_iterating(flux):
+        seen = []
+        for row in flux:
+            seen.append(row.a)
+            if flux.num_rows < 8:
+                flux.append_rows([[row.a * 10, 'n', 0.0]])
+
+        return seen
+
+    assert_equivalent(append_while_iterating)
+
+
+def test_iteration_stops_at_deleted_rows():
+    def delete_while_iterating(flux):
+        seen = []
+        for row in flux:
+            seen.append(row.a)
+            if len(seen) == 1:
+                flux.shorten_to(2)
+
+        return seen
+
+    assert_equivalent(delete_while_iterating)
+
+
+def test_single_column_includes_appended_rows():
+    def append_while_reading(flux):
+        seen = []
+        for a in flux.columns('a'):
+            seen.append(a)
+            if flux.num_rows < 8:
+                flux.append_rows([[a * 10, 'n', 0.0]])
+
+        return seen
+
+    assert_equivalent(append_while_reading)
+
+
+def test_multiple_columns_are_read_when_called():
+    def append_after_call(flux):
+        columns = flux.columns('a', 'b')
+        flux.append_rows([[4, 'w', 0.0]])
+
+        return list(columns)
+
+    assert_equivalent(append_after_call)
+
+
+def test_iterator_created_before_append():
+    def append_after_iter(flux):
+        rows = iter(flux)
+        flux.append_rows([[4, 'w', 0.0]])
+
+        return [row.a for row in rows]
+
+    assert_equivalent(append_after_iter)
+
+
+def test_jagged_rows_are_rejected():
+    with pytest.raises(IndexError):
+        flux_cls([['a', 'b'], [1, 2], [3]], storage='columns')
+
+    flux = flux_cls([['a', 'b'], [1, 2]], storage='columns')
+    with pytest.raises(IndexError):
+        flux.append_rows([[3]])
+
+
+def test_empty_flux():
+    flux = flux_cls([['a', 'b']], storage='columns')
+    assert list(flux) == []
+    assert list(flux.columns('a')) == []
+
+    flux.append_rows([[1, 2]])
+    assert list(flux.values()) == [['a', 'b'], [1, 2]]
+
+
+def test_csv_round_trip(tmp_path):
+    flux_r, flux_c = fluxes()
+    path_r = str(tmp_path / 'rows.csv')
+    path_c = str(tmp_path / 'columns.csv')
+
+    flux_r.to_csv(path_r)
+    flux_c.to_csv(path_c)
+
+    with open(path_r) as f_r, open(path_c) as f_c:
+        assert f_c.read() == f_r.read()
+
+    flux = flux_cls.from_csv(path_c, dtypes='infer')
+    assert list(flux.values()) == list(flux_r.values())
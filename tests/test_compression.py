@@ -0,0 +1,89 @@
+import gzip
+import zipfile
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util import read_file
+from vengeance.util import write_file
+from vengeance.util.filesystem import file_compression
+from vengeance.util.filesystem import parse_file_extension
+
+
+m = [['a', 'b'], ['1', 'é'], ['2', 'z,"q"']]
+
+compressions = ['.gz', '.gzip', '.bz2', '.bz', '.xz', '.lzma', '.zip']
+
+
+@pytest.mark.parametrize('compression', compressions)
+@pytest.mark.parametrize('filetype', ['.csv', '.json', '.jsonl', '.flux'])
+def test_round_trip(tmp_path, filetype, compression):
+    path = str(tmp_path / ('file' + filetype + compression))
+    flux_cls(m).to_file(path)
+
+    assert list(flux_cls.from_file(path).values()) == m
+
+
+@pytest.mark.parametrize('compression', compressions)
+def test_chunked_reads(tmp_path, compression):
+    path = str(tmp_path / ('file.csv' + compression))
+    flux_cls(m).to_file(path)
+
+    fluxes = list(flux_cls.iter_csv(path, chunksize=1))
+    assert [row.b for flux in fluxes for row in flux] == ['é', 'z,"q"']
+
+    flux = flux_cls.from_csv(path, usecols='b', where=lambda row: row.a == '2')
+    assert list(flux.values()) == [['b'], ['z,"q"']]
+
+
+@pytest.mark.parametrize('compression', compressions)
+def test_text_round_trip(tmp_path, compression):
+    path = str(tmp_path / ('file.txt' + compression))
+    write_file(path, 'line 1\nline 2\n', encoding='utf-8')
+
+    assert read_file(path, encoding='utf-8') == 'line 1\nline 2\n'
+
+
+def test_is_compressed(tmp_path):
+    path = str(tmp_path / 'file.csv.gz')
+    write_file(path, m, compresslevel=1)
+
+    with gzip.open(path, 'rt', newline='') as f:
+        assert f.read().splitlines()[0] == 'a,b'
+
+
+def test_append(tmp_path):
+    path = str(tmp_path / 'file.csv.gz')
+    write_file(path, m)
+    write_file(path, m[1:], mode='a')
+
+    assert read_file(path) == m + m[1:]
+
+    path = str(tmp_path / 'file.csv.zip')
+    write_file(path, m)
+    with pytest.raises(ValueError):
+        write_file(path, m[1:], mode='a')
+
+
+def test_zip_with_several_members(tmp_path):
+    path = str(tmp_path / 'file.csv.zip')
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('a.csv', 'a\n1\n')
+        zf.writestr('b.csv', 'b\n2\n')
+
+    with pytest.raises(ValueError):
+        read_file(path)
+
+
+def test_extensions():
+    assert file_compression('file.csv.GZ') == 'gzip'
+    assert file_compression('file.json.xz') == 'lzma'
+    assert file_compression('file.csv') is None
+
+    assert parse_file_extension('file.csv.gz', ignore_compression=True) == '.csv'
+    assert parse_file_extension('file.csv.gz') == '.gz'
+
+
+def test_fluxb_cannot_be_compressed(tmp_path):
+    with pytest.raises(ValueError):
+        flux_cls(m).to_fluxb(str(tmp_path / 'file.fluxb.gz'))
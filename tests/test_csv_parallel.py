@@ -0,0 +1,81 @@
+import os
+import random
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util import filesystem
+from vengeance.util import read_file
+
+
+read_csv_parallel = getattr(filesystem, '__read_csv_parallel')
+
+
+@pytest.fixture(autouse=True)
+def small_ranges(monkeypatch):
+    """ split even small files into several ranges, on any number of cpus """
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(filesystem, 'csv_parallel_range_size', 256)
+
+
+def random_values(seed, num_rows=500):
+    random.seed(seed)
+    values = ['a', '', 'b c', 'a,b', 'say "hi"', 'line\nbreak', '\r\n', 'é', '"', ',', '1.5']
+
+    return [['a', 'b', 'c']] + [[random.choice(values) for _ in range(3)] for _ in range(num_rows)]
+
+
+def write_csv(tmp_path, m, **kwargs):
+    path = str(tmp_path / 'file.csv')
+    flux_cls(m).to_csv(path, **kwargs)
+
+    return path
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('workers', [2, 4])
+def test_parallel_matches_serial(tmp_path, seed, workers):
+    m    = random_values(seed)
+    path = write_csv(tmp_path, m)
+
+    assert read_csv_parallel(path, None, workers, {}) == m
+    assert read_file(path, workers=workers) == m
+    assert list(flux_cls.from_csv(path, workers=workers).values()) == list(flux_cls.from_csv(path).values())
+
+
+def test_parallel_exclude_header_row(tmp_path):
+    m    = random_values(0)
+    path = write_csv(tmp_path, m)
+
+    assert read_file(path, workers=2, exclude_header_row=True) == m[1:]
+
+
+def test_parallel_jagged_rows_and_separator(tmp_path):
+    m = random_values(0)
+    m[100] = ['x']
+    m[200] = ['contains \x00 separator', 'y', 'z']
+    m[300] = []
+    path = write_csv(tmp_path, m)
+
+    assert read_file(path, workers=2) == read_file(path)
+
+
+def test_parallel_unbalanced_quotes(tmp_path):
+    """ a quote character inside an unquoted field, ranges must fall back to serial parsing """
+    path = str(tmp_path / 'file.csv')
+    with open(path, 'w', newline='') as f:
+        f.write('a,b\n')
+        for i in range(300):
+            f.write('{},x"y{}\n'.format(i, i))
+
+    assert read_file(path, workers=2) == read_file(path)
+
+
+def test_small_files_are_read_serially(tmp_path, monkeypatch):
+    path = write_csv(tmp_path, random_values(0, num_rows=3))
+    assert read_csv_parallel(path, None, 4, {}) is None
+
+    path = write_csv(tmp_path, random_values(0))
+    monkeypatch.setattr(os, 'cpu_count', lambda: 1)
+    assert read_csv_parallel(path, None, 4, {}) is None
+    assert read_file(path, workers=4) == read_file(path)
@@ -0,0 +1,95 @@
+from datetime import date
+from datetime import datetime
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util.dtypes import convert_rows
+from vengeance.util.dtypes import infer_dtype
+
+
+@pytest.mark.parametrize('values, dtype', [
+    (['1', '-2', '', '3'],                    int),
+    (['1.5', '2', '1e3'],                     float),
+    (['True', 'false'],                       bool),
+    (['2001-01-02', '2001-12-31'],            date),
+    (['2001-01-02 10:00:00', '2001-01-02'],   datetime),
+    (['01234', '5'],                          str),
+    (['1', 'a'],                              str),
+    (['', ''],                                str),
+])
+def test_infer_dtype(values, dtype):
+    assert infer_dtype(values) is dtype
+
+
+def write_csv(tmp_path, m):
+    path = str(tmp_path / 'file.csv')
+    flux_cls(m).to_csv(path)
+
+    return path
+
+
+def test_from_csv_infer(tmp_path):
+    path = write_csv(tmp_path, [['i', 'f', 'b', 'd', 's', 'z'],
+                                [1,   1.5, True,  '2001-01-02', 'a', '007'],
+                                ['',  2,   False, '2001-01-03', 'b', '008']])
+
+    flux = flux_cls.from_csv(path, dtypes='infer')
+    assert list(flux.values()) == [['i',  'f', 'b',   'd',              's', 'z'],
+                                   [1,    1.5, True,  date(2001, 1, 2), 'a', '007'],
+                                   [None, 2.0, False, date(2001, 1, 3), 'b', '008']]
+
+
+def test_from_csv_dtypes_dict(tmp_path):
+    path = write_csv(tmp_path, [['a', 'b', 'c'], ['1', '2', 'x'], ['3', '', 'y']])
+
+    flux = flux_cls.from_csv(path, dtypes={'a': float, -2: int, 'c': str.upper})
+    assert list(flux.values()) == [['a', 'b', 'c'], [1.0, 2, 'X'], [3.0, None, 'Y']]
+
+
+def test_invalid_values(tmp_path):
+    path = write_csv(tmp_path, [['a'], ['1'], ['x'], ['3']])
+
+    flux = flux_cls.from_csv(path, dtypes={'a': int})
+    assert list(flux.values()) == [['a'], [1], ['x'], [3]]
+
+    with pytest.raises(ValueError, match=r"row 2, column 'a'"):
+        flux_cls.from_csv(path, dtypes={'a': int}, strict=True)
+
+
+def test_invalid_dtypes(tmp_path):
+    path = write_csv(tmp_path, [['a'], ['1']])
+
+    with pytest.raises(ValueError):
+        flux_cls.from_csv(path, dtypes='guess')
+    with pytest.raises(TypeError):
+        flux_cls.from_csv(path, dtypes={'a': 'int'})
+    with pytest.raises(ValueError):
+        flux_cls.from_csv(path, dtypes={'b': int})
+
+
+@pytest.mark.parametrize('i_invalid', [3, 5, 12])
+def test_iter_csv_strict_row_numbers(tmp_path, i_invalid):
+    m = [['a']] + [[str(i)] for i in range(1, 13)]
+    m[i_invalid] = ['x']
+    path = write_csv(tmp_path, m)
+
+    with pytest.raises(ValueError, match=r"row {}, column 'a'".format(i_invalid)):
+        list(flux_cls.iter_csv(path, chunksize=4, dtypes={'a': int}, strict=True))
+
+
+def test_iter_csv_dtypes(tmp_path):
+    m    = [['a', 'b']] + [[str(i), 'x'] for i in range(10)]
+    path = write_csv(tmp_path, m)
+
+    fluxes = list(flux_cls.iter_csv(path, chunksize=4, dtypes='infer'))
+    assert [flux.num_rows for flux in fluxes] == [4, 4, 2]
+    assert [row.a for flux in fluxes for row in flux] == list(range(10))
+
+
+def test_convert_rows_jagged():
+    rows = convert_rows([['1', '2'], ['3']], [int, int], ['a', 'b'])
+    assert rows == [[1, 2], [3]]
+
+    with pytest.raises(ValueError, match=r"row 11, column 'b'"):
+        convert_rows([['1', '2'], ['3', 'x']], [int, int], ['a', 'b'], strict=True, r_1=10)
@@ -0,0 +1,125 @@
+from datetime import date
+from datetime import datetime
+
+import pytest
+
+from vengeance.excel_com.classes.lev_cls import lev_cls
+from vengeance.excel_com.excel_constants import *
+from vengeance.excel_com.fake_excel import benchmark_lev_cls
+from vengeance.excel_com.fake_excel import com_error
+from vengeance.excel_com.fake_excel import count_com_calls
+from vengeance.excel_com.fake_excel import excel_na_error
+from vengeance.excel_com.fake_excel import fake_excel_application
+
+
+@pytest.fixture
+def ws():
+    excel_app = fake_excel_application()
+    return excel_app.Workbooks.Add().Sheets['Sheet1']
+
+
+def test_value(ws):
+    ws.Range('B2:C3').Value = [[1, 'x'], [date(2001, 2, 3), True]]
+
+    assert ws.Range('B2').Value == 1.0
+    assert ws.Range('B2:C3').Value == ((1.0, 'x'), (datetime(2001, 2, 3), True))
+    assert ws.Range('A1:B2').Value == ((None, None), (None, 1.0))
+    assert ws.UsedRange.Address == '$B$2:$C$3'
+
+    # a single value fills the range, a single row is repeated, missing cells are #N/A
+    ws.Range('E1:F2').Value = 'v'
+    ws.Range('E3:F4').Value = [1, 2]
+    ws.Range('E5:F7').Value = [[1], [2, 3]]
+    assert ws.Range('E1:F7').Value == (('v', 'v'),
+                                       ('v', 'v'),
+                                       (1.0, 2.0),
+                                       (1.0, 2.0),
+                                       (1.0, excel_na_error),
+                                       (2.0, 3.0),
+                                       (excel_na_error, excel_na_error))
+
+    ws.Range('B2').Value = ''
+    assert ws.Range('B2').Value is None
+
+    with pytest.raises(TypeError):
+        ws.Range('A1').Value = object()
+
+
+def test_range_navigation(ws):
+    excel_range = ws.Range('B2', 'D5')
+
+    assert excel_range.Address == '$B$2:$D$5'
+    assert (excel_range.Row, excel_range.Column) == (2, 2)
+    assert (excel_range.Rows.Count, excel_range.Columns.Count, excel_range.Count) == (4, 3, 12)
+    assert excel_range.Resize(1, 1).Address == '$B$2'
+    assert excel_range.Offset(1, 2).Address == '$D$3:$F$6'
+    assert excel_range(2, 3).Address == '$D$3'
+    assert [c.Address for c in ws.Range('A1:B1')] == ['$A$1', '$B$1']
+
+    with pytest.raises(com_error):
+        ws.Range('not an address')
+
+
+def test_find(ws):
+    ws.Range('A1:C3').Value = [['ab', None, 'AB'],
+                               [None, 'b',  None],
+                               ['ab', None, 1]]
+    search = ws.Range('A1:C3')
+
+    assert search.Find('ab').Address == '$A$1'
+    assert search.Find('ab', After=ws.Range('A1')).Address == '$C$1'
+    assert search.Find('ab', SearchOrder=xlByColumns, After=ws.Range('A1')).Address == '$A$3'
+    assert search.Find('ab', SearchDirection=xlPrevious).Address == '$A$3'
+    assert search.Find('AB', MatchCase=True, After=ws.Range('C1')).Address == '$C$1'
+    assert search.Find('b', LookAt=xlWhole).Address == '$B$2'
+    assert search.Find('a?', LookAt=xlWhole).Address == '$A$1'
+    assert search.Find('1', LookAt=xlWhole).Address == '$C$3'
+    assert search.Find('z') is None
+
+
+def test_special_cells(ws):
+    ws.Range('A1:B2').Value = [['x', None], [None, 1]]
+    ws.set_error('A3')
+
+    assert ws.Cells.SpecialCells(xlCellTypeLastCell).Address == '$B$3'
+    assert ws.Cells.SpecialCells(xlCellTypeConstants).Address == '$A$1,$B$2'
+    assert ws.Cells.SpecialCells(xlCellTypeFormulas, xlErrors).Address == '$A$3'
+    assert ws.Range('A1:B3').SpecialCells(xlCellTypeBlanks).Address == '$B$1,$A$2,$B$3'
+
+    with pytest.raises(com_error):
+        ws.Range('C1:D5').SpecialCells(xlCellTypeConstants)
+
+    ws.Range('A1:B3').ClearContents()
+    assert ws.rows == {}
+
+
+def test_count_com_calls(ws):
+    excel_app = ws.Application
+
+    with count_com_calls(excel_app) as com_calls:
+        ws.Range('A1').Value = 1
+        ws.Range('A1').Value
+
+    assert com_calls == {'_Worksheet.Range': 2,
+                         'Range.Value=':     1,
+                         'Range.Value':      1}
+
+    # uncounted after the block
+    ws.Range('A1').Value
+    assert sum(com_calls.values()) == 4
+
+
+def test_lev_cls_round_trip(ws):
+    lev = lev_cls(ws, header_r=1)
+    lev['*f *h'] = [['a', 'b'], [1, 'x'], [2, None]]
+
+    lev = lev_cls(ws, header_r=1)
+    assert list(lev.values()) == [['a', 'b'], [1.0, 'x'], [2.0, None]]
+    assert [row.b for row in lev] == ['x', None]
+    assert (lev.first_c, lev.last_c, lev.first_r, lev.last_r) == ('A', 'B', 2, 3)
+
+
+def test_benchmark_lev_cls():
+    results = benchmark_lev_cls(num_rows=50, num_cols=3, print_results=False)
+
+    assert all(round_trips > 0 for _, round_trips, _ in results)
@@ -0,0 +1,52 @@
+import pytest
+
+from vengeance import flux_cls
+
+
+m = [['a', 'b'],
+     [1,   'x'],
+     [2,   'y'],
+     [3,   'z']]
+
+
+@pytest.fixture(params=['rows', 'columns'])
+def flux(request):
+    return flux_cls([[*row] for row in m], storage=request.param)
+
+
+def test_iteration_excludes_header_row(flux):
+    assert [row.values for row in flux] == m[1:]
+    assert [row.a for row in reversed(flux)] == [3, 2, 1]
+
+
+@pytest.mark.parametrize('r_1, r_2', [(0, None), (1, None), (1, 3), (2, -1), (-2, None), (0, 100)])
+def test_values_ranges(flux, r_1, r_2):
+    assert list(flux.values(r_1, r_2)) == m[r_1:r_2]
+
+
+def test_values_are_copies(flux):
+    values = list(flux.values(1))
+    values[0][0] = 100
+
+    assert flux.matrix[1].a == 1
+
+
+def test_reverse_in_place(flux):
+    assert flux.reverse() is flux
+    assert list(flux.values()) == [m[0], m[3], m[2], m[1]]
+    assert flux.matrix[0].values == m[0]
+
+
+def test_reversed_is_a_copy(flux):
+    flux_b = flux.reversed()
+
+    assert list(flux_b.values()) == [m[0], m[3], m[2], m[1]]
+    assert list(flux.values()) == m
+
+
+def test_filter_and_map_rows(flux):
+    assert [row.a for row in flux.filtered(lambda row: row.a > 1)] == [2, 3]
+    assert {k: row.a for k, row in flux.map_rows('b').items()} == {'x': 1, 'y': 2, 'z': 3}
+
+    flux.filter(lambda row: row.b != 'y')
+    assert list(flux.values()) == [m[0], m[1], m[3]]
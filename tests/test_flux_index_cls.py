@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from vengeance import flux_cls
+
+
+def random_flux(seed, storage):
+    random.seed(seed)
+    m = [['a', 'b', 'x']] + [[random.choice([1, 2, 3, None]), random.choice('pq'), i] for i in range(40)]
+
+    return flux_cls(m, storage=storage)
+
+
+def scanned(flux, name, value):
+    return [row.x for row in flux if row[name] == value]
+
+
+modifications = [lambda flux: flux.append_rows([[2, 'p', 100], [None, 'q', 101]]),
+                 lambda flux: flux.insert_rows(1, [[3, 'q', 102]]),
+                 lambda flux: flux.sort('x', reverse=True),
+                 lambda flux: flux.filter(lambda row: row.x % 3 != 0),
+                 lambda flux: flux.reverse(),
+                 lambda flux: flux.shorten_to(10),
+                 lambda flux: flux.reset_matrix([['a', 'b', 'x'], [1, 'p', 200], [2, 'q', 201]]),
+                 lambda flux: flux.matrix.append(flux.matrix[1])]
+
+
+@pytest.mark.parametrize('kind', ['hash', 'sorted'])
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+@pytest.mark.parametrize('seed', range(5))
+def test_lookup_matches_scan(kind, storage, seed):
+    flux = random_flux(seed, storage)
+    flux.create_index('a', kind=kind)
+
+    for modify in [lambda flux: None] + random.sample(modifications, 4):
+        modify(flux)
+
+        for value in (1, 2, 3, None, 'z'):
+            assert [row.x for row in flux.lookup('a', value)] == scanned(flux, 'a', value)
+
+
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+def test_between(storage):
+    flux = random_flux(0, storage)
+    expected = sorted(([row.a, row.x] for row in flux if row.a is not None and 2 <= row.a <= 3),
+                      key=lambda v: v[0])
+
+    assert [[row.a, row.x] for row in flux.between('a', 2, 3)] == \
+           [[row.a, row.x] for row in flux if row.a is not None and 2 <= row.a <= 3]
+
+    flux.create_index('a', kind='sorted')
+    assert [[row.a, row.x] for row in flux.between('a', 2, 3)] == expected
+
+    flux.create_index('a', kind='hash')
+    assert [row.x for row in flux.between('a', 2, 3)] == [row.x for row in flux if row.a in (2, 3)]
+
+
+def test_where():
+    flux = random_flux(1, 'rows')
+    expected = [row.x for row in flux if row.a == 2 and row.b == 'q']
+
+    assert [row.x for row in flux.where(a=2, b='q')] == expected
+
+    flux.create_index('a')
+    flux.create_index('b', kind='sorted')
+    assert [row.x for row in flux.where(a=2, b='q')] == expected
+
+    with pytest.raises(ValueError):
+        flux.where()
+
+
+def test_indexes_follow_columns():
+    flux = random_flux(2, 'rows')
+    flux.create_index('b')
+    flux.create_index(0)
+
+    assert set(flux._indexes) == {'a', 'b'}
+
+    flux.delete_columns('b')
+    assert [row.x for row in flux.lookup('a', 1)] == scanned(flux, 'a', 1)
+    assert set(flux._indexes) == {'a'}
+
+    flux.drop_index()
+    assert flux._indexes == {}
+
+
+def test_invalid_index():
+    flux = random_flux(3, 'rows')
+
+    with pytest.raises(ValueError):
+        flux.create_index('a', kind='btree')
+
+    flux = flux_cls([['a'], [1], ['b']])
+    with pytest.raises(TypeError):
+        flux.create_index('a', kind='sorted')
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from vengeance import flux_cls
+
+
+def random_matrix(seed, num_rows=60):
+    random.seed(seed)
+    return [['a', 'b', 'x']] + [[random.randint(0, 5), random.choice('pqr'), random.random()]
+                                for _ in range(num_rows)]
+
+
+def double_x(row):
+    row.x = row.x * 2
+
+
+operations = [('filter',     lambda q: q.filter(lambda row: row.a > 1),
+                             lambda f: f.filter(lambda row: row.a > 1)),
+              ('filter_b',   lambda q: q.filter(lambda row, b: row.b != b, 'q'),
+                             lambda f: f.filter(lambda row, b: row.b != b, 'q')),
+              ('sort',       lambda q: q.sort('a'),
+                             lambda f: f.sort('a')),
+              ('sort_multi', lambda q: q.sort('b', 'x', reverse=[True, False]),
+                             lambda f: f.sort('b', 'x', reverse=[True, False])),
+              ('unique',     lambda q: q.unique('a', 'b'),
+                             lambda f: f.filter_by_unique('a', 'b')),
+              ('map',        lambda q: q.map(double_x),
+                             lambda f: [double_x(row) for row in f]),
+              ('shorten_to', lambda q: q.shorten_to(20),
+                             lambda f: f.shorten_to(20))]
+
+
+@pytest.mark.parametrize('seed', range(40))
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+def test_lazy_matches_eager(seed, storage):
+    m     = random_matrix(seed)
+    flux  = flux_cls([[*row] for row in m], storage=storage)
+    query = flux.lazy()
+    eager = flux_cls([[*row] for row in m])
+
+    for _ in range(random.randint(1, 6)):
+        _, lazy_op, eager_op = random.choice(operations)
+        lazy_op(query)
+        eager_op(eager)
+
+    assert list(query.collect().values()) == list(eager.values())
+    assert list(flux.values()) == m
+
+
+def test_plan_moves_filters_and_combines_sorts():
+    query = (flux_cls(random_matrix(0)).lazy()
+                                       .sort('a')
+                                       .sort('b', reverse=True)
+                                       .filter(lambda row: row.a > 1)
+                                       .unique('a'))
+
+    plan = query.plan()
+    assert [op.name for op in plan] == ['filter', 'sort', 'unique']
+    assert plan[1].args == (['b', 'a'], [True, False])
+
+
+def test_map_does_not_modify_original():
+    m    = random_matrix(1)
+    flux = flux_cls([[*row] for row in m])
+
+    flux_b = flux.lazy().map(double_x).collect()
+    assert list(flux.values()) == m
+    assert [row.x for row in flux_b] == [row[2] * 2 for row in m[1:]]
+
+
+def test_invalid_shorten_to():
+    with pytest.raises(ValueError):
+        flux_cls(random_matrix(0)).lazy().shorten_to(-1)
+
+
+def test_repr():
+    query = flux_cls(random_matrix(0)).lazy().filter(double_x).shorten_to(5)
+    assert repr(query).startswith('flux_query_cls: flux_cls.lazy().filter(')
+    assert repr(query).endswith('double_x).shorten_to(5)')
@@ -0,0 +1,98 @@
+import copy
+import pickle
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.classes.flux_row_cls import flux_row_cls
+
+
+def test_column_properties():
+    flux = flux_cls([['a', 'b'], [1, 2], [3, 4]])
+    row  = flux.matrix[1]
+
+    assert (row.a, row.b) == (1, 2)
+    assert (row['a'], row['b']) == (1, 2)
+
+    row.a    = 10
+    row['b'] = 20
+    assert row.values == [10, 20]
+
+
+def test_jagged_row_raises_attribute_error():
+    flux = flux_cls([['a', 'b'], [1, 2], [3]])
+    row  = flux.matrix[2]
+
+    assert row.a == 3
+    assert hasattr(row, 'a')
+    assert not hasattr(row, 'b')
+
+    with pytest.raises(AttributeError):
+        _ = row.b
+    with pytest.raises(AttributeError):
+        row.b = 4
+
+    assert row.values == [3]
+
+
+def test_invalid_name_raises_attribute_error():
+    row = flux_cls([['a', 'b'], [1, 2]]).matrix[1]
+
+    assert not hasattr(row, 'c')
+    with pytest.raises(AttributeError):
+        row.c = 1
+
+
+def test_row_class_follows_header_changes():
+    flux = flux_cls([['a', 'b'], [1, 2]])
+    flux.rename_columns({'a': 'c'})
+
+    row = flux.matrix[1]
+    assert row.c == 1
+    assert not hasattr(row, 'a')
+
+
+def test_rows_use_slots():
+    row = flux_cls([['a'], [1]]).matrix[1]
+    assert not hasattr(row, '__dict__')
+
+
+def test_pickle_row():
+    row = flux_cls([['a', 'b'], [1, 2]]).matrix[1]
+    row = pickle.loads(pickle.dumps(row))
+
+    assert (row.a, row.b) == (1, 2)
+
+
+def test_row_access():
+    row = flux_cls([['a', 'b', 'c'], [1, 2, 3]]).matrix[1]
+
+    assert row[0] == 1
+    assert row[-1] == 3
+    assert row[1:] == [2, 3]
+    assert row['c'] == 3
+
+    row[-1]  = 30
+    row[0:2] = [10, 20]
+    assert row.values == [10, 20, 30]
+
+
+def test_copy_row():
+    row = flux_cls([['a', 'b'], [1, [2]]]).matrix[1]
+
+    row_copy = copy.copy(row)
+    assert row_copy.values == row.values
+    assert row_copy.headers is row.headers
+
+    row_deep = copy.deepcopy(row)
+    row_deep.b.append(3)
+    assert row.b == [2]
+    assert row_deep.b == [2, 3]
+
+
+def test_pickle_row_of_default_class():
+    row = flux_row_cls({'a': 0, 'b': 1}, [1, 2])
+    row = pickle.loads(pickle.dumps(row))
+
+    assert type(row) is flux_row_cls
+    assert (row.a, row.b) == (1, 2)
@@ -0,0 +1,73 @@
+import pytest
+
+from vengeance import flux_cls
+
+
+def round_trip(m, tmp_path, **kwargs):
+    path = str(tmp_path / 'flux.fluxb')
+    flux_cls(m).to_file(path)
+
+    return list(flux_cls.from_file(path, **kwargs).values())
+
+
+@pytest.mark.parametrize('column', [
+    [2**70, None, 5],
+    [None, -2**64, 0],
+    [1, None, 2],
+    [1.5, None, float('inf')],
+    ['a', None, ''],
+    [True, None, False],
+    [None, None, None],
+    [1, 'a', None, 2.5],
+])
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_round_trip_with_nulls(column, use_mmap, tmp_path):
+    m = [['a']] + [[v] for v in column]
+    assert round_trip(m, tmp_path, use_mmap=use_mmap) == m
+
+
+def test_out_of_range_ints_keep_nulls(tmp_path):
+    m = [['a'], [2**70], [None], [5]]
+    assert round_trip(m, tmp_path) == m
+
+
+def test_round_trip_all_types(tmp_path):
+    m = [['i', 'f', 'b', 's', 'o', 'big'],
+         [1, 1.5, True,  'é', (1, 2), 2**63],
+         [2, 2.5, False, '',  None,   -1],
+         [3, 0.0, True,  'x', 'y',    None]]
+
+    for storage in ('rows', 'columns'):
+        assert round_trip(m, tmp_path, storage=storage) == m
+
+
+def test_empty_flux(tmp_path):
+    m = [['a', 'b']]
+    assert round_trip(m, tmp_path) == m
+
+
+def test_mapped_column_can_be_modified(tmp_path):
+    path = str(tmp_path / 'flux.fluxb')
+    flux_cls([['a', 'b'], [1, 'x'], [2, 'y']]).to_file(path)
+
+    flux = flux_cls.from_file(path)
+    for row in flux:
+        row.a = row.a * 10
+
+    assert list(flux.values()) == [['a', 'b'], [10, 'x'], [20, 'y']]
+
+    flux.to_file(path)
+    assert list(flux_cls.from_file(path).values()) == [['a', 'b'], [10, 'x'], [20, 'y']]
+
+
+def test_jagged_rows_are_rejected(tmp_path):
+    with pytest.raises(IndexError):
+        flux_cls([['a', 'b'], [1, 2], [3]]).to_file(str(tmp_path / 'flux.fluxb'))
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / 'flux.fluxb'
+    path.write_bytes(b'not a fluxb file')
+
+    with pytest.raises(ValueError):
+        flux_cls.from_file(str(path))
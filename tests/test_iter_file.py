@@ -0,0 +1,77 @@
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util import iter_file
+
+
+m = [['a', 'b', 'c']] + [[str(i), 'x{}'.format(i), '{}.5'.format(i)] for i in range(23)]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = str(tmp_path / 'file.csv')
+    flux_cls(m).to_csv(path)
+
+    return path
+
+
+def chunked_values(fluxes):
+    fluxes = list(fluxes)
+    values = list(fluxes[0].values())
+    for flux in fluxes[1:]:
+        values.extend(flux.values(1))
+
+    return fluxes, values
+
+
+@pytest.mark.parametrize('chunksize', [1, 5, 23, 100])
+def test_iter_csv_matches_from_csv(csv_path, chunksize):
+    fluxes, values = chunked_values(flux_cls.iter_csv(csv_path, chunksize=chunksize))
+
+    assert values == list(flux_cls.from_csv(csv_path).values())
+    assert [flux.num_rows for flux in fluxes[:-1]] == [chunksize] * (len(fluxes) - 1)
+    assert 0 < fluxes[-1].num_rows <= chunksize
+    assert all(flux.headers is fluxes[0].headers for flux in fluxes)
+
+    # rows of later chunks are bound to the shared headers
+    assert [row.b for row in fluxes[-1]] == [row[1] for row in m[-fluxes[-1].num_rows:]]
+
+
+@pytest.mark.parametrize('nrows', [1, 4, 12, 50])
+def test_iter_csv_nrows(csv_path, nrows):
+    _, values = chunked_values(flux_cls.iter_csv(csv_path, chunksize=5, nrows=nrows))
+    assert values == list(flux_cls.from_csv(csv_path, nrows=nrows).values())
+
+    assert list(flux_cls.iter_csv(csv_path, chunksize=5, nrows=0)) == []
+
+
+def test_iter_csv_exclude_header_row(csv_path):
+    _, values = chunked_values(flux_cls.iter_csv(csv_path, chunksize=5, exclude_header_row=True))
+    assert values == list(flux_cls.from_csv(csv_path, exclude_header_row=True).values())
+
+
+def test_iter_csv_dtypes(csv_path):
+    fluxes = list(flux_cls.iter_csv(csv_path, chunksize=5, dtypes={'a': int, 'c': float}))
+
+    assert [row.a for flux in fluxes for row in flux] == list(range(23))
+    assert [row.c for flux in fluxes for row in flux] == [i + 0.5 for i in range(23)]
+
+
+def test_iter_file_split(tmp_path):
+    path = str(tmp_path / 'file.json')
+    flux_cls(m).to_json(path)
+
+    fluxes, values = chunked_values(flux_cls.iter_file(path, chunksize=10))
+
+    assert values == list(flux_cls.from_file(path).values())
+    assert [flux.num_rows for flux in fluxes] == [10, 10, 3]
+
+
+def test_util_iter_file(csv_path):
+    chunks = list(iter_file(csv_path, chunksize=10))
+
+    assert [len(chunk) for chunk in chunks] == [11, 10, 3]
+    assert [row for chunk in chunks for row in chunk] == m
+
+    with pytest.raises(ValueError):
+        list(iter_file(csv_path, chunksize=0))
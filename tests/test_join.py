@@ -0,0 +1,172 @@
+import random
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util.iter import ColumnNameError
+
+
+hows = ('inner', 'left', 'right', 'outer', 'semi', 'anti')
+
+
+def normalized(flux):
+    return sorted(map(tuple, flux.values(1)), key=repr)
+
+
+def nested_loop_join(m_a, m_b, on, how):
+    """ reference join, other key columns are merged into self key columns """
+    i_a = [m_a[0].index(n) for n in on]
+    i_b = [m_b[0].index(n) for n in on]
+    c_b = [c for c in range(len(m_b[0])) if c not in i_b]
+
+    def key(row, indices):
+        return tuple(row[i] for i in indices)
+
+    m = []
+    for row_a in m_a[1:]:
+        matches = [row_b for row_b in m_b[1:] if key(row_a, i_a) == key(row_b, i_b)]
+
+        if how == 'semi' and matches:
+            m.append([*row_a])
+        elif how == 'anti' and not matches:
+            m.append([*row_a])
+        elif how in ('inner', 'left', 'right', 'outer'):
+            m.extend([*row_a, *[row_b[c] for c in c_b]] for row_b in matches)
+            if how in ('left', 'outer') and not matches:
+                m.append([*row_a, *[None] * len(c_b)])
+
+    if how in ('right', 'outer'):
+        keys_a = {key(row_a, i_a) for row_a in m_a[1:]}
+        for row_b in m_b[1:]:
+            if key(row_b, i_b) not in keys_a:
+                values_a = [None] * len(m_a[0])
+                for i, v in zip(i_a, key(row_b, i_b)):
+                    values_a[i] = v
+
+                m.append([*values_a, *[row_b[c] for c in c_b]])
+
+    return sorted(map(tuple, m), key=repr)
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('how', hows)
+@pytest.mark.parametrize('on', [('k',), ('k', 'g')])
+def test_join_matches_nested_loop(seed, how, on):
+    random.seed(seed)
+    m_a = [['k', 'g', 'x']] + [[random.choice([1, 2, 3, None]), random.choice('ab'), i]
+                               for i in range(random.randint(0, 12))]
+    m_b = [['g', 'y', 'k']] + [[random.choice('abc'), -i, random.choice([2, 3, 4, None])]
+                               for i in range(random.randint(0, 12))]
+
+    for storage in ('rows', 'columns'):
+        flux_a = flux_cls([[*row] for row in m_a], storage=storage)
+        flux_b = flux_cls([[*row] for row in m_b])
+
+        assert normalized(flux_a.join(flux_b, on=on, how=how)) == nested_loop_join(m_a, m_b, on, how)
+        assert list(flux_a.values()) == m_a
+
+
+def test_join_columns():
+    flux_a = flux_cls([['id', 'v', 'w'], [1, 'a', 0], [2, 'b', 0]])
+    flux_b = flux_cls([['id', 'v', 'z'], [2, 'B', 1], [3, 'C', 1]])
+
+    assert flux_a.join(flux_b, on='id').header_names() == ['id', 'v', 'w', 'v_other', 'z']
+    assert flux_a.join(flux_b, on='id', suffixes=('_l', '_r')).header_names() == ['id', 'v_l', 'w', 'v_r', 'z']
+    assert flux_a.join(flux_b, on='id', how='semi').header_names() == ['id', 'v', 'w']
+
+
+def test_join_on_other():
+    flux_a = flux_cls([['id', 'v'], [1, 'a'], [2, 'b']])
+    flux_b = flux_cls([['key', 'w'], [2, 'B'], [3, 'C']])
+
+    flux_c = flux_a.join(flux_b, on='id', on_other='key', how='outer')
+    assert list(flux_c.values()) == [['id', 'v',  'key', 'w'],
+                                     [1,    'a',  None,  None],
+                                     [2,    'b',  2,     'B'],
+                                     [None, None, 3,     'C']]
+
+
+def test_join_row_order():
+    flux_a = flux_cls([['k', 'x'], [2, 'a'], [1, 'b'], [2, 'c']])
+    flux_b = flux_cls([['k', 'y'], [2, 'A'], [3, 'B'], [2, 'C']])
+
+    assert list(flux_a.join(flux_b, on='k', how='left').values(1)) == [[2, 'a', 'A'], [2, 'a', 'C'],
+                                                                      [1, 'b', None],
+                                                                      [2, 'c', 'A'], [2, 'c', 'C']]
+    assert list(flux_a.join(flux_b, on='k', how='outer').values(1))[-1] == [3, None, 'B']
+
+
+def test_invalid_join():
+    flux_a = flux_cls([['k', 'x'], [1, 'a']])
+    flux_b = flux_cls([['k', 'y'], [1, 'b']])
+
+    with pytest.raises(ValueError):
+        flux_a.join(flux_b, on='k', how='cross')
+    with pytest.raises(ColumnNameError):
+        flux_a.join(flux_b, on='z')
+
+
+@pytest.mark.parametrize('how', hows)
+@pytest.mark.parametrize('keys_a, keys_b', [
+    ([None, 1, 2, None],     [1, None, 3]),
+    ([1, 'a', None, 2.5, 1], ['a', 2.5, None, 'b', 0]),
+    ([3, 1, 2],              [2, 2, 4]),
+])
+def test_merge_join_matches_hash_join(how, keys_a, keys_b):
+    flux_a = flux_cls([['k', 'x']] + [[k, i] for i, k in enumerate(keys_a)])
+    flux_b = flux_cls([['k', 'y']] + [[k, -i] for i, k in enumerate(keys_b)])
+    expected = normalized(flux_a.join(flux_b, on='k', how=how))
+
+    assert normalized(flux_a.merge_join(flux_b, on='k', how=how, assume_sorted=False)) == expected
+
+    flux_a.sort('k')
+    flux_b.sort('k')
+    assert normalized(flux_a.merge_join(flux_b, on='k', how=how)) == expected
+
+
+def test_merge_join_on_none_keys():
+    flux_a = flux_cls([['k', 'x'], [None, 1], [1, 2]])
+    flux_b = flux_cls([['k', 'y'], [1, 'a'], [None, 'b']])
+    flux_a.sort('k')
+    flux_b.sort('k')
+
+    flux_c = flux_a.merge_join(flux_b, on='k')
+    assert list(flux_c.values()) == [['k', 'x', 'y'],
+                                     [1,    2,   'a'],
+                                     [None, 1,   'b']]
+
+
+def test_merge_join_on_multiple_keys_with_none():
+    flux_a = flux_cls([['k1', 'k2', 'x'], [1, None, 'a'], [1, 2, 'b'], [None, 'z', 'c'], ['y', 1, 'd']])
+    flux_b = flux_cls([['k1', 'k2', 'y'], [1, 2, 'e'], [None, 'z', 'f'], [1, None, 'g'], [1, 3, 'h']])
+    expected = normalized(flux_a.join(flux_b, on=('k1', 'k2'), how='outer'))
+
+    flux_a.sort('k1', 'k2')
+    flux_b.sort('k1', 'k2')
+    assert normalized(flux_a.merge_join(flux_b, on=('k1', 'k2'), how='outer')) == expected
+
+
+def test_merge_join_requires_sorted_rows():
+    flux_a = flux_cls([['k', 'x'], [2, 1], [1, 2]])
+    flux_b = flux_cls([['k', 'y'], [1, 1], [2, 2]])
+
+    with pytest.raises(ValueError):
+        flux_a.merge_join(flux_b, on='k')
+
+    flux_a = flux_cls([['k', 'x'], [None, 1], [1, 2]])
+    flux_b = flux_cls([['k', 'y'], [1, 1], [None, 2]])
+    with pytest.raises(ValueError):
+        flux_a.merge_join(flux_b, on='k')
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_merge_sorted_with_none_and_mixed_keys(reverse):
+    keys   = [3, None, 'a', 1, 2.5, None, 'b', 0]
+    fluxes = [flux_cls([['k', 'i']] + [[k, i] for i, k in enumerate(keys)][j::3]) for j in range(3)]
+    for flux in fluxes:
+        flux.sort('k', reverse=reverse)
+
+    flux = flux_cls.merge_sorted(*fluxes, by='k', reverse=reverse)
+    expected = flux_cls([['k', 'i']] + [[k, i] for i, k in enumerate(keys)]).sorted('k', reverse=reverse)
+
+    assert [row.k for row in flux] == [row.k for row in expected]
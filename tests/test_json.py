@@ -0,0 +1,75 @@
+import json
+from datetime import date
+
+import pytest
+
+from vengeance import flux_cls
+
+
+m = [['a', 'b', 'c'],
+     [1,   'x', None],
+     [2,   'y', 2.5],
+     [3,   'z', [1, 2]]]
+
+
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+@pytest.mark.parametrize('orient', ['records', 'split', 'columns', 'values'])
+def test_to_json_round_trip(tmp_path, orient, storage):
+    path = str(tmp_path / 'file.json')
+    flux_cls([[*row] for row in m], storage=storage).to_json(path, orient=orient)
+
+    assert list(flux_cls.from_json(path).values()) == m
+
+
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+def test_to_json_orients(storage):
+    flux = flux_cls([[*row] for row in m], storage=storage)
+
+    assert json.loads(flux.to_json(orient='records')) == [{'a': 1, 'b': 'x', 'c': None},
+                                                         {'a': 2, 'b': 'y', 'c': 2.5},
+                                                         {'a': 3, 'b': 'z', 'c': [1, 2]}]
+    assert json.loads(flux.to_json(orient='split')) == {'columns': ['a', 'b', 'c'],
+                                                       'data':    [[1, 'x', None],
+                                                                   [2, 'y', 2.5],
+                                                                   [3, 'z', [1, 2]]]}
+    assert json.loads(flux.to_json(orient='columns')) == {'a': [1, 2, 3],
+                                                         'b': ['x', 'y', 'z'],
+                                                         'c': [None, 2.5, [1, 2]]}
+    assert json.loads(flux.to_json(orient='values')) == m
+
+    assert flux.to_json(orient='Split') == flux.to_json(orient='split')
+    assert '\n' not in flux.to_json(orient='split')
+
+
+@pytest.mark.parametrize('orient', ['split', 'columns', 'values'])
+def test_to_json_header_only(tmp_path, orient):
+    path = str(tmp_path / 'file.json')
+    flux_cls([['a', 'b']]).to_json(path, orient=orient)
+
+    flux = flux_cls.from_json(path)
+    assert flux.header_names() == ['a', 'b']
+    assert flux.num_rows == 0
+
+
+def test_to_json_dates():
+    flux = flux_cls([['a'], [date(2001, 2, 3)]])
+    assert json.loads(flux.to_json(orient='values')) == [['a'], ['2001-02-03']]
+
+
+def test_invalid_orient():
+    with pytest.raises(ValueError):
+        flux_cls(m).to_json(orient='index')
+
+
+def test_from_json_invalid_objects(tmp_path):
+    path = str(tmp_path / 'file.json')
+
+    with open(path, 'w') as f:
+        json.dump({'a': [1, 2], 'b': [3]}, f)
+    with pytest.raises(IndexError):
+        flux_cls.from_json(path)
+
+    with open(path, 'w') as f:
+        json.dump({'a': 1, 'b': 2}, f)
+    with pytest.raises(ValueError):
+        flux_cls.from_json(path)
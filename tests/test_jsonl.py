@@ -0,0 +1,100 @@
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util import read_file
+from vengeance.util.iter import ColumnNameError
+
+
+m = [['a', 'b', 'c']] + [[i, 'x\u0000{}'.format(i), {'n': [i, None]}] for i in range(25)]
+
+
+def write_lines(tmp_path, lines, name='file.jsonl'):
+    path = str(tmp_path / name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return path
+
+
+@pytest.mark.parametrize('name', ['file.jsonl', 'file.ndjson', 'file.jsonl.gz'])
+def test_jsonl_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    flux_cls(m).to_jsonl(path)
+
+    assert list(flux_cls.from_jsonl(path).values()) == m
+    assert list(flux_cls.from_file(path).values()) == m
+
+
+def test_one_record_per_line(tmp_path):
+    path = str(tmp_path / 'file.jsonl')
+    flux_cls(m).to_jsonl(path)
+
+    with open(path, encoding='utf-8') as f:
+        assert len(f.read().splitlines()) == len(m) - 1
+
+
+def test_missing_keys_and_blank_lines(tmp_path):
+    path = write_lines(tmp_path, ['{"a": 1}',
+                                  '',
+                                  '   ',
+                                  '{"b": 2, "a": 3}',
+                                  '{"c": null}'])
+
+    assert list(flux_cls.from_jsonl(path).values()) == [['a', 'b', 'c'],
+                                                        [1,   None, None],
+                                                        [3,   2,    None],
+                                                        [None, None, None]]
+
+
+@pytest.mark.parametrize('lines, line_number', [(['{"a": 1}', '1,2'],                   2),
+                                                (['[3', '4]'],                          1),
+                                                (['{"a": 1}', '', '{"a": 2} {"a": 3}'], 3),
+                                                (['{"a": 1}', '{"a": '],                2),
+                                                (['{"a": 1}', '1],["\\u0000",2'],       2)])
+@pytest.mark.parametrize('chunksize', [1, 2, 100])
+def test_invalid_lines(tmp_path, lines, line_number, chunksize):
+    path = write_lines(tmp_path, lines)
+
+    with pytest.raises(ValueError, match='invalid json on line {}:'.format(line_number)):
+        list(flux_cls.iter_jsonl(path, chunksize=chunksize))
+
+
+def test_records_must_be_objects(tmp_path):
+    path = write_lines(tmp_path, ['{"a": 1}', '[1, 2]'])
+
+    with pytest.raises(TypeError):
+        flux_cls.from_jsonl(path)
+
+
+@pytest.mark.parametrize('chunksize', [1, 4, 25, 100])
+def test_iter_jsonl(tmp_path, chunksize):
+    lines = []
+    for i in range(25):
+        lines.append('{{"a": {}}}'.format(i))
+        if i % 3 == 0:
+            lines.append('')
+    path = write_lines(tmp_path, lines)
+
+    fluxes = list(flux_cls.iter_jsonl(path, chunksize=chunksize))
+
+    assert [flux.num_rows for flux in fluxes[:-1]] == [chunksize] * (len(fluxes) - 1)
+    assert [row.a for flux in fluxes for row in flux] == list(range(25))
+    assert all(flux.headers is fluxes[0].headers for flux in fluxes)
+
+
+@pytest.mark.parametrize('nrows', [0, 1, 7, 100])
+def test_nrows(tmp_path, nrows):
+    path = write_lines(tmp_path, ['', '{"a": 1}', '', '{"a": 2}', '{"a": 3}'] * 5)
+
+    records = read_file(path, nrows=nrows)
+    assert records == [{'a': i % 3 + 1} for i in range(min(nrows, 15))]
+
+    fluxes = list(flux_cls.iter_jsonl(path, chunksize=2, nrows=nrows))
+    assert sum(flux.num_rows for flux in fluxes) == min(nrows, 15)
+
+
+def test_iter_jsonl_new_keys_in_later_chunk(tmp_path):
+    path = write_lines(tmp_path, ['{"a": 1}', '{"a": 2}', '{"a": 3, "b": 4}'])
+
+    with pytest.raises(ColumnNameError):
+        list(flux_cls.iter_jsonl(path, chunksize=2))
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+from vengeance.excel_com.classes.lev_cls import lev_cls
+from vengeance.excel_com.excel_address import address_bounds
+from vengeance.excel_com.fake_excel import count_com_calls
+from vengeance.excel_com.fake_excel import fake_excel_application
+
+
+lev_kwargs = [{},
+              {'header_r': 1},
+              {'header_r': 3},
+              {'meta_r': 1, 'header_r': 2},
+              {'header_r': 1, 'first_c': 'B', 'last_c': 'D'},
+              {'header_r': 1, 'first_r': 4},
+              {'header_r': 1, 'last_r': 6}]
+
+
+def boundaries(lev):
+    return (lev.first_c, lev.last_c, lev.first_r, lev.last_r, lev.is_empty(),
+            dict(lev.headers), dict(lev.m_headers))
+
+
+def random_worksheet(rand):
+    excel_app = fake_excel_application()
+    ws        = excel_app.Workbooks.Add().Sheets['Sheet1']
+
+    for _ in range(rand.randint(0, 12)):
+        r = rand.randint(1, 9)
+        c = rand.randint(1, 6)
+        ws.set_value(r, c, rand.choice(['a', 'b', 1, 2.5, True]))
+
+    if rand.random() < 0.2:
+        ws.set_error('{}{}'.format(rand.choice('ABCD'), rand.randint(1, 3)))
+
+    return ws
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_bulk_boundaries_match_find(seed, monkeypatch):
+    rand = random.Random(seed)
+
+    for _ in range(10):
+        ws     = random_worksheet(rand)
+        kwargs = rand.choice(lev_kwargs)
+
+        lev_bulk = lev_cls(ws, **kwargs)
+
+        monkeypatch.setattr(lev_cls, 'bulk_boundary_max_cells', 0)
+        lev_find = lev_cls(ws, **kwargs)
+        monkeypatch.undo()
+
+        assert boundaries(lev_bulk) == boundaries(lev_find), (ws.rows, kwargs)
+
+
+def test_bulk_boundaries_round_trips():
+    excel_app = fake_excel_application()
+    ws        = excel_app.Workbooks.Add().Sheets['Sheet1']
+
+    round_trips = []
+    for num_rows in (10, 1_000):
+        ws.Range('A1:C{}'.format(num_rows)).Value = [['a', 'b', 'c']] + [[1, 2, 3]] * (num_rows - 1)
+
+        with count_com_calls(excel_app) as com_calls:
+            lev = lev_cls(ws, header_r=1)
+
+        round_trips.append(sum(com_calls.values()))
+        assert (lev.first_c, lev.last_c, lev.first_r, lev.last_r) == ('A', 'C', 2, num_rows)
+
+    assert round_trips[0] == round_trips[1]
+
+
+def test_address_bounds():
+    assert address_bounds('$A$1:$C$10') == (1, 1, 10, 3)
+    assert address_bounds('b2') == (2, 2, 2, 2)
+    assert address_bounds(' $AA$3:AB4 ') == (3, 27, 4, 28)
+
+    with pytest.raises(ValueError):
+        address_bounds('A:C')
+
+
+def random_step(rand):
+    if rand.random() < 0.15:
+        reference = rand.choice(['*f *f:*l *l', 'A3:B4', '*f *h:*l *h'])
+        return 'clear', reference, None
+
+    reference = rand.choice(['*f *a', '*f *a', '*f *h', 'B*a', '*f *f', 'C5', '*f 4', '*a *f', '*a *h'])
+    m = [[rand.choice(['v', 1, None, '', 'w']) for _ in range(rand.randint(1, 3))]
+         for _ in range(rand.randint(1, 3))]
+
+    return 'write', reference, m
+
+
+def apply_step(lev, step):
+    action, reference, m = step
+    try:
+        if action == 'clear':
+            lev.clear(reference)
+        else:
+            lev[reference] = m
+    except ValueError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize('seed', range(15))
+def test_tracked_boundaries_match_rescan(seed):
+    """ random sequences of writes and clears, (some within lev.batch()), are applied both to
+    a lev_cls that tracks its boundaries across writes and to a new lev_cls for every write:
+    after each step, the worksheets must have identical values, and the boundaries (and headers,
+    outside of lev.batch()) must be the same
+    """
+    # region {closure functions}
+    def apply_steps(steps_, description):
+        for step in steps_:
+            apply_step(lev_1, step)
+            apply_step(lev_cls(ws_2, **kwargs), step)
+            compare(step, description)
+
+    def compare(step, description):
+        lev_2   = lev_cls(ws_2, **kwargs)
+        context = (i, kwargs, step, description)
+
+        assert ws_1.rows == ws_2.rows, context
+        assert boundaries(lev_1)[:5] == boundaries(lev_2)[:5], context
+        if not lev_1._batch_depth:
+            assert boundaries(lev_1)[5:] == boundaries(lev_2)[5:], context
+    # endregion
+
+    rand      = random.Random(seed)
+    excel_app = fake_excel_application()
+
+    for i in range(100):
+        kwargs = rand.choice([{},
+                              {'header_r': 1},
+                              {'meta_r': 1, 'header_r': 2},
+                              {'header_r': 1, 'first_c': 'B', 'last_c': 'D'},
+                              {'header_r': 1, 'last_r': 9}])
+
+        wb   = excel_app.Workbooks.Add('Sheet1', 'Sheet2')
+        ws_1 = wb.Sheets['Sheet1']
+        ws_2 = wb.Sheets['Sheet2']
+
+        lev_1    = lev_cls(ws_1, **kwargs)
+        steps    = [random_step(rand) for _ in range(rand.randint(1, 8))]
+        is_batch = (rand.random() < 0.5)
+        n        = rand.randint(0, len(steps))
+
+        apply_steps(steps[:n], 'outside batch')
+
+        if is_batch:
+            with lev_1.batch():
+                apply_steps(steps[n:], 'within batch')
+        else:
+            apply_steps(steps[n:], 'outside batch')
+
+        compare(None, 'after batch')
+
+
+def test_appends_within_batch():
+    excel_app = fake_excel_application()
+    ws        = excel_app.Workbooks.Add().Sheets['Sheet1']
+
+    lev = lev_cls(ws, header_r=1)
+    lev['*f *h'] = [['a', 'b']] + [[r, r] for r in range(5)]
+
+    with lev.batch():
+        for r in range(5, 8):
+            lev['*f *a'] = [[r, r]]
+
+        lev['*a *h'] = [['c'], [1]]
+
+    assert list(lev_cls(ws, header_r=1).values()) == [['a', 'b', 'c'], [0.0, 0.0, 1.0]] + \
+                                                     [[float(r), float(r), None] for r in range(1, 8)]
+    assert dict(lev.headers) == {'a': 'A', 'b': 'B', 'c': 'C'}
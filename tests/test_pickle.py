@@ -0,0 +1,85 @@
+import copy
+import pickle
+
+import pytest
+
+from vengeance import flux_cls
+
+
+m = [['a', 'b', 'c'],
+     [1,   'x', 1.5],
+     [2,   'y', None],
+     [3,   'z', [1, 2]]]
+
+
+@pytest.fixture(params=['rows', 'columns'])
+def flux(request):
+    flux = flux_cls([[*row] for row in m], storage=request.param)
+    flux.create_index('a', kind='sorted')
+    flux.label = 'flux_a'
+
+    return flux
+
+
+def assert_equivalent(flux_a, flux_b):
+    assert flux_b is not flux_a
+    assert flux_b.storage == flux_a.storage
+    assert list(flux_b.values()) == list(flux_a.values())
+    assert flux_b.headers == flux_a.headers
+    assert [row.b for row in flux_b] == [row.b for row in flux_a]
+    assert [row.a for row in flux_b.lookup('a', 2)] == [2]
+
+
+@pytest.mark.parametrize('protocol', range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(flux, protocol):
+    flux_b = pickle.loads(pickle.dumps(flux, protocol=protocol))
+
+    assert_equivalent(flux, flux_b)
+    assert flux_b.label == 'flux_a'
+
+
+def test_serialize_round_trip(flux, tmp_path):
+    path = str(tmp_path / 'file.flux')
+    flux.serialize(path)
+
+    assert_equivalent(flux, flux_cls.deserialize(path))
+
+
+def test_copy_does_not_alias(flux):
+    flux_b = copy.copy(flux)
+    assert_equivalent(flux, flux_b)
+
+    flux_b.matrix[1].a = 100
+    flux_b.append_rows([[4, 'w', 0.0]])
+    flux_b.rename_columns({'b': 'b_renamed'})
+
+    assert list(flux.values()) == m
+    assert flux.header_names() == ['a', 'b', 'c']
+
+
+def test_deepcopy(flux):
+    flux_b = copy.deepcopy(flux)
+    assert_equivalent(flux, flux_b)
+
+    flux_b.matrix[3].c.append(3)
+    assert flux.matrix[3].c == [1, 2]
+
+    flux_c = flux.copy(deep=True)
+    assert_equivalent(flux, flux_c)
+
+
+def test_legacy_state():
+    flux = flux_cls.__new__(flux_cls)
+    flux.__setstate__({'args': ([[*row] for row in m],), 'kwargs': {}})
+
+    assert list(flux.values()) == m
+
+
+def test_pickle_fluxb_columns(tmp_path):
+    path = str(tmp_path / 'file.fluxb')
+    flux_cls([['a', 'b'], [1, 2.5], [2, 3.5]]).to_fluxb(path)
+
+    flux   = flux_cls.from_fluxb(path)
+    flux_b = pickle.loads(pickle.dumps(flux, protocol=5))
+
+    assert list(flux_b.values()) == [['a', 'b'], [1, 2.5], [2, 3.5]]
@@ -0,0 +1,55 @@
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util.iter import ColumnNameError
+
+
+m = [['id', 'year', 'amount']] + [[str(i), str(2000 + i % 3), str(i * 10)] for i in range(20)]
+
+
+def expected_values(usecols, where):
+    flux  = flux_cls(m)
+    names = usecols or flux.header_names()
+    rows  = [row for row in flux if where is None or where(row)]
+
+    return [names] + [[row[n] for n in names] for row in rows]
+
+
+parameters = [(None,               lambda row: row.year == '2001'),
+              (['amount', 'id'],   None),
+              (['amount', 'id'],   lambda row: row.year == '2001'),
+              (['year'],           lambda row: int(row.id) > 15),
+              ([2, 0],             lambda row: row.year != '2000'),
+              (['id'],             lambda row: False)]
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+@pytest.mark.parametrize('usecols, where', parameters)
+def test_from_csv_pushdown(tmp_path, usecols, where, workers):
+    path = str(tmp_path / 'file.csv')
+    flux_cls(m).to_csv(path)
+
+    flux     = flux_cls.from_csv(path, usecols=usecols, where=where, workers=workers)
+    expected = expected_values(usecols and [m[0][c] if isinstance(c, int) else c for c in usecols], where)
+
+    assert list(flux.values()) == expected
+
+
+@pytest.mark.parametrize('orient', ['records', 'split', 'columns', 'values'])
+@pytest.mark.parametrize('usecols, where', parameters)
+def test_from_json_pushdown(tmp_path, usecols, where, orient):
+    path = str(tmp_path / 'file.json')
+    flux_cls(m).to_json(path, orient=orient)
+
+    flux     = flux_cls.from_json(path, usecols=usecols, where=where)
+    expected = expected_values(usecols and [m[0][c] if isinstance(c, int) else c for c in usecols], where)
+
+    assert list(flux.values()) == expected
+
+
+def test_pushdown_invalid_column(tmp_path):
+    path = str(tmp_path / 'file.csv')
+    flux_cls(m).to_csv(path)
+
+    with pytest.raises(ColumnNameError):
+        flux_cls.from_csv(path, usecols=['missing'])
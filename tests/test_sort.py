@@ -0,0 +1,83 @@
+import random
+
+from functools import cmp_to_key
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util.iter import sort_by_keys
+from vengeance.util.iter import sorted_indices
+
+
+def expected_order(rows, reverses):
+    """ None values last in either direction, numbers before other types, other types grouped by name """
+    def rank(v):
+        return '' if isinstance(v, (int, float)) else type(v).__name__
+
+    def compare(row_a, row_b):
+        for a, b, reverse in zip(row_a, row_b, reverses):
+            if (a is None) != (b is None):
+                return 1 if a is None else -1
+            if a is None or a == b:
+                continue
+
+            k_a, k_b = (rank(a), a), (rank(b), b)
+            if k_a == k_b:
+                continue
+
+            c = -1 if k_a < k_b else 1
+            return -c if reverse else c
+
+        return 0
+
+    return sorted(rows, key=cmp_to_key(compare))
+
+
+@pytest.mark.parametrize('reverses', [[False, False], [True, False], [False, True], [True, True]])
+def test_sort_mixed_and_none_keys(reverses):
+    random.seed(0)
+    values_a = [None, 1, 2.5, 'a', 'b', (1,)]
+    values_b = [None, 3, 'x', 0]
+    m = [['a', 'b', 'i']] + [[random.choice(values_a), random.choice(values_b), i] for i in range(300)]
+
+    flux = flux_cls(m).sorted('a', 'b', reverse=reverses)
+    assert [row.values for row in flux] == expected_order(m[1:], reverses)
+
+
+@pytest.mark.parametrize('reverses', [[False, True], [True, True]])
+def test_sort_is_stable(reverses):
+    random.seed(1)
+    m = [['a', 'b', 'c', 'i']] + [[random.randint(0, 3), random.choice('xy'), random.random(), i]
+                                  for i in range(500)]
+
+    flux = flux_cls(m)
+    flux.sort('a', 'b', reverse=reverses)
+
+    assert [row.values for row in flux] == expected_order(m[1:], reverses)
+
+
+def test_sort_with_none_in_later_key():
+    m = [['a', 'b'], [2, 'x'], [1, None], [1, 'y'], [2, None]]
+
+    flux = flux_cls(m)
+    flux.sort('a', 'b')
+    assert list(flux.values(1)) == [[1, 'y'], [1, None], [2, 'x'], [2, None]]
+
+    flux.sort('a', 'b', reverse=[True, True])
+    assert list(flux.values(1)) == [[2, 'x'], [2, None], [1, 'y'], [1, None]]
+
+
+def test_sort_by_keys_calls_each_key_once():
+    calls = []
+
+    def key(item):
+        calls.append(item)
+        return item[0]
+
+    items = [(None, 1), (2, 2), ('a', 3), (1, 4)]
+    assert sort_by_keys(items, [key, lambda item: item[1]], [False, True]) == [(1, 4), (2, 2), ('a', 3), (None, 1)]
+    assert len(calls) == len(items)
+
+
+def test_sorted_indices():
+    assert sorted_indices([[2, None, 1, 2], ['b', 'a', 'c', 'a']], [False, True]) == [2, 0, 3, 1]
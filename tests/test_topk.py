@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from vengeance import flux_cls
+
+
+def random_flux(seed, storage, with_none=False):
+    random.seed(seed)
+    choices = [1, 2, 3, 4, 2.5] + ([None] if with_none else [])
+    m = [['g', 'a', 'b', 'x']] + [[random.choice('pqr'),
+                                   random.choice(choices),
+                                   random.choice(choices),
+                                   i] for i in range(60)]
+
+    return flux_cls(m, storage=storage)
+
+
+def top_by_group(flux, k, name, reverse):
+    rows = []
+    for g in dict.fromkeys(row.g for row in flux):
+        group = flux.filtered(lambda row: row.g == g).sorted(name, reverse=reverse)
+        rows.extend(group.matrix[1:k + 1])
+
+    return [row.x for row in rows]
+
+
+@pytest.mark.parametrize('with_none', [False, True])
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('k', [0, 1, 5, 100])
+@pytest.mark.parametrize('names', [('a',), ('a', 'b')])
+def test_nlargest_nsmallest_match_sorted(names, k, seed, storage, with_none):
+    flux = random_flux(seed, storage, with_none)
+
+    expected = flux.sorted(*names, reverse=[True] * len(names)).matrix[1:k + 1]
+    assert [row.x for row in flux.nlargest(k, *names)] == [row.x for row in expected]
+
+    expected = flux.sorted(*names).matrix[1:k + 1]
+    assert [row.x for row in flux.nsmallest(k, *names)] == [row.x for row in expected]
+
+
+@pytest.mark.parametrize('with_none', [False, True])
+@pytest.mark.parametrize('storage', ['rows', 'columns'])
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('k', [1, 3, 100])
+@pytest.mark.parametrize('reverse', [True, False])
+def test_topk_by_matches_sorted_groups(reverse, k, seed, storage, with_none):
+    flux = random_flux(seed, storage, with_none)
+
+    flux_b = flux.topk_by('g', k, 'a', reverse=reverse)
+    assert [row.x for row in flux_b] == top_by_group(flux, k, 'a', reverse)
+
+
+def test_topk_by_empty():
+    flux = random_flux(0, 'rows')
+
+    assert flux.topk_by('g', 0, 'a').num_rows == 0
+    assert flux.nlargest(0, 'a').num_rows == 0
+    assert flux.nlargest(5, 'a').headers == flux.headers
@@ -0,0 +1,169 @@
+import zipfile
+from datetime import date
+from datetime import datetime
+from datetime import time
+
+import pytest
+
+from vengeance import flux_cls
+from vengeance.util import write_file
+from vengeance.util.xlsx import read_xlsx
+from vengeance.util.xlsx import write_xlsx
+from vengeance.util.xlsx import xlsx_sheet_names
+
+
+m = [['s',                 'i',      'f',   'b',   'd'],
+     ['a & <b> "c"',       1,        1.5,   True,  datetime(2001, 2, 3, 4, 5, 6)],
+     ['  padded\t',        -2,       1e20,  False, datetime(2001, 2, 3, 4, 5, 6, 789_000)],
+     ['line\r\nbreak',     10 ** 15, -0.0,  None,  datetime(1900, 1, 1)],
+     ['_x0041_ \x01 \x1f', 0,        2e-9,  True,  datetime(1900, 2, 28)],
+     ['',                  None,     None,  None,  datetime(1900, 3, 1)],
+     ['é ☃ \U0001f600',    3,        0.1,   False, None]]
+
+
+@pytest.mark.parametrize('strings', ['auto', 'shared', 'inline'])
+@pytest.mark.parametrize('extension', ['.xlsx', '.xlsm'])
+def test_round_trip(tmp_path, strings, extension):
+    path = str(tmp_path / ('file' + extension))
+    flux_cls(m).to_xlsx(path, strings=strings)
+
+    assert list(flux_cls.from_file(path).values()) == m
+
+
+def test_converted_values(tmp_path):
+    path = str(tmp_path / 'file.xlsx')
+    write_xlsx(path, [['a',                   'b'],
+                      [date(2001, 2, 3),      float('nan')],
+                      [datetime(1899, 1, 1),  float('inf')],
+                      [(1, 2),                {'k': 1}]])
+
+    assert read_xlsx(path) == [['a',                     'b'],
+                               [datetime(2001, 2, 3),    'nan'],
+                               ['1899-01-01 00:00:00',   'inf'],
+                               ['(1, 2)',                "{'k': 1}"]]
+
+
+def test_sheet_header_row_and_nrows(tmp_path):
+    path = str(tmp_path / 'file.xlsx')
+    flux_cls(m).to_xlsx(path, sheet='data & more')
+
+    assert xlsx_sheet_names(path) == ['data & more']
+    for sheet in (None, 0, -1, 'data & more', 'DATA & MORE'):
+        assert list(flux_cls.from_xlsx(path, sheet=sheet).values()) == m
+
+    flux = flux_cls.from_xlsx(path, header_row=3, nrows=2)
+    assert list(flux.values()) == m[2:5]
+
+    flux = flux_cls.from_xlsx(path, usecols=['i', 's'], where=lambda row: row.b is True)
+    assert list(flux.values()) == [['i', 's'], [1, m[1][0]], [0, m[4][0]]]
+
+    with pytest.raises(ValueError):
+        flux_cls.from_xlsx(path, sheet='missing')
+    with pytest.raises(IndexError):
+        flux_cls.from_xlsx(path, sheet=1)
+    with pytest.raises(ValueError):
+        flux_cls.from_xlsx(path, header_row=0)
+
+
+@pytest.mark.parametrize('chunksize', [1, 4, 100])
+def test_iter_xlsx(tmp_path, chunksize):
+    path = str(tmp_path / 'file.xlsx')
+    flux_cls(m).to_xlsx(path)
+
+    fluxes = list(flux_cls.iter_xlsx(path, chunksize=chunksize))
+    values = list(fluxes[0].values()) + [values for flux in fluxes[1:] for values in flux.values(1)]
+
+    assert values == m
+    assert all(flux.headers is fluxes[0].headers for flux in fluxes)
+
+
+def test_invalid_writes(tmp_path):
+    path = str(tmp_path / 'file.xlsx')
+
+    with pytest.raises(ValueError):
+        write_xlsx(path, m, sheet='a/b')
+    with pytest.raises(ValueError):
+        write_xlsx(path, m, strings='sometimes')
+    with pytest.raises(ValueError):
+        write_xlsx(path, [['a'], ['x' * 40_000]])
+    with pytest.raises(ValueError):
+        write_file(path, m, mode='a')
+
+
+def write_workbook(path, sheet_xml, shared_strings_xml=None, styles_xml=None, workbook_pr=''):
+    """ a workbook as Excel writes it, (not as write_xlsx() does) """
+    ns   = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    r_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+    p_ns = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+    rels = ['<Relationship Id="rId9" Type="{}/worksheet" Target="worksheets/data.xml"/>'.format(r_ns),
+            '<Relationship Id="rId2" Type="{}/worksheet" Target="/xl/worksheets/other.xml"/>'.format(r_ns)]
+    if shared_strings_xml:
+        rels.append('<Relationship Id="rId3" Type="{}/sharedStrings" Target="strings.xml"/>'.format(r_ns))
+    if styles_xml:
+        rels.append('<Relationship Id="rId4" Type="{}/styles" Target="styles.xml"/>'.format(r_ns))
+
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr('_rels/.rels',
+                   '<Relationships xmlns="{}"><Relationship Id="rId1" Type="{}/officeDocument" '
+                   'Target="xl/workbook.xml"/></Relationships>'.format(p_ns, r_ns))
+        z.writestr('xl/workbook.xml',
+                   '<x:workbook xmlns:x="{}" xmlns:r="{}">{}<x:sheets>'
+                   '<x:sheet name="Other" sheetId="2" r:id="rId2"/>'
+                   '<x:sheet name="Data" sheetId="1" r:id="rId9"/>'
+                   '</x:sheets></x:workbook>'.format(ns, r_ns, workbook_pr))
+        z.writestr('xl/_rels/workbook.xml.rels',
+                   '<Relationships xmlns="{}">{}</Relationships>'.format(p_ns, ''.join(rels)))
+        z.writestr('xl/worksheets/other.xml',
+                   '<worksheet xmlns="{}"><sheetData><row r="1"><c r="A1"><v>1</v></c></row>'
+                   '</sheetData></worksheet>'.format(ns))
+        z.writestr('xl/worksheets/data.xml',
+                   '<worksheet xmlns="{}"><sheetData>{}</sheetData></worksheet>'.format(ns, sheet_xml))
+        if shared_strings_xml:
+            z.writestr('xl/strings.xml', '<sst xmlns="{}">{}</sst>'.format(ns, shared_strings_xml))
+        if styles_xml:
+            z.writestr('xl/styles.xml', '<styleSheet xmlns="{}">{}</styleSheet>'.format(ns, styles_xml))
+
+
+def test_read_excel_workbook(tmp_path):
+    path = str(tmp_path / 'file.xlsx')
+
+    shared_strings = ('<si><t>name</t></si>'
+                      '<si><t>value</t></si>'
+                      '<si><r><t>rich </t></r><r><rPr><b/></rPr><t>text</t></r></si>'
+                      '<si><t>漢字</t><rPh sb="0" eb="2"><t>かんじ</t></rPh></si>'
+                      '<si><t>a_x000D_b</t></si>')
+    styles = ('<numFmts count="3">'
+              '<numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd"/>'
+              '<numFmt numFmtId="165" formatCode="h:mm"/>'
+              '<numFmt numFmtId="166" formatCode="[Red]0.00;&quot;days&quot;"/>'
+              '</numFmts>'
+              '<cellXfs count="4"><xf numFmtId="0"/><xf numFmtId="164"/><xf numFmtId="165"/><xf numFmtId="166"/></cellXfs>')
+    sheet = ('<row r="1"><c r="A1" t="str"><v>title row</v></c></row>'
+             '<row r="2"><c r="A2" t="s"><v>0</v></c><c r="C2" t="s"><v>1</v></c></row>'
+             '<row r="3"><c r="A3" t="s"><v>2</v></c><c r="B3" s="1"><v>36526</v></c><c r="C3" s="3"><v>1.25</v></c></row>'
+             '<row r="5"><c r="A5" t="s"><v>3</v></c><c r="B5" s="2"><v>0.5</v></c><c r="C5" t="e"><v>#N/A</v></c></row>'
+             '<row r="6"><c t="s"><v>4</v></c><c t="b"><v>1</v></c><c t="str"><f>A1</f><v>formula</v></c></row>'
+             '<row r="7"><c r="A7" t="inlineStr"><is><t xml:space="preserve"> inline </t></is></c>'
+             '<c r="C7"><v>1.5E3</v></c><c r="D7"><v>99</v></c></row>')
+
+    write_workbook(path, sheet, shared_strings, styles)
+
+    assert xlsx_sheet_names(path) == ['Other', 'Data']
+    assert read_xlsx(path, sheet='Data', header_row=2) == [['name',      None,                  'value'],
+                                                          ['rich text', datetime(2000, 1, 1),  1.25],
+                                                          [None,        None,                  None],
+                                                          ['漢字',       time(12, 0),           '#N/A'],
+                                                          ['a\rb',      True,                  'formula'],
+                                                          [' inline ',  None,                  1500.0, 99]]
+    assert read_xlsx(path) == [[1]]
+
+
+def test_read_date1904(tmp_path):
+    path = str(tmp_path / 'file.xlsx')
+    write_workbook(path,
+                   '<row r="1"><c r="A1" s="1"><v>0</v></c><c r="B1" s="1"><v>366.25</v></c></row>',
+                   styles_xml='<cellXfs count="2"><xf numFmtId="0"/><xf numFmtId="14"/></cellXfs>',
+                   workbook_pr='<x:workbookPr date1904="1"/>')
+
+    assert read_xlsx(path, sheet='Data') == [[datetime(1904, 1, 1), datetime(1905, 1, 1, 6)]]
@@ -0,0 +1,270 @@
+
+from copy import deepcopy
+from itertools import chain
+from itertools import islice
+
+from .flux_row_cls import flux_row_cls
+
+from ..util.iter import transpose
+
+
+class column_matrix_cls:
+    """ column-major storage for flux_cls(matrix, storage='columns')
+
+    values are held as one list per column instead of one list per row, so
+    column reads, appends, inserts and deletes are single list operations
+    with no per-row work
+
+    behaves like the list of flux_row_cls objects in flux_cls.matrix:
+        matrix[0] is the header row
+        matrix[i] returns a flux_row_cls whose .values is a column_values_cls
+        view into self.columns, so that row modifications are written
+        directly to the underlying columns
+
+    eg:
+        flux = flux_cls(m, storage='columns')
+        for row in flux:
+            row.col_a = 'a'
+
+        column = flux.matrix.columns[flux.headers['col_a']]
+
+    row objects are created on demand and are bound to a row position, so
+    any row references held before a sort, filter, insert or delete will
+    point to whatever values now occupy that position
+    """
+    def __init__(self, headers, header_row, columns):
+        """
+        :param headers:    OrderedDict of {'header': int}, shared with flux_cls.headers
+        :param header_row: flux_row_cls of header names
+        :param columns:    list of column lists, all of equal length
+        """
+        self.headers    = headers
+        self.header_row = header_row
+        self.columns    = columns
+
+    @classmethod
+    def from_rows(cls, headers, m):
+        """ :param m: list of lists, headers in first row """
+        header_row = flux_row_cls(headers, [*m[0]], 0)
+        rows       = m[1:]
+        num_cols   = len(m[0])
+
+        jagged = [i for i, row in enumerate(rows, 1) if len(row) != num_cols]
+        if jagged:
+            raise IndexError('columnar storage does not support jagged rows, '
+                             'first jagged row: {:,}'.format(jagged[0]))
+
+        if rows:
+            columns = list(transpose(rows, astype=list))
+        else:
+            columns = [[] for _ in range(num_cols)]
+
+        return cls(headers, header_row, columns)
+
+    @property
+    def num_rows(self):
+        if not self.columns:
+            return 0
+
+        return len(self.columns[0])
+
+    def row(self, i):
+        """ :param i: index position in matrix (header row is 0) """
+        return flux_row_cls(self.headers,
+                            column_values_cls(self.columns, i - 1),
+                            i)
+
+    def rows(self, r_1=1, r_2=None):
+        """ rows are yielded for as long as they exist, the same as islice() over a list of rows:
+        rows appended during iteration are included, and iteration stops early if rows are deleted
+        """
+        has_negative_index = (r_1 is not None and r_1 < 0) or \
+                             (r_2 is not None and r_2 < 0)
+        if has_negative_index:
+            r_1, r_2, _ = slice(r_1, r_2).indices(len(self))
+
+        i = r_1 or 0
+        if i == 0:
+            yield self.header_row
+            i = 1
+
+        headers = self.headers
+        columns = self.columns
+        r_2     = float('inf') if r_2 is None else r_2
+
+        while columns and i <= len(columns[0]) and i < r_2:
+            yield flux_row_cls(headers, column_values_cls(columns, i - 1), i)
+            i += 1
+
+    def values(self, r_1=0, r_2=None):
+        r_1, r_2, _ = slice(r_1, r_2).indices(len(self))
+
+        header_values = ([*self.header_row.values],)
+        row_values    = map(list, zip(*self.columns))
+
+        return islice(chain(header_values, row_values), r_1, r_2)
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        i = len(self)
+        self[i:i] = rows
+
+    def insert(self, i, row):
+        self[i:i] = [row]
+
+    def __data_slice(self, s):
+        r_1, r_2, step = s.indices(len(self))
+
+        if step != 1:
+            raise IndexError('columnar storage does not support extended slices')
+        if r_1 == 0:
+            raise IndexError('header row cannot be modified through a slice, use flux_cls.reset_headers()')
+
+        return slice(r_1 - 1, max(r_1, r_2) - 1)
+
+    def __column_segments(self, rows):
+        """ :return: one list of values for each column, in the order of rows """
+        values = [row.values if isinstance(row, flux_row_cls) else row
+                  for row in rows]
+
+        is_own_view = all(isinstance(v, column_values_cls) and v.columns is self.columns
+                          for v in values)
+        if is_own_view:
+            indices = [v.i for v in values]
+            return [[column[i] for i in indices] for column in self.columns]
+
+        num_cols = len(self.columns)
+        jagged   = [v for v in values if len(v) != num_cols]
+        if jagged:
+            raise IndexError('columnar storage does not support jagged rows: {}'.format(list(jagged[0])))
+
+        values = [[*v] for v in values]
+        if not values:
+            return [[] for _ in range(num_cols)]
+
+        return list(transpose(values, astype=list))
+
+    def __len__(self):
+        return self.num_rows + 1
+
+    def __iter__(self):
+        return self.rows(0)
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, 0, -1):
+            yield self.row(i)
+
+        yield self.header_row
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            if i.step in (None, 1):
+                return list(self.rows(i.start, i.stop))
+
+            return [self[_i_] for _i_ in range(*i.indices(len(self)))]
+
+        n = len(self)
+        if i < 0:
+            i += n
+        if not (0 <= i < n):
+            raise IndexError('matrix index out of range')
+
+        if i == 0:
+            return self.header_row
+
+        return self.row(i)
+
+    def __setitem__(self, i, rows):
+        if not isinstance(i, slice):
+            if i in (0, -len(self)):
+                self.header_row.values = [*rows.values] if isinstance(rows, flux_row_cls) else [*rows]
+                return
+
+            if i < 0:
+                i += len(self)
+
+            i = slice(i, i + 1)
+            rows = [rows]
+
+        s        = self.__data_slice(i)
+        segments = self.__column_segments(rows)
+
+        for column, segment in zip(self.columns, segments):
+            column[s] = segment
+
+    def __delitem__(self, i):
+        if not isinstance(i, slice):
+            if i < 0:
+                i += len(self)
+
+            i = slice(i, i + 1)
+
+        s = self.__data_slice(i)
+
+        for column in self.columns:
+            del column[s]
+
+    def __repr__(self):
+        return '{}: {:,} cols x {:,} rows'.format(self.__class__.__name__,
+                                                 len(self.columns),
+                                                 self.num_rows)
+
+
+class column_values_cls:
+    """ list-like view of a single row's values in a column_matrix_cls
+
+    reads and writes go directly to the underlying column lists, the number
+    of values cannot be changed through a row (use flux_cls column methods instead)
+    """
+    __slots__ = ('columns',
+                 'i')
+
+    def __init__(self, columns, i):
+        self.columns = columns
+        self.i       = i
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return [column[self.i] for column in self.columns[c]]
+
+        return self.columns[c][self.i]
+
+    def __setitem__(self, c, v):
+        if isinstance(c, slice):
+            columns = self.columns[c]
+            v       = list(v)
+
+            if len(v) != len(columns):
+                raise ValueError('columnar row values cannot change length')
+
+            for column, _v_ in zip(columns, v):
+                column[self.i] = _v_
+        else:
+            self.columns[c][self.i] = v
+
+    def __delitem__(self, c):
+        raise TypeError('columnar row values cannot change length, use flux_cls.delete_columns()')
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __iter__(self):
+        i = self.i
+        return (column[i] for column in self.columns)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(list(self), memo)
+
+    def __repr__(self):
+        return repr(list(self))
@@ -1,10 +1,14 @@
 
 import gc
+import heapq
 
 from array import array
 from collections import Counter
 from collections import namedtuple
 from copy import deepcopy
+from itertools import chain
+from itertools import islice
+from operator import itemgetter
 
 from typing import ItemsView
 from typing import KeysView
@@ -17,13 +21,26 @@ from typing import Union
 from typing import Any
 
 from .flux_row_cls import flux_row_cls
+from .flux_row_cls import specialized_row_class
+from .column_matrix_cls import column_matrix_cls
+from .flux_query_cls import flux_query_cls
+from .flux_index_cls import flux_index_cls
 
 from ..util.filesystem import parse_file_extension
 from ..util.filesystem import read_file
+from ..util.filesystem import iter_file
 from ..util.filesystem import write_file
 from ..util.filesystem import pickle_extensions
+from ..util.filesystem import jsonl_extensions
+from ..util.filesystem import xlsx_extensions
 from ..util.filesystem import json_dumps_extended
 
+from ..util.fluxb import read_fluxb
+from ..util.fluxb import write_fluxb
+
+from ..util.dtypes import column_converters
+from ..util.dtypes import convert_rows
+
 from ..util import iter as util_iter
 from ..util.iter import IterationDepthError
 from ..util.iter import ColumnNameError
@@ -36,6 +53,9 @@ from ..util.iter import iterator_to_collection
 from ..util.iter import map_values_to_enum
 from ..util.iter import are_indices_contiguous
 from ..util.iter import transpose
+from ..util.iter import sort_by_keys
+from ..util.iter import sort_key
+from ..util.iter import is_directly_sortable
 from ..util.iter import to_grouped_dict
 from ..util.iter import is_header_row
 from ..util.iter import is_subscriptable
@@ -46,12 +66,12 @@ from ..util.text import object_name
 from ..util.text import surround_double_brackets
 from ..util.text import surround_single_brackets
 from ..util.text import format_integer
-from ..util.text import function_parameters
 from ..util.text import function_name
 from ..util.text import vengeance_message
 # from ..util.text import deprecated
 
 from ..util.classes.namespace_cls import namespace_cls
+from ..util.classes.reversed_value_cls import reversed_value_cls
 
 from ..conditional import ordereddict
 from ..conditional import line_profiler_installed
@@ -76,7 +96,7 @@ class flux_cls:
     # indices for ._preview_as_* properties (may be slice or list of integers)
     preview_indices = slice(1, 5 + 1)
 
-    def __init__(self, matrix=None):
+    def __init__(self, matrix=None, storage='rows'):
         """
         # organized like csv data, attribute names are provided in first row
         matrix = [['attribute_a', 'attribute_b', 'attribute_c'],
@@ -84,23 +104,31 @@ class flux_cls:
                   ['a',           'b',           3.0],
                   ['a',           'b',           3.0]]
         flux = vengeance.flux_cls(matrix)
+
+        :param storage: 'rows' or 'columns'
+            storage='columns' keeps one list per column instead of one list per row
+            (see column_matrix_cls), column reads, appends and deletes no longer
+            have to visit every row, but rows are created on demand during iteration
         """
 
         ''' @types '''
-        self.headers: Dict[Union[str, bytes], int]
-        self.matrix:  List[flux_row_cls]
+        self.headers:  Dict[Union[str, bytes], int]
+        self.matrix:   Union[List[flux_row_cls], column_matrix_cls]
+        self._indexes: Dict[Union[str, bytes], flux_index_cls]
 
         gc_enabled   = gc.isenabled()
         if gc_enabled: gc.disable()
 
+        storage = self.__validate_storage(storage)
         matrix  = self.__validate_matrix_as_primitive_values(matrix)
         headers = self.__validate_names_as_headers(matrix[0])
-        matrix  = [flux_row_cls(headers, row, i) for i, row in enumerate(matrix)]
+        matrix  = self.__validate_matrix_storage(headers, matrix, storage)
 
         if gc_enabled: gc.enable()
 
-        self.headers = headers
-        self.matrix  = matrix
+        self.headers  = headers
+        self.matrix   = matrix
+        self._indexes = {}
 
     @property
     def _preview_as_tuples(self, preview_indices=None) -> List:
@@ -124,6 +152,13 @@ class flux_cls:
 
         return m
 
+    @property
+    def storage(self) -> str:
+        if isinstance(self.matrix, column_matrix_cls):
+            return 'columns'
+
+        return 'rows'
+
     @property
     def num_cols(self) -> int:
         return len(self.matrix[0])
@@ -155,7 +190,7 @@ class flux_cls:
 
     def has_data(self) -> bool:
         """ check if flux has any rows below header row """
-        for row in self.matrix[1:]:
+        for row in self.__rows():
             if row:
                 return False
 
@@ -176,6 +211,9 @@ class flux_cls:
             this doesn't
             [[None, None, None] for _ in range(1_000)]
         """
+        if self.storage == 'columns':
+            return False
+
         rids = set()
 
         for row in self.matrix:
@@ -204,6 +242,9 @@ class flux_cls:
 
         yield dict of rows with duplicate .values pointers
         """
+        if self.storage == 'columns':
+            return ordereddict()
+
         enumrow_nt = namedtuple('EnumRow', ('i', 'row'))
 
         d = ordereddict()
@@ -222,6 +263,9 @@ class flux_cls:
 
     def is_jagged(self) -> bool:
         """ if there is a mismatch of the length of any row.values """
+        if self.storage == 'columns':
+            return False
+
         num_cols = len(self.headers)
 
         for row in self.matrix:
@@ -234,6 +278,9 @@ class flux_cls:
         """ if there is a mismatch of the length of any row.values
         yield EnumRow of jagged rows
         """
+        if self.storage == 'columns':
+            return
+
         enumrow_nt = namedtuple('EnumRow', ('i', 'row'))
         num_cols   = len(self.headers)
 
@@ -248,17 +295,26 @@ class flux_cls:
                       **kwargs):
 
         filetype = parse_file_extension(filetype or path,
-                                        include_dot=True).lower()
+                                        include_dot=True,
+                                        ignore_compression=True).lower()
 
         if filetype == '.csv':
             return self.to_csv(path, encoding, **kwargs)
         elif filetype == '.json':
             return self.to_json(path, encoding, **kwargs)
+        elif filetype in jsonl_extensions:
+            return self.to_jsonl(path, encoding, **kwargs)
+        elif filetype == '.fluxb':
+            return self.to_fluxb(path)
+        elif filetype in xlsx_extensions:
+            return self.to_xlsx(path, **kwargs)
         elif filetype in pickle_extensions:
             return self.serialize(path, **kwargs)
 
         raise ValueError("invalid filetype: '{}' \nfiletype must be in {}"
-                         .format(filetype, ['.csv', '.json'] + list(pickle_extensions)))
+                         .format(filetype, ['.csv', '.json', '.fluxb'] + list(jsonl_extensions) +
+                                                                         list(xlsx_extensions) +
+                                                                         list(pickle_extensions)))
 
     @classmethod
     def from_file(cls, path,
@@ -267,17 +323,75 @@ class flux_cls:
                        **kwargs):
 
         filetype = parse_file_extension((filetype or path),
-                                        include_dot=True).lower()
+                                        include_dot=True,
+                                        ignore_compression=True).lower()
 
         if filetype == '.csv':
             return cls.from_csv(path, encoding, **kwargs)
         if filetype == '.json':
             return cls.from_json(path, encoding, **kwargs)
+        if filetype in jsonl_extensions:
+            return cls.from_jsonl(path, encoding, **kwargs)
+        if filetype == '.fluxb':
+            return cls.from_fluxb(path, **kwargs)
+        if filetype in xlsx_extensions:
+            return cls.from_xlsx(path, **kwargs)
         if filetype in pickle_extensions:
             return cls.deserialize(path, **kwargs)
 
         raise ValueError("invalid filetype: '{}' \nfiletype must be in {}"
-                         .format(filetype, ['.csv', '.json'] + list(pickle_extensions)))
+                         .format(filetype, ['.csv', '.json', '.fluxb'] + list(jsonl_extensions) +
+                                                                         list(xlsx_extensions) +
+                                                                         list(pickle_extensions)))
+
+    def to_fluxb(self, path):
+        """ write binary columnar file, see .from_fluxb() and util.fluxb """
+        names = [*self.matrix[0].values]
+
+        if self.storage == 'columns':
+            columns = self.matrix.columns
+        elif self.num_rows:
+            num_cols = len(names)
+            jagged   = [i for i, values in enumerate(self.__row_values(), 1) if len(values) != num_cols]
+            if jagged:
+                raise IndexError('.fluxb files do not support jagged rows, '
+                                 'first jagged row: {:,}'.format(jagged[0]))
+
+            gc_enabled   = gc.isenabled()
+            if gc_enabled: gc.disable()
+
+            columns = list(zip(*self.__row_values()))
+
+            if gc_enabled: gc.enable()
+        else:
+            columns = [[] for _ in names]
+
+        write_fluxb(path, names, columns)
+        return self
+
+    @classmethod
+    def from_fluxb(cls, path,
+                        storage='columns',
+                        use_mmap=True):
+        """
+        with storage='columns', the file is memory-mapped and column values are only read
+        from the file the first time each column is accessed, (int64, float64 and bool
+        columns are read zero-copy until they are modified)
+
+        eg:
+            flux.to_file('cache.fluxb')
+            flux = flux_cls.from_file('cache.fluxb')
+        """
+        storage        = cls.__validate_storage(storage)
+        names, columns = read_fluxb(path, use_mmap)
+
+        if storage == 'rows':
+            return cls([names, *map(list, zip(*columns))])
+
+        flux = cls([names], storage='columns')
+        flux.matrix.columns = columns
+
+        return flux
 
     def to_csv(self, path,
                      encoding=None,
@@ -289,11 +403,166 @@ class flux_cls:
     @classmethod
     def from_csv(cls, path,
                       encoding=None,
+                      dtypes=None,
+                      strict=False,
+                      usecols=None,
+                      where=None,
+                      workers=None,
                       **kwargs):
+        """
+        :param workers: number of processes to parse the file with, the file is split into
+                        byte ranges at record boundaries; files that cannot be split safely,
+                        (compressed files, urls, nrows, escapechar, non-ascii-compatible
+                        encodings) are parsed serially, see util.filesystem.__read_csv_parallel()
+                        on Windows, must be called under an if __name__ == '__main__': guard
+        :param usecols: column names (or indices) to keep, in the order they should appear
+        :param where:   function(row) -> bool, evaluated on the string values of each row
+                        while the file is being read; rows that fail are never
+                        added to the flux_cls
+        :param dtypes: None, 'infer', or dictionary of {name: type or function}
+            None:    all values are left as strings
+            'infer': int, float, bool, date or datetime are inferred for each column
+                     from a sample of rows, (see util.dtypes.infer_dtype())
+            dict:    eg {'id': int, 'amount': float, 'date': date, 'code': str}
+        :param strict: raise ValueError for the first value that cannot be converted,
+                       otherwise such values are left as strings
+
+        eg:
+            flux = flux_cls.from_csv('file.csv', dtypes='infer')
+            flux = flux_cls.from_csv('file.csv', dtypes={'amount': float}, strict=True)
+            flux = flux_cls.from_csv('file.csv', usecols=['id', 'amount'],
+                                                 where=lambda row: row.year == '2001')
+            flux = flux_cls.from_csv('file.csv', workers=8)
+        """
+        if workers is not None:
+            m = read_file(path, encoding, filetype='.csv', workers=workers, **kwargs)
+            if usecols is not None or where is not None:
+                m = cls.__pushdown_values(m, usecols, where)
+
+        elif usecols is None and where is None:
+            m = read_file(path, encoding, filetype='.csv', **kwargs)
+        else:
+            chunks = iter_file(path, encoding, filetype='.csv', chunksize=1_000, **kwargs)
+            m      = cls.__pushdown_values(chain.from_iterable(chunks), usecols, where)
+
+        if dtypes is not None and m:
+            converters = column_converters(m[0], m[1:], dtypes)
+            m = [m[0], *convert_rows(m[1:], converters, m[0], strict)]
 
-        m = read_file(path, encoding, filetype='.csv', **kwargs)
         return cls(m)
 
+    @classmethod
+    def iter_csv(cls, path,
+                      encoding=None,
+                      chunksize=100_000,
+                      dtypes=None,
+                      strict=False,
+                      **kwargs) -> Generator['flux_cls', None, None]:
+        """ yield successive flux_cls chunks of at most chunksize rows, so that files
+        too large to fit in memory can be processed
+
+        every chunk shares the same headers dictionary, keyword arguments
+        (eg nrows, exclude_header_row, delimiter, dtypes) are the same as from_csv(),
+        dtypes are inferred from the first chunk only
+
+        eg:
+            for flux in flux_cls.iter_csv('file.csv', chunksize=50_000):
+                flux.to_csv('file_part.csv', mode='a')
+        """
+        # region {closure functions}
+        def typed_chunks(chunks):
+            converters = None
+            r_1        = 1
+
+            for m in chunks:
+                if converters is None:
+                    names      = m[0]
+                    converters = column_converters(names, m[1:], dtypes)
+                    m = [names, *convert_rows(m[1:], converters, names, strict, r_1)]
+                    r_1 += len(m) - 1
+                else:
+                    m = convert_rows(m, converters, names, strict, r_1)
+                    r_1 += len(m)
+
+                yield m
+        # endregion
+
+        chunks = iter_file(path, encoding, filetype='.csv', chunksize=chunksize, **kwargs)
+        if dtypes is not None:
+            chunks = typed_chunks(chunks)
+
+        return cls.__fluxes_from_chunks(chunks)
+
+    @classmethod
+    def iter_file(cls, path,
+                       encoding=None,
+                       filetype=None,
+                       chunksize=100_000,
+                       **kwargs) -> Generator['flux_cls', None, None]:
+        """ yield successive flux_cls chunks of at most chunksize rows
+
+        csv, json lines and xlsx files are streamed, (see .iter_csv(), .iter_jsonl(), .iter_xlsx()),
+        other file types can only be read in full and are then split into chunks
+        """
+        # region {closure functions}
+        def value_chunks():
+            values = flux.values()
+            n      = chunksize + 1
+
+            while True:
+                m = list(islice(values, n))
+                if not m:
+                    return
+
+                yield m
+                n = chunksize
+        # endregion
+
+        extension = parse_file_extension((filetype or path),
+                                         include_dot=True,
+                                         ignore_compression=True).lower()
+
+        if extension == '.csv':
+            return cls.iter_csv(path, encoding, chunksize, **kwargs)
+        if extension in jsonl_extensions:
+            return cls.iter_jsonl(path, encoding, chunksize, filetype=extension, **kwargs)
+        if extension in xlsx_extensions:
+            return cls.iter_xlsx(path, chunksize=chunksize, **kwargs)
+
+        flux = cls.from_file(path, encoding, filetype, **kwargs)
+
+        return cls.__fluxes_from_chunks(value_chunks())
+
+    @classmethod
+    def __fluxes_from_chunks(cls, chunks):
+        """
+        :param chunks: iterable of lists of rows, first chunk includes the header row
+
+        rows of every chunk are assigned to the headers of the first chunk
+        """
+        headers = None
+        names   = None
+
+        for m in chunks:
+            if headers is None:
+                flux    = cls(m)
+                headers = flux.headers
+                names   = [*flux.matrix[0].values]
+
+                yield flux
+                continue
+
+            gc_enabled   = gc.isenabled()
+            if gc_enabled: gc.disable()
+
+            flux = cls([names])
+            flux.headers = headers
+            flux.matrix  = cls.__validate_matrix_storage(headers, [[*names], *m], 'rows')
+
+            if gc_enabled: gc.enable()
+
+            yield flux
+
     def to_string(self, encoding=None, **kwargs) -> str:
         """ aliased to flux_cls.to_json(path=None) """
         return self.to_json(path=None,
@@ -302,9 +571,44 @@ class flux_cls:
 
     def to_json(self, path=None,
                       encoding=None,
+                      orient='records',
                       **kwargs) -> Union[object, str]:
+        """
+        :param orient:
+            'records': [{'col_a': 'a', 'col_b': 'b'},
+                        {'col_a': 'a', 'col_b': 'b'}]
+            'split':   {'columns': ['col_a', 'col_b'],
+                        'data':    [['a', 'b'],
+                                    ['a', 'b']]}
+            'columns': {'col_a': ['a', 'a'],
+                        'col_b': ['b', 'b']}
+            'values':  [['col_a', 'col_b'],
+                        ['a',     'b'],
+                        ['a',     'b']]
+
+        column names are only written once for 'split', 'columns' and 'values', which are
+        also written without indentation or whitespace by default, (orient='records' keeps indent=4)
+        from_json() detects the orientation of the file
+        """
+        orient = self.__validate_json_orient(orient)
+        names  = [*self.matrix[0].values]
 
-        o = list(self.dicts())
+        if orient == 'records':
+            o = list(self.dicts())
+        else:
+            kwargs['indent']     = kwargs.get('indent',     None)
+            kwargs['separators'] = kwargs.get('separators', (',', ':'))
+
+            if orient == 'split':
+                o = {'columns': names,
+                     'data':    list(self.values(1))}
+            elif orient == 'values':
+                o = list(self.values())
+            elif self.storage == 'columns':
+                o = ordereddict(zip(names, self.matrix.columns))
+            else:
+                columns = zip(*self.__row_values()) if self.num_rows else ([] for _ in names)
+                o       = ordereddict(zip(names, columns))
 
         if path is None:
             j_str = json_dumps_extended(o, **kwargs)
@@ -316,11 +620,265 @@ class flux_cls:
     @classmethod
     def from_json(cls, path,
                        encoding=None,
+                       usecols=None,
+                       where=None,
                        **kwargs):
+        """
+        the orientation of the file is detected, (see .to_json(orient))
 
+        :param usecols: column names (or indices) to keep, see .from_csv()
+        :param where:   function(row) -> bool, see .from_csv()
+        """
         o = read_file(path, encoding, filetype='.json', **kwargs)
+        o = cls.__json_object_as_values(o)
+
+        if (usecols is not None or where is not None) and o:
+            o = cls.__pushdown_values(o, usecols, where)
+
         return cls(o)
 
+    @staticmethod
+    def __json_object_as_values(o):
+        """ :return: list of dictionaries, (orient='records'), or list of lists with headers in first row """
+        if not isinstance(o, dict):
+            return o
+
+        if o.keys() == {'columns', 'data'}:
+            return [o['columns'], *o['data']]
+
+        is_columns = all(isinstance(column, list) for column in o.values())
+        if not is_columns:
+            raise ValueError("json object should be in orient='split' or orient='columns' format")
+
+        num_rows = {len(column) for column in o.values()}
+        if len(num_rows) > 1:
+            raise IndexError("orient='columns' json object has columns of unequal lengths")
+
+        return [[*o.keys()], *map(list, zip(*o.values()))]
+
+    @classmethod
+    def __pushdown_values(cls, m, usecols, where):
+        """ :return: list of values, with only the usecols columns of rows where where(row) is True
+
+        :param m: iterable of lists of values with the header row first, or iterable of dictionaries
+
+        where(row) is called on a single flux_row_cls whose .values are re-assigned for each row,
+        so that rows are not wrapped (or copied) unless they are kept
+        """
+        # region {closure functions}
+        def projected(values):
+            try:
+                return [*get_values(values)]
+            except IndexError:
+                return [values[i] if i < len(values) else None for i in i_cols]
+        # endregion
+
+        m     = iter(m)
+        first = next(m, None)
+        if first is None:
+            return [[]]
+
+        if isinstance(first, dict):
+            names = [*first.keys()]
+            m     = ([*d.values()] for d in chain([first], m))
+        else:
+            names = [*first]
+
+        headers = cls.__validate_names_as_headers(names)
+
+        if usecols is None:
+            i_cols = None
+        else:
+            usecols    = standardize_variable_arity_values(usecols, depth=1)
+            i_cols     = cls.__validate_names_as_indices(usecols, headers)
+            get_values = itemgetter(*i_cols) if len(i_cols) > 1 else lambda values: (values[i_cols[0]],)
+            names      = [names[i] for i in i_cols]
+
+        if where is not None:
+            row = specialized_row_class(headers)(headers, None)
+
+        gc_enabled   = gc.isenabled()
+        if gc_enabled: gc.disable()
+
+        values_m = [names]
+        for values in m:
+            if where is not None:
+                row.values = values
+                if not where(row):
+                    continue
+
+            if i_cols is not None:
+                values = projected(values)
+
+            values_m.append(values)
+
+        if gc_enabled: gc.enable()
+
+        return values_m
+
+    def to_jsonl(self, path,
+                       encoding=None,
+                       **kwargs):
+        """ write one json object per row, (json lines / ndjson)
+
+        rows are written one line at a time, with compact separators
+        """
+        filetype = parse_file_extension(path, include_dot=True, ignore_compression=True).lower()
+        if filetype not in jsonl_extensions:
+            filetype = '.jsonl'
+
+        write_file(path, self.dicts(), encoding, filetype=filetype, **kwargs)
+        return self
+
+    @classmethod
+    def from_jsonl(cls, path,
+                        encoding=None,
+                        **kwargs):
+        """ read one json object per line, (json lines / ndjson)
+
+        lines are decoded and converted to row values one at a time: column names are
+        collected from the keys of all records, in order of first appearance, and
+        missing keys are filled with None
+        """
+        chunks = iter_file(path, encoding, filetype='.jsonl', chunksize=1_000, **kwargs)
+        m      = cls.__values_from_records(chain.from_iterable(chunks))
+
+        return cls(m)
+
+    @classmethod
+    def iter_jsonl(cls, path,
+                        encoding=None,
+                        chunksize=100_000,
+                        filetype='.jsonl',
+                        **kwargs) -> Generator['flux_cls', None, None]:
+        """ yield successive flux_cls chunks of at most chunksize rows
+
+        column names are taken from the records in the first chunk, (every chunk shares the
+        same headers dictionary), keys that first appear in a later chunk raise ColumnNameError
+
+        eg:
+            for flux in flux_cls.iter_jsonl('events.jsonl', chunksize=50_000):
+                flux.to_csv('events.csv', mode='a')
+        """
+        # region {closure functions}
+        def value_chunks():
+            names = None
+
+            for records in chunks:
+                m = cls.__values_from_records(records, names)
+                if names is None:
+                    names = m[0]
+                    yield m
+                else:
+                    yield m[1:]
+        # endregion
+
+        chunks = iter_file(path, encoding, filetype=filetype, chunksize=chunksize, **kwargs)
+        return cls.__fluxes_from_chunks(value_chunks())
+
+    def to_xlsx(self, path,
+                      sheet='Sheet1',
+                      strings='auto',
+                      compresslevel=None):
+        """ write a workbook with a single worksheet, (no Excel application required)
+
+        rows are streamed into the file one at a time, see util.xlsx.write_xlsx()
+
+        :param strings: 'auto', 'shared' or 'inline', how string values are stored
+
+        eg:
+            flux.to_file('report.xlsx', sheet='report')
+        """
+        filetype = parse_file_extension(path, include_dot=True).lower()
+        if filetype not in xlsx_extensions:
+            filetype = '.xlsx'
+
+        write_file(path, self.values(), filetype=filetype,
+                                        sheet=sheet,
+                                        strings=strings,
+                                        compresslevel=compresslevel)
+        return self
+
+    @classmethod
+    def from_xlsx(cls, path,
+                       sheet=None,
+                       header_row=1,
+                       nrows=None,
+                       usecols=None,
+                       where=None):
+        """ read a worksheet directly from an .xlsx / .xlsm file, (no Excel application required)
+
+        the worksheet is parsed one row at a time, numbers with a date format are converted
+        to datetimes, see util.xlsx.read_xlsx()
+
+        :param sheet:      sheet name, or 0-based sheet index, (default is the first sheet)
+        :param header_row: Excel row number of the header row, rows above are skipped
+        :param usecols:    see .from_csv()
+        :param where:      see .from_csv()
+
+        eg:
+            flux = flux_cls.from_file('file.xlsx', sheet='Sheet1', header_row=3)
+        """
+        if usecols is None and where is None:
+            m = read_file(path, filetype='.xlsx', sheet=sheet, header_row=header_row, nrows=nrows)
+        else:
+            chunks = iter_file(path, filetype='.xlsx', chunksize=1_000,
+                               sheet=sheet, header_row=header_row, nrows=nrows)
+            m      = cls.__pushdown_values(chain.from_iterable(chunks), usecols, where)
+
+        return cls(m)
+
+    @classmethod
+    def iter_xlsx(cls, path,
+                       sheet=None,
+                       header_row=1,
+                       nrows=None,
+                       chunksize=100_000) -> Generator['flux_cls', None, None]:
+        """ yield successive flux_cls chunks of at most chunksize rows from a worksheet
+
+        eg:
+            for flux in flux_cls.iter_xlsx('file.xlsx', sheet='Sheet1', chunksize=50_000):
+                flux.to_csv('file.csv', mode='a')
+        """
+        chunks = iter_file(path, filetype='.xlsx', chunksize=chunksize,
+                           sheet=sheet, header_row=header_row, nrows=nrows)
+
+        return cls.__fluxes_from_chunks(chunks)
+
+    @staticmethod
+    def __values_from_records(records, names=None):
+        """ :return: list of lists, header row first
+
+        :param records: iterable of dictionaries
+        :param names:   fixed column names, keys not in names raise ColumnNameError
+                        if None, names are collected from the keys of all records
+        """
+        is_fixed = (names is not None)
+        names    = list(names or [])
+        name_set = set(names)
+
+        m = [names]
+        for record in records:
+            if not isinstance(record, dict):
+                raise TypeError('json lines records must be objects, not {}'.format(type(record).__name__))
+
+            if not (record.keys() <= name_set):
+                new_names = [k for k in record if k not in name_set]
+                if is_fixed:
+                    raise ColumnNameError('column names {} do not exist in first chunk: {}'.format(new_names, names))
+
+                names.extend(new_names)
+                name_set.update(new_names)
+
+            m.append([*map(record.get, names)])
+
+        num_cols = len(names)
+        for row in m:
+            if len(row) < num_cols:
+                row.extend([None] * (num_cols - len(row)))
+
+        return m
+
     def serialize(self, path, **kwargs):
         """
         *** SECURITY VULNERABILITY ***
@@ -370,21 +928,24 @@ class flux_cls:
         elif t is ...:
             ...
         """
-        return ([*row.values] for row in self.matrix[r_1:r_2])
+        if self.storage == 'columns':
+            return self.matrix.values(r_1, r_2)
+
+        return ([*row.values] for row in self.__rows(r_1, r_2))
 
     def dicts(self, r_1=1, r_2=None) -> Generator[Dict, None, None]:
         names = self.header_names()
-        return (ordereddict(zip(names, row.values)) for row in self.matrix[r_1:r_2])
+        return (ordereddict(zip(names, row.values)) for row in self.__rows(r_1, r_2))
 
     def namedrows(self, r_1=1, r_2=None) -> Generator[namespace_cls, None, None]:
         """ speeds up attribute accesses by about 4x, maintains mutability """
         names = self.header_names()
-        return (namespace_cls(zip(names, row.values)) for row in self.matrix[r_1:r_2])
+        return (namespace_cls(zip(names, row.values)) for row in self.__rows(r_1, r_2))
 
     def namedtuples(self, r_1=1, r_2=None) -> Generator[namedtuple, None, None]:
         """ speeds up attribute accesses by about 4x """
         row_nt = namedtuple('Row', self.header_names(as_strings=True))
-        return (row_nt(*row.values) for row in self.matrix[r_1:r_2])
+        return (row_nt(*row.values) for row in self.__rows(r_1, r_2))
 
     def insert_rows(self, i, rows):
         if self.is_empty():
@@ -403,16 +964,20 @@ class flux_cls:
         if m == [[]]:
             return self
 
+        row_cls = self.__row_class()
+
         if is_append:
-            m = [flux_row_cls(h, row, _i_) for _i_, row in enumerate(m, len(self.matrix))]
+            m = [row_cls(h, row, _i_) for _i_, row in enumerate(m, len(self.matrix))]
         else:
-            m = [flux_row_cls(h, row) for row in m]
+            m = [row_cls(h, row) for row in m]
 
         if is_append:
             self.matrix.extend(m)
         else:
             self.matrix[i:i] = m
 
+        self.__invalidate_indexes()
+
         return self
 
     def append_rows(self, rows):
@@ -441,11 +1006,17 @@ class flux_cls:
         else:
             names = self.__validate_names_not_empty(names, depth_offset=-1)
 
-        rva = self.__row_values_accessor(names)
-        col = (rva(row) for row in self.matrix[1:])
-
         has_multiple_columns = isinstance(names, slice) or \
                                (is_collection(names) and len(names) > 1)
+
+        if self.storage == 'columns' and not callable(names):
+            col = self.__columns_from_column_storage(names, has_multiple_columns)
+            if col is not None:
+                return col
+
+        rva = self.__row_values_accessor(names)
+        col = (rva(row) for row in self.__rows())
+
         if has_multiple_columns:
             col = transpose(col, astype=list)
 
@@ -473,7 +1044,14 @@ class flux_cls:
         headers = self.headers.copy()
         names   = [self.__validate_renamed_or_inserted_column(name, headers) for name in names]
 
-        all_columns  = [row.values for row in self.matrix[1:]]
+        if self.storage == 'columns':
+            all_columns = self.matrix.columns
+            columns     = [[*all_columns[headers[n]]] if n in headers else [None] * self.num_rows
+                           for n in names]
+
+            return self.__reset_column_storage(names, columns)
+
+        all_columns  = [row.values for row in self.__rows()]
         all_columns  = list(transpose(all_columns, astype=list))
         empty_column = [None] * self.num_rows
 
@@ -518,7 +1096,17 @@ class flux_cls:
         is_single_column = (len(names) == 1)
         header_names     = self.header_names() + list(names)
 
-        for row, v in zip(self.matrix[1:], values):
+        if self.storage == 'columns':
+            if is_single_column:
+                self.matrix.columns.append(list(values))
+            elif values:
+                self.matrix.columns.extend(transpose(values, astype=list))
+            else:
+                self.matrix.columns.extend([] for _ in names)
+
+            return self.reset_headers(header_names)
+
+        for row, v in zip(self.__rows(), values):
             if is_single_column:
                 row.values.append(v)
             else:
@@ -574,8 +1162,16 @@ class flux_cls:
 
         indices = sorted([header_names.index(h) for _, h in names])
 
+        if self.storage == 'columns':
+            num_rows = self.num_rows
+
+            for i in indices:
+                self.matrix.columns.insert(i, [None] * num_rows)
+
+            return self.reset_headers(header_names)
+
         for i in indices:
-            for row in self.matrix[1:]:
+            for row in self.__rows():
                 row.values.insert(i, None)
 
         self.reset_headers(header_names)
@@ -613,6 +1209,13 @@ class flux_cls:
 
         indices.sort(reverse=True)
 
+        if self.storage == 'columns':
+            for i in indices:
+                del self.matrix.columns[i]
+                del self.matrix.header_row.values[i]
+
+            return self.reset_headers()
+
         for i in indices:
             for row in self.matrix:
                 del row.values[i]
@@ -640,7 +1243,7 @@ class flux_cls:
         use_existing_headers = (names is None)
         if self.is_empty():
             self.headers = self.__validate_names_as_headers(names)
-            self.matrix  = [flux_row_cls(self.headers, names, 0)]
+            self.matrix  = self.__validate_matrix_storage(self.headers, [names], self.storage)
 
             return self
 
@@ -654,21 +1257,55 @@ class flux_cls:
         if not use_existing_headers:
             self.matrix[0].values = list(headers.keys())
 
+        self.__reset_row_classes()
+        self.__invalidate_indexes()
+
         return self
 
+    def __reset_row_classes(self):
+        """
+        column indices are fixed into the properties of specialized row classes,
+        so every row must be re-assigned to the class for the new header signature
+        (see flux_row_cls.specialized_row_class)
+
+        rows from column storage are created on demand and may be held after headers
+        are modified, so they always use the generic flux_row_cls lookups instead
+        """
+        if self.storage == 'columns':
+            return
+
+        headers = self.headers
+        row_cls = self.__row_class()
+
+        if type(self.matrix[0]) is row_cls:
+            return
+
+        set_class = object.__setattr__
+        for row in self.matrix:
+            if row.headers is headers:
+                set_class(row, '__class__', row_cls)
+
+    def __row_class(self) -> type:
+        if self.storage == 'columns':
+            return flux_row_cls
+
+        return specialized_row_class(self.headers)
+
     def reset_matrix(self, m):
         gc_enabled   = gc.isenabled()
         if gc_enabled: gc.disable()
 
         matrix  = flux_cls.__validate_matrix_as_primitive_values(m)
         headers = flux_cls.__validate_names_as_headers(matrix[0])
-        matrix  = [flux_row_cls(headers, row, i) for i, row in enumerate(matrix)]
+        matrix  = flux_cls.__validate_matrix_storage(headers, matrix, self.storage)
 
         if gc_enabled: gc.enable()
 
         self.headers = headers
         self.matrix  = matrix
 
+        self.__invalidate_indexes()
+
         return self
 
     def execute_commands(self, commands,
@@ -746,6 +1383,7 @@ class flux_cls:
             raise ValueError('nrows must be positive')
 
         del self.matrix[nrows + 1:]
+        self.__invalidate_indexes()
 
         return self
 
@@ -788,21 +1426,324 @@ class flux_cls:
         else:
             raise TypeError('other types must be in (flux_cls, dict or some iterable)')
 
-        for row_self in self.matrix[1:]:
+        for row_self in self.__rows():
             key_both  = rva(row_self)
             row_other = mapping_other.get(key_both)
 
             if row_other:
                 yield row_self, row_other
 
+    def join(self, other, on,
+                          how='inner',
+                          on_other=None,
+                          suffixes=('', '_other')):
+        """ :return: new flux_cls of joined rows, (hash join)
+
+        how:
+            'inner':    rows with matching keys in both self and other
+            'left':     all rows in self, None values where other has no match
+            'right':    all rows in other, None values where self has no match
+            'outer':    all rows in both
+            'semi':     rows in self that have a match in other, (self columns only)
+            'anti':     rows in self that have no match in other, (self columns only)
+
+        every match is joined (many-to-many), unlike .joined_rows(), which only keeps
+        the last row in other for each key
+
+        the hash table is built from raw row values, no flux_row_cls objects are created:
+            'inner' builds on the smaller flux and follows the row order of the larger
+            'right' builds on self and follows the row order of other
+            all others build on other and follow the row order of self
+            ('outer' then appends unmatched rows in other)
+
+        when on_other is None, the key columns in other are merged into the key
+        columns in self, other columns with conflicting names are renamed with suffixes
+
+        eg:
+            flux_c = flux_a.join(flux_b, on='id', how='left')
+            flux_c = flux_a.join(flux_b, on=('year', 'month'), how='outer')
+            flux_c = flux_a.join(flux_b, on='id', on_other='other_id', how='inner')
+        """
+        # region {closure functions}
+        def hash_table(rows, key, value):
+            table = {}
+
+            for values in rows:
+                k = key(values)
+                v = value(values)
+
+                matches = table.get(k)
+                if matches is None: table[k] = [v]
+                else:               matches.append(v)
+
+            return table
+
+        def other_part(c_other):
+            if len(c_other) == 0: return lambda values: ()
+            if len(c_other) == 1: return lambda values: (values[c_other[0]],)
+
+            return itemgetter(*c_other)
+
+        def unmatched_other(k, values_other):
+            values_self = [*none_self]
+            if is_merged_keys:
+                if len(i_self) == 1:
+                    k = (k,)
+
+                for i, v in zip(i_self, k):
+                    values_self[i] = v
+
+            return [*values_self, *values_other]
+        # endregion
+
+        how = self.__validate_join_how(how)
+
+        (i_self,
+         i_other,
+         is_merged_keys,
+         names_self,
+         names_other,
+         c_other) = self.__join_columns(other, on, on_other, suffixes)
+
+        key_self  = itemgetter(*i_self)
+        key_other = itemgetter(*i_other)
+
+        m = []
+
+        if how == 'semi':
+            keys = set(map(key_other, other.__row_values()))
+            m = [[*values] for values in self.__row_values() if key_self(values) in keys]
+        elif how == 'anti':
+            keys = set(map(key_other, other.__row_values()))
+            m = [[*values] for values in self.__row_values() if key_self(values) not in keys]
+        else:
+            none_self  = [None] * len(names_self)
+            none_other = [None] * len(names_other)
+            part_other = other_part(c_other)
+
+            is_built_on_self = (how == 'right') or \
+                               (how == 'inner' and self.num_rows < other.num_rows)
+
+            if is_built_on_self:
+                table = hash_table(self.__row_values(), key_self, lambda values: values)
+
+                for values_other in other.__row_values():
+                    k       = key_other(values_other)
+                    matches = table.get(k)
+
+                    if matches is not None:
+                        values_other = part_other(values_other)
+                        for values_self in matches:
+                            m.append([*values_self, *values_other])
+                    elif how == 'right':
+                        m.append(unmatched_other(k, part_other(values_other)))
+            else:
+                # other's joined values are projected once per row in other, not once per match
+                table   = hash_table(other.__row_values(), key_other, part_other)
+                matched = set()
+
+                for values_self in self.__row_values():
+                    k       = key_self(values_self)
+                    matches = table.get(k)
+
+                    if matches is not None:
+                        for values_other in matches:
+                            m.append([*values_self, *values_other])
+
+                        if how == 'outer':
+                            matched.add(k)
+                    elif how in ('left', 'outer'):
+                        m.append([*values_self, *none_other])
+
+                if how == 'outer':
+                    for k, matches in table.items():
+                        if k not in matched:
+                            m.extend(unmatched_other(k, values_other) for values_other in matches)
+
+        if how in ('semi', 'anti'):
+            m.insert(0, self.header_names())
+        else:
+            m.insert(0, [*names_self, *names_other])
+
+        return self._from_values(m)
+
+    def merge_join(self, other, on,
+                                how='inner',
+                                on_other=None,
+                                suffixes=('', '_other'),
+                                assume_sorted=True):
+        """ :return: new flux_cls of joined rows, (sort-merge join)
+
+        same arguments and columns as .join(), but both fluxes are walked in lockstep,
+        so no hash table is built: extra memory is only needed for the rows in
+        other that share the current key (rows are returned in key order)
+
+        if assume_sorted is True, self and other must already be sorted (ascending)
+        on their join columns, eg from flux.sort('id'), a ValueError is raised otherwise
+        if assume_sorted is False, rows are sorted first (without copying either flux)
+
+        keys are ordered the same as .sort(), (None values last, mixed types grouped by type,
+        see util.iter.sort_key()), and None keys are matched to each other, same as .join()
+
+        eg:
+            flux_a.sort('id')
+            flux_b.sort('id')
+            flux_c = flux_a.merge_join(flux_b, on='id', how='left')
+        """
+        # region {closure functions}
+        def sorted_rows(flux, ska):
+            rows = flux.__rows()
+            if not assume_sorted:
+                rows = sorted(rows, key=ska)
+
+            return rows
+
+        def next_row(rows, ska, name, k_previous):
+            row = next(rows, None)
+            if row is None:
+                return None, None
+
+            k = ska(row)
+            if k_previous is not None and k < k_previous:
+                raise ValueError('{} is not sorted on join columns, '
+                                 'use assume_sorted=False or flux.sort({}) first'.format(name, names_on))
+
+            return row, k
+
+        def unmatched_other(values_other):
+            values_self = [*none_self]
+            if is_merged_keys:
+                for i_s, i_o in zip(i_self, i_other):
+                    values_self[i_s] = values_other[i_o]
+
+            return [*values_self, *part_other(values_other)]
+        # endregion
+
+        how = self.__validate_join_how(how)
+
+        (i_self,
+         i_other,
+         is_merged_keys,
+         names_self,
+         names_other,
+         c_other) = self.__join_columns(other, on, on_other, suffixes)
+
+        names_on  = ', '.join(repr(n) for n in standardize_variable_arity_values(on, depth=1))
+        ska_self, ska_other = flux_cls.__sort_key_accessors([self, other], [i_self, i_other])
+
+        rows_self  = iter(sorted_rows(self, ska_self))
+        rows_other = iter(sorted_rows(other, ska_other))
+
+        none_self  = [None] * len(names_self)
+        none_other = [None] * len(names_other)
+        part_other = itemgetter(*c_other) if len(c_other) > 1 else \
+                     (lambda values: [values[c] for c in c_other])
+
+        is_self_kept  = how in ('left', 'outer', 'anti')
+        is_other_kept = how in ('right', 'outer')
+        is_joined     = how in ('inner', 'left', 'right', 'outer')
+
+        m = []
+
+        row_a, k_a = next_row(rows_self,  ska_self,  'self',  None)
+        row_b, k_b = next_row(rows_other, ska_other, 'other', None)
+
+        while row_a is not None and row_b is not None:
+            if k_a < k_b:
+                if is_self_kept:
+                    m.append([*row_a.values, *none_other] if is_joined else [*row_a.values])
+
+                row_a, k_a = next_row(rows_self, ska_self, 'self', k_a)
+
+            elif k_b < k_a:
+                if is_other_kept:
+                    m.append(unmatched_other(row_b.values))
+
+                row_b, k_b = next_row(rows_other, ska_other, 'other', k_b)
+
+            else:
+                k   = k_a
+                run = []
+                while row_b is not None and k_b == k:
+                    run.append(part_other(row_b.values))
+                    row_b, k_b = next_row(rows_other, ska_other, 'other', k_b)
+
+                while row_a is not None and k_a == k:
+                    if is_joined:
+                        for values_other in run:
+                            m.append([*row_a.values, *values_other])
+                    elif how == 'semi':
+                        m.append([*row_a.values])
+
+                    row_a, k_a = next_row(rows_self, ska_self, 'self', k_a)
+
+        while row_a is not None and is_self_kept:
+            m.append([*row_a.values, *none_other] if is_joined else [*row_a.values])
+            row_a, k_a = next_row(rows_self, ska_self, 'self', k_a)
+
+        while row_b is not None and is_other_kept:
+            m.append(unmatched_other(row_b.values))
+            row_b, k_b = next_row(rows_other, ska_other, 'other', k_b)
+
+        if how in ('semi', 'anti'):
+            m.insert(0, self.header_names())
+        else:
+            m.insert(0, [*names_self, *names_other])
+
+        return self._from_values(m)
+
+    @classmethod
+    def merge_sorted(cls, *fluxes, by, reverse=False):
+        """ :return: new flux_cls, rows from all fluxes merged in a single streaming pass (heapq.merge)
+
+        every flux must have the same columns and already be sorted on by columns,
+        (eg from flux.sort(by) or flux.sort(by, reverse=True)), rows with equal keys
+        are kept in the order of fluxes
+
+        eg:
+            flux_c = flux_cls.merge_sorted(flux_a, flux_b, flux_c, by=('year', 'month'))
+        """
+        if len(fluxes) == 1 and isinstance(fluxes[0], (list, tuple)):
+            fluxes = fluxes[0]
+
+        if not fluxes:
+            raise ValueError('no fluxes submitted')
+
+        invalid = [flux for flux in fluxes if not isinstance(flux, flux_cls)]
+        if invalid:
+            raise TypeError('merge_sorted() expects flux_cls objects, not {}'.format(type(invalid[0])))
+
+        names = fluxes[0].header_names()
+        for flux in fluxes[1:]:
+            if flux.header_names() != names:
+                raise ColumnNameError('all fluxes must have the same columns: \n{}\n{}'.format(names, flux.header_names()))
+
+        skas = flux_cls.__sort_key_accessors(fluxes, [by] * len(fluxes), reverse)
+        rows = heapq.merge(*(flux.__rows() for flux in fluxes), key=skas[0], reverse=reverse)
+
+        m = [[*fluxes[0].matrix[0].values]]
+        m.extend([*row.values] for row in rows)
+
+        return fluxes[0]._from_values(m)
+
     def reverse(self):
-        self.matrix[1:].reverse()
+        """ in-place """
+        if self.storage == 'columns':
+            for column in self.matrix.columns:
+                column.reverse()
+        else:
+            # reverse entire matrix, then move header row back to the front
+            self.matrix.reverse()
+            self.matrix.insert(0, self.matrix.pop())
+
+        self.__invalidate_indexes()
 
         return self
 
     def reversed(self):
+        """ :return: new flux_cls """
         flux = self.copy()
-        flux.matrix[1:] = list(reversed(flux.matrix[1:]))
+        flux.reverse()
 
         return flux
 
@@ -818,9 +1759,11 @@ class flux_cls:
         if not names:
             return self
 
-        self.matrix[1:] = self.__sort_rows(self.matrix[1:],
+        self.matrix[1:] = self.__sort_rows(self.__rows(),
                                            names,
                                            reverse)
+        self.__invalidate_indexes()
+
         return self
 
     def sorted(self, *names, reverse=False):
@@ -836,50 +1779,124 @@ class flux_cls:
             return self.copy()
 
         flux = self.copy()
-        flux.matrix[1:] = self.__sort_rows(flux.matrix[1:],
+        flux.matrix[1:] = self.__sort_rows(flux.__rows(),
                                            names,
                                            reverse)
         return flux
 
-    def __sort_rows(self, rows, names, reverses):
-        reverses = [bool(v) for v in standardize_variable_arity_values(reverses, depth=1)]
+    def nlargest(self, k, *names):
+        """ :return: new flux_cls of k rows with the largest values, (in descending order)
 
-        n = len(names) - len(reverses)
-        reverses.extend([False] * n)
+        equivalent to flux.sorted(*names, reverse=[True] * len(names)).shorten_to(k), (None values
+        last), but the rows are not copied or fully sorted: O(n log k) time and O(k) memory
+
+        eg:
+            flux_b = flux_a.nlargest(100, 'amount')
+        """
+        ska  = flux_cls.__sort_key_accessors([self], [names], reverse=True)[0]
+        rows = heapq.nlargest(k, self.__rows(), key=ska)
 
-        all_true  = all((v is True) for v in reverses)
-        all_false = all((v is False) for v in reverses)
+        return self.__from_rows(rows)
 
-        if all_true or all_false:
-            rva = self.__row_values_accessor(names)
-            rows.sort(key=rva, reverse=reverses[0])
+    def nsmallest(self, k, *names):
+        """ :return: new flux_cls of k rows with the smallest values, (in ascending order)
 
-            return rows
+        equivalent to flux.sorted(*names).shorten_to(k), (None values last),
+        but the rows are not copied or fully sorted: O(n log k) time and O(k) memory
+        """
+        ska  = flux_cls.__sort_key_accessors([self], [names])[0]
+        rows = heapq.nsmallest(k, self.__rows(), key=ska)
+
+        return self.__from_rows(rows)
+
+    def topk_by(self, group_names, k, order_names, reverse=True):
+        """ :return: new flux_cls of the top k rows for each group
+
+        reverse=True:  k rows with the largest order_names values in each group
+        reverse=False: k rows with the smallest order_names values in each group
+
+        one heap of at most k rows is kept for each group: O(n log k) time and
+        O(groups * k) memory, groups are returned in the order they first appear,
+        rows with equal values are kept in their original order, (None values last)
+
+        eg:
+            flux_b = flux_a.topk_by('customer_id', 3, 'amount')
+        """
+        rva_group = self.__row_values_accessor(group_names)
+        ska_order = flux_cls.__sort_key_accessors([self], [order_names], reverse)[0]
+
+        if k <= 0:
+            return self.__from_rows([])
+
+        # the heap for each group keeps its worst entry at heap[0], so entries are
+        # ranked by (value, -i), or (reversed value, -i) for the smallest values
+        if reverse: rank = lambda v: v
+        else:       rank = reversed_value_cls
+
+        heaps = ordereddict()
+        for i, row in enumerate(self.__rows()):
+            g     = rva_group(row)
+            entry = (rank(ska_order(row)), -i, row)
+            heap  = heaps.get(g)
+
+            if heap is None:
+                heaps[g] = [entry]
+            elif len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
 
-        # multiple sorting must be done in reverse order,
-        # with last name sorted first, first name sorted last
-        names    = list(reversed(names))
-        reverses = list(reversed(reverses))
+        rows = []
+        for heap in heaps.values():
+            heap.sort(key=itemgetter(0, 1), reverse=True)
+            rows.extend(entry[2] for entry in heap)
 
-        for name, rev in zip(names, reverses):
-            rva = self.__row_values_accessor(name)
-            rows.sort(key=rva, reverse=rev)
+        return self.__from_rows(rows)
 
-        return rows
+    def __from_rows(self, rows):
+        m = [[*self.matrix[0].values]]
+        m.extend([*row.values] for row in rows)
+
+        return self._from_values(m)
+
+    def __sort_rows(self, rows, names, reverses):
+        reverses = [bool(v) for v in standardize_variable_arity_values(reverses, depth=1)]
+
+        n = len(names) - len(reverses)
+        reverses.extend([False] * n)
+
+        rvas = [self.__row_values_accessor(name) for name in names]
+
+        return sort_by_keys(rows, rvas, reverses)
 
     def filter(self, f, *args, **kwargs):
         """ in-place """
-        self.matrix[1:] = [row for row in self.matrix[1:]
+        self.matrix[1:] = [row for row in self.__rows()
                                if f(row, *args, **kwargs)]
+        self.__invalidate_indexes()
+
         return self
 
     def filtered(self, f, *args, **kwargs):
         """ :return: new flux_cls """
         flux = self.copy()
-        flux.matrix[1:] = [row for row in flux.matrix[1:]
+        flux.matrix[1:] = [row for row in flux.__rows()
                                if f(row, *args, **kwargs)]
         return flux
 
+    def lazy(self):
+        """ :return: flux_query_cls, where operations are recorded and then
+        executed in as few passes as possible when .collect() is called
+
+        eg:
+            flux_b = (flux_a.lazy()
+                            .filter(lambda row: row.col_a > 10)
+                            .sort('col_b')
+                            .unique('col_c')
+                            .collect())
+        """
+        return flux_query_cls(self)
+
     def filter_by_unique(self, *names):
         return self.__filter_unique_rows(*names, in_place=True)
 
@@ -970,18 +1987,80 @@ class flux_cls:
         """ aliased to flux_cls.map_rows_nested() """
         return self.map_rows_nested(*names, rowtype=rowtype)
 
+    def aggregate(self, by=(), **aggregations):
+        """ :return: new flux_cls with one row for each unique value of by columns,
+        (or a single row of totals if by is empty)
+
+        rows are iterated once, and only a running accumulator is kept for each group
+        (unlike .map_rows_append(), which holds every row of every group in memory)
+
+        aggregations are submitted as name=(column, function), where function is one of
+            'sum', 'count', 'mean', 'min', 'max', 'first', 'last', 'count_distinct'
+        or a reducer function f(accumulated, value) -> accumulated, (like functools.reduce)
+
+        * None values are ignored by every function except 'first', 'last' and reducers
+        * 'sum', 'mean', 'min' and 'max' of a group without any values are None, 'count' is 0
+        * column '*' counts rows, eg n=('*', 'count')
+
+        eg:
+            flux_b = flux_a.aggregate(by=('year', 'month'),
+                                      total=('random_float', 'sum'),
+                                      avg=('random_float', 'mean'),
+                                      n=('*', 'count'))
+        """
+        by = self.__validate_standardize_names(by, self.headers, depth_offset=-1)
+        by = self.__validate_names_as_indices(by, self.headers)
+        if by:
+            rva = self.__row_values_accessor(by if len(by) > 1 else by[0])
+        else:
+            rva = lambda row: ()
+
+        has_multiple_columns = len(by) > 1
+        accumulators = self.__validate_aggregations(aggregations, self.headers)
+
+        names   = [*[self.matrix[0].values[c] for c in by], *aggregations.keys()]
+        indices = [c for c, _, _ in accumulators]
+        updates = [update for _, update, _ in accumulators]
+        num_acc = len(accumulators)
+
+        groups = ordereddict()
+        if not by:
+            groups[()] = [None] * num_acc           # a grand total has one row, even without any rows
+        for row in self.__rows():
+            k = rva(row)
+
+            states = groups.get(k)
+            if states is None:
+                states = groups[k] = [None] * num_acc
+
+            values = row.values
+            for j in range(num_acc):
+                c = indices[j]
+                states[j] = updates[j](states[j], None if c is None else values[c])
+
+        finals = [final for _, _, final in accumulators]
+
+        m = [names]
+        for k, states in groups.items():
+            if not has_multiple_columns:
+                k = (k,) if by else ()
+
+            m.append([*k, *[final(state) for final, state in zip(finals, states)]])
+
+        return self._from_values(m)
+
     def __zip_keys_and_rows(self, names, rowtype):
         rowtype = self.__validate_mapped_rowtype(rowtype)
 
         rva  = self.__row_values_accessor(names)
-        keys = (rva(row) for row in self.matrix[1:])
+        keys = (rva(row) for row in self.__rows())
 
-        if rowtype   == 'flux_row_cls': values = iter(self.matrix[1:])
+        if rowtype   == 'flux_row_cls': values = self.__rows()
         elif rowtype == 'dict':         values = self.dicts()
         elif rowtype == 'namedrow':     values = self.namedrows()
         elif rowtype == 'namedtuple':   values = self.namedtuples()
-        elif rowtype == 'list':         values = (list(row.values)  for row in self.matrix[1:])
-        elif rowtype == 'tuple':        values = (tuple(row.values) for row in self.matrix[1:])
+        elif rowtype == 'list':         values = (list(row.values)  for row in self.__rows())
+        elif rowtype == 'tuple':        values = (tuple(row.values) for row in self.__rows())
         else:
             raise TypeError('invalid rowtype: {}'.format(rowtype))
 
@@ -993,7 +2072,7 @@ class flux_cls:
         that's why ordereddict keys are returned instead of a set
         """
         rva   = self.__row_values_accessor(names)
-        items = ((rva(row), None) for row in self.matrix[1:])
+        items = ((rva(row), None) for row in self.__rows())
 
         return ordereddict(items).keys()
 
@@ -1008,7 +2087,7 @@ class flux_cls:
                                                   'i_2',
                                                   'rows'))
 
-        rows = iter(self.matrix[1:])
+        rows = self.__rows()
         rva  = self.__row_values_accessor(names)
 
         v_1 = rva(next(rows))
@@ -1046,12 +2125,12 @@ class flux_cls:
         return range(start, stop, step)
 
     def enumerate(self, start=1, stop=None):
-        return enumerate(self.matrix[start:stop], start)
+        return enumerate(self.__rows(start, stop), start)
 
     def label_rows(self, start=0, label_function=None):
         """ meant to assist with debugging;
 
-        label each flux_row_cls.__dict__ with an index, which will then appear
+        label each flux_row_cls.row_label with an index, which will then appear
         in each row's __repr__ function and make them easier to identify after
         filtering, sorting, etc
         """
@@ -1071,19 +2150,210 @@ class flux_cls:
 
         return self
 
+    # region {index methods}
+    def create_index(self, name, kind='hash'):
+        """ secondary index on a single column, for fast .lookup(), .where() and .between()
+
+        kind='hash':   O(1) lookups of equal values
+        kind='sorted': O(log n) lookups of equal values and value ranges
+
+        indexes are kept up to date when rows are added, removed or reordered through
+        flux_cls methods (eg, .append_rows(), .sort(), .filter(), .reset_matrix()), they
+        are rebuilt the next time they are used, but indexes are not copied to new
+        flux_cls objects
+
+        modifying indexed values directly through rows is not tracked, in that case
+        call .create_index() again
+
+        eg:
+            flux.create_index('customer_id')
+            flux.create_index('date', kind='sorted')
+
+            rows = flux.lookup('customer_id', 1001)
+            rows = flux.where(customer_id=1001, year=2020)
+            rows = flux.between('date', date_1, date_2)
+        """
+        kind = self.__validate_index_kind(kind)
+        i    = self.__validate_names_as_indices(name, self.headers)[0]
+        name = list(self.headers.keys())[i]
+
+        index = flux_index_cls(name, kind)
+        self._indexes[name] = index.build(self.matrix, i, self.__rows())
+
+        return self
+
+    def drop_index(self, name=None):
+        """ drop index on column name, or all indexes if name is None """
+        if name is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(name, None)
+
+        return self
+
+    def lookup(self, name, value) -> List[flux_row_cls]:
+        """ :return: list of rows where column value equals value
+
+        uses index on name if one exists, (see .create_index()), otherwise rows are scanned
+        """
+        index = self.__current_index(name)
+        if index is not None:
+            return index.lookup(value)
+
+        i = self.__validate_names_as_indices(name, self.headers)[0]
+
+        return [row for row in self.__rows() if row.values[i] == value]
+
+    def where(self, **names_and_values) -> List[flux_row_cls]:
+        """ :return: list of rows where every column value equals its value
+
+        the smallest result from any indexed columns is used as the candidate rows,
+        remaining columns are then compared directly
+
+        eg:
+            rows = flux.where(customer_id=1001, year=2020)
+        """
+        if not names_and_values:
+            raise ValueError('no column values submitted, eg: flux.where(col_a=1)')
+
+        indices = self.__validate_names_as_indices(list(names_and_values.keys()), self.headers)
+        values  = list(names_and_values.values())
+
+        rows = None
+        for name, value in names_and_values.items():
+            index = self.__current_index(name)
+            if index is None:
+                continue
+
+            indexed_rows = index.lookup(value)
+            if rows is None or len(indexed_rows) < len(rows):
+                rows = indexed_rows
+
+        if rows is None:
+            rows = self.__rows()
+
+        return [row for row in rows if all(row.values[i] == v for i, v in zip(indices, values))]
+
+    def between(self, name, value_1, value_2) -> List[flux_row_cls]:
+        """ :return: list of rows where value_1 <= column value <= value_2, (None values excluded)
+
+        uses sorted index on name if one exists (rows are returned in value order),
+        otherwise rows are scanned (rows are returned in matrix order)
+
+        eg:
+            flux.create_index('date', kind='sorted')
+            rows = flux.between('date', date_1, date_2)
+        """
+        index = self.__current_index(name)
+        if index is not None and index.kind == 'sorted':
+            return index.between(value_1, value_2)
+
+        i = self.__validate_names_as_indices(name, self.headers)[0]
+
+        return [row for row in self.__rows()
+                    if row.values[i] is not None and value_1 <= row.values[i] <= value_2]
+
+    def __current_index(self, name):
+        """ :return: flux_index_cls on column name, rebuilt if stale, or None if not indexed """
+        index = self._indexes.get(name)
+        if index is None:
+            return None
+
+        if not index.is_current(self.matrix):
+            i = self.headers[name]
+            index.build(self.matrix, i, self.__rows())
+
+        return index
+
+    def __invalidate_indexes(self):
+        """ mark indexes as stale, drop indexes on columns that no longer exist """
+        for name, index in list(self._indexes.items()):
+            if name in self.headers:
+                index.is_stale = True
+            else:
+                del self._indexes[name]
+    # endregion
+
     def copy(self, deep=False):
         if deep:
             return deepcopy(self)
 
+        return self._from_values(list(self.values()))
+
+    def _from_values(self, values):
+        """ :return: new flux_cls of the same class, storage and attributes as self
+
+        :param values: list of lists, headers in first row
+        """
         other_attributes = {k: v for k, v in self.__dict__.items()
-                                 if k not in {'headers', 'matrix'}}
+                                 if k not in {'headers', 'matrix', '_indexes'}}
+
+        if self.storage == 'columns':
+            flux = self.__class__(values, storage='columns')
+        else:
+            flux = self.__class__(values)
 
-        values = [[*row.values] for row in self.matrix]
-        flux = self.__class__(values)
         flux.__dict__.update(other_attributes)
 
         return flux
 
+    def __join_columns(self, other, on, on_other, suffixes):
+        """ :return: (i_self, i_other, is_merged_keys, names_self, names_other, c_other)
+
+        when on_other is None, the key columns in other are merged into the key columns
+        in self (and excluded from c_other, the columns in other that are joined)
+        """
+        if not isinstance(other, flux_cls):
+            raise TypeError('other must be a flux_cls')
+
+        is_merged_keys = (on_other is None)
+        if is_merged_keys:
+            on_other = on
+
+        i_self  = self.__validate_names_as_indices(on, self.headers)
+        i_other = self.__validate_names_as_indices(on_other, other.headers)
+        if len(i_self) != len(i_other):
+            raise ValueError('number of join columns do not match: {} and {}'.format(len(i_self), len(i_other)))
+
+        names_self  = self.header_names()
+        names_other = other.header_names()
+
+        if is_merged_keys: c_other = [c for c in range(len(names_other)) if c not in set(i_other)]
+        else:              c_other = list(range(len(names_other)))
+
+        names_other = [names_other[c] for c in c_other]
+        conflicting = set(names_self) & set(names_other)
+
+        names_self  = [n + suffixes[0] if n in conflicting else n for n in names_self]
+        names_other = [n + suffixes[1] if n in conflicting else n for n in names_other]
+
+        return i_self, i_other, is_merged_keys, names_self, names_other, c_other
+
+    def __row_values(self) -> Iterator[List]:
+        """ values of each row (excluding header), without copying lists in row storage
+        or creating flux_row_cls objects in columnar storage
+        """
+        if self.storage == 'columns':
+            return self.matrix.values(1)
+
+        return (row.values for row in self.__rows())
+
+    def __rows(self, r_1=1, r_2=None) -> Iterator[flux_row_cls]:
+        """ zero-copy iteration over self.matrix[r_1:r_2]
+
+        slicing self.matrix copies every row pointer before doing any work,
+        (eg, each self.matrix[1:] on a 20M row matrix allocates a 160 MB temporary list)
+        """
+        if self.storage == 'columns':
+            return self.matrix.rows(r_1, r_2)
+
+        has_negative_index = (r_1 is not None and r_1 < 0) or \
+                             (r_2 is not None and r_2 < 0)
+        if has_negative_index:
+            r_1, r_2, _ = slice(r_1, r_2).indices(len(self.matrix))
+
+        return islice(self.matrix, r_1, r_2)
+
     def row_values_accessor(self, *names) -> callable:
         """ public method for .__row_values_accessor()
 
@@ -1123,6 +2393,91 @@ class flux_cls:
 
         return rva
 
+    @staticmethod
+    def __sort_key_accessors(fluxes, names, reverse=False) -> List[callable]:
+        """ :return: a function for each flux, that can be called for each of its rows
+        to retrieve sort keys that can be compared across all fluxes, in the same order as .sort()
+
+        :param names: column names for each flux, (the same number of columns in each)
+
+        column values are compared as they are, unless any column has None values or values
+        of mixed types, (see util.iter.is_directly_sortable()), in which case they are
+        wrapped in util.iter.sort_key() for every row
+        """
+        # region {closure functions}
+        def column_indices(flux, n):
+            rva_name, rva_indices = flux.__validate_row_values_accessor(n, flux.headers)
+
+            if rva_name == 'callable':
+                return None
+            if rva_name == 'row_value':
+                return [rva_indices]
+            if isinstance(rva_indices, slice):
+                return list(range(flux.num_cols))[rva_indices]
+
+            return rva_indices
+
+        def is_column_sortable(indices):
+            values = chain.from_iterable(flux.columns(i) for flux, i in zip(fluxes, indices))
+            return is_directly_sortable(values)
+
+        def sort_key_accessor(flux, n):
+            # region {closure functions}
+            def row_sort_key(row):
+                return sort_key(rva(row), reverse)
+
+            def row_sort_keys(row):
+                return tuple([sort_key(v, reverse) for v in rva(row)])
+            # endregion
+
+            rva_name, _ = flux.__validate_row_values_accessor(n, flux.headers)
+            rva         = flux.__row_values_accessor(n)
+
+            if is_sortable:
+                return rva
+            if rva_name in ('row_value', 'callable'):
+                return row_sort_key
+
+            return row_sort_keys
+        # endregion
+
+        indices = [column_indices(flux, n) for flux, n in zip(fluxes, names)]
+
+        if any(i is None for i in indices):
+            is_sortable = False
+        else:
+            is_sortable = all(is_column_sortable(indices_c) for indices_c in zip(*indices))
+
+        return [sort_key_accessor(flux, n) for flux, n in zip(fluxes, names)]
+
+    def __columns_from_column_storage(self, names, has_multiple_columns):
+        """ column values are read directly from column_matrix_cls.columns, without visiting any rows """
+        columns = self.matrix.columns
+        rva_name, rva_indices = self.__validate_row_values_accessor(names, self.headers)
+
+        if rva_name == 'row_value':
+            return iter(columns[rva_indices])
+
+        if not has_multiple_columns:
+            return None
+
+        # copied immediately, same as transpose() of row storage
+        if rva_name == 'row_values':
+            return iter([[*columns[i]] for i in rva_indices])
+
+        return iter([[*column] for column in columns[rva_indices]])
+
+    def __reset_column_storage(self, names, columns):
+        headers    = self.__validate_names_as_headers(names)
+        header_row = flux_row_cls(headers, list(headers.keys()), 0)
+
+        self.headers = headers
+        self.matrix  = column_matrix_cls(headers, header_row, columns)
+
+        self.__invalidate_indexes()
+
+        return self
+
     def __len__(self):
         """ includes header row, see self.num_rows """
         return len(self.matrix)
@@ -1173,7 +2528,13 @@ class flux_cls:
             values = self.__validate_column_value_dimensions([name], values)
             i      = self.__validate_names_as_indices(name, self.headers)[0]
 
-            for row, v in zip(self.matrix[1:], values):
+            self.__invalidate_indexes()
+
+            if self.storage == 'columns':
+                self.matrix.columns[i] = list(values)
+                return
+
+            for row, v in zip(self.__rows(), values):
                 row.values[i] = v
 
     def __iter__(self) -> Iterator[flux_row_cls]:
@@ -1182,10 +2543,10 @@ class flux_cls:
             for row in flux:
                 row.col_a = 'a'
         """
-        return iter(self.matrix[1:])
+        return self.__rows()
 
     def __reversed__(self):
-        return reversed(self.matrix[1:])
+        return islice(reversed(self.matrix), self.num_rows)
 
     def __add__(self, rows):
         flux = self.copy()
@@ -1196,36 +2557,39 @@ class flux_cls:
     def __iadd__(self, rows):
         return self.append_rows(rows)
 
+    def __copy__(self):
+        """ called by copy.copy: rows are copied, (the state from __getstate__ shares them) """
+        return self.copy()
+
     def __getstate__(self):
         """
         called by deepcopy and pickle.dump
-        """
-        args   = []
-        kwargs = ordereddict()
-        params = function_parameters(self.__class__)
 
-        for p in params:
-
-            if p.name   == 'self':      continue
-            elif p.name == 'matrix':    p.value = [[*row.values] for row in self.matrix]
-            elif p.name == 'headers':   p.value = deepcopy(self.headers)
-            elif hasattr(self, p.name): p.value = deepcopy(getattr(self, p.name))
+        compact state of headers and raw row values (or raw columns, for storage='columns'),
+        without copying any rows: pickle serializes the values lists directly, and deepcopy
+        copies the state on its own (copy.copy goes through __copy__ instead)
+        """
+        if self.storage == 'columns':
+            values = self.matrix.columns
+        else:
+            values = [row.values for row in self.__rows()]
 
-            elif hasattr(p.value, '__name__') and p.value.__name__ == '_empty':
-                error_repr = '__init__({}):'.format(', '.join(p.name for p in params))
-                raise ValueError("{} unable to resolve argument '{}'".format(error_repr, p.name))
+        attributes = {k: v for k, v in self.__dict__.items()
+                           if k not in {'headers', 'matrix', '_indexes'}}
+        indexes    = [(index.name, index.kind) for index in self._indexes.values()]
 
-            if 'positional' in p.kind.lower():
-                args.append(p.value)
-            else:
-                kwargs[p.name] = p.value
-
-        return {'args':   tuple(args),
-                'kwargs': kwargs}
+        return {'headers':    self.headers.copy(),
+                'names':      list(self.matrix[0].values),
+                'storage':    self.storage,
+                'values':     values,
+                'indexes':    indexes,
+                'attributes': attributes}
 
     def __setstate__(self, state):
         """
         called by deepcopy and pickle.load
+
+        rows are rebuilt directly from the state, without the validation in __init__
         """
         if not isinstance(state, dict):
             # return self.__init__(state)
@@ -1235,8 +2599,28 @@ class flux_cls:
                            'kwargs' in state)
         if use_constructor:
             self.__init__(*state['args'], **state['kwargs'])
+            return
+
+        headers = state['headers']
+        names   = state['names']
+
+        gc_enabled   = gc.isenabled()
+        if gc_enabled: gc.disable()
+
+        if state['storage'] == 'columns':
+            header_row = flux_row_cls(headers, names, 0)
+            matrix     = column_matrix_cls(headers, header_row, state['values'])
         else:
-            self.__dict__.update(state)
+            row_cls = specialized_row_class(headers)
+            matrix  = [row_cls(headers, values, i) for i, values in enumerate(chain([names], state['values']))]
+
+        if gc_enabled: gc.enable()
+
+        self.__dict__.update(state['attributes'])
+
+        self.headers  = headers
+        self.matrix   = matrix
+        self._indexes = {name: flux_index_cls(name, kind) for name, kind in state['indexes']}
 
     def __repr__(self):
         class_name   = self.__class__.__name__
@@ -1264,6 +2648,67 @@ class flux_cls:
         return '{}: {}{} {}'.format(class_name, jagged_label, num_rows, headers)
 
     # region {validation functions}
+    @staticmethod
+    def __validate_storage(storage):
+        valid_storages = ('rows',
+                          'columns')
+
+        _storage_ = str(storage).lower()
+        if not _storage_.endswith('s'):
+            _storage_ += 's'
+
+        if _storage_ not in valid_storages:
+            raise ValueError("invalid storage: '{}', storage should be in {}".format(storage, valid_storages))
+
+        return _storage_
+
+    @staticmethod
+    def __validate_index_kind(kind):
+        valid_kinds = ('hash',
+                       'sorted')
+
+        _kind_ = str(kind).lower()
+        if _kind_ not in valid_kinds:
+            raise ValueError("invalid index kind: '{}', kind should be in {}".format(kind, valid_kinds))
+
+        return _kind_
+
+    @staticmethod
+    def __validate_json_orient(orient):
+        valid_orients = ('records',
+                         'split',
+                         'columns',
+                         'values')
+
+        _orient_ = str(orient).lower()
+        if _orient_ not in valid_orients:
+            raise ValueError("invalid orient: '{}', orient should be in {}".format(orient, valid_orients))
+
+        return _orient_
+
+    @staticmethod
+    def __validate_join_how(how):
+        valid_hows = ('inner',
+                      'left',
+                      'right',
+                      'outer',
+                      'semi',
+                      'anti')
+
+        _how_ = str(how).lower()
+        if _how_ not in valid_hows:
+            raise ValueError("invalid join: '{}', how should be in {}".format(how, valid_hows))
+
+        return _how_
+
+    @staticmethod
+    def __validate_matrix_storage(headers, matrix, storage):
+        if storage == 'columns':
+            return column_matrix_cls.from_rows(headers, matrix)
+
+        row_cls = specialized_row_class(headers)
+        return [row_cls(headers, row, i) for i, row in enumerate(matrix)]
+
     @staticmethod
     def __validate_names_as_headers(names):
         headers = map_values_to_enum(names)
@@ -1397,6 +2842,121 @@ class flux_cls:
 
         return rva_name, rva_indices
 
+    @staticmethod
+    def __validate_aggregations(aggregations, headers):
+        """ :return: list of (column index, update function, final function) for each aggregation
+
+        each group's accumulated state starts as None, so 'first', 'last' and reducer
+        states are wrapped in a 1-tuple, where None may be a legitimate value
+        """
+        # region {closure functions}
+        def agg_sum(s, v):
+            if v is None: return s
+            if s is None: return v
+            return s + v
+
+        def agg_count(s, v):
+            if v is None: return s
+            return (s or 0) + 1
+
+        def agg_count_rows(s, v):
+            return (s or 0) + 1
+
+        def agg_mean(s, v):
+            if v is None: return s
+            if s is None: return [v, 1]
+            s[0] += v
+            s[1] += 1
+            return s
+
+        def agg_min(s, v):
+            if v is None:           return s
+            if s is None or v < s:  return v
+            return s
+
+        def agg_max(s, v):
+            if v is None:           return s
+            if s is None or v > s:  return v
+            return s
+
+        def agg_first(s, v):
+            if s is None: return (v,)
+            return s
+
+        def agg_last(s, v):
+            return (v,)
+
+        def agg_count_distinct(s, v):
+            if v is None: return s
+            if s is None: s = set()
+            s.add(v)
+            return s
+
+        def agg_reducer(f):
+            def reduce_value(s, v):
+                if s is None: return (v,)
+                return (f(s[0], v),)
+
+            return reduce_value
+
+        def final_value(s):
+            return s
+
+        def final_zero(s):
+            return s or 0
+
+        def final_mean(s):
+            if s is None: return None
+            return s[0] / s[1]
+
+        def final_is_set(s):
+            if s is None: return None
+            return s[0]
+
+        def final_count_distinct(s):
+            if s is None: return 0
+            return len(s)
+        # endregion
+
+        functions = {'sum':            (agg_sum,            final_value),
+                     'count':          (agg_count,          final_zero),
+                     'mean':           (agg_mean,           final_mean),
+                     'min':            (agg_min,            final_value),
+                     'max':            (agg_max,            final_value),
+                     'first':          (agg_first,          final_is_set),
+                     'last':           (agg_last,           final_is_set),
+                     'count_distinct': (agg_count_distinct, final_count_distinct)}
+
+        if not aggregations:
+            raise ValueError('no aggregations submitted, eg: flux.aggregate(by=\'col_a\', total=(\'col_b\', \'sum\'))')
+
+        accumulators = []
+        for name, agg in aggregations.items():
+            if not (isinstance(agg, (list, tuple)) and len(agg) == 2):
+                raise TypeError("aggregation '{}' must be a (column, function) tuple, not {}".format(name, agg))
+
+            column, f = agg
+
+            if callable(f):
+                update, final = agg_reducer(f), final_is_set
+            elif isinstance(f, str) and f.lower() in functions:
+                update, final = functions[f.lower()]
+            else:
+                raise ValueError("invalid aggregation function for '{}': {}, "
+                                 "\nvalid functions: {}, or a reducer function".format(name, f, list(functions)))
+
+            if column == '*':
+                if update is not agg_count:
+                    raise ValueError("column '*' is only valid for 'count', eg: n=('*', 'count')")
+
+                c, update = None, agg_count_rows
+            else:
+                c = flux_cls.__validate_names_as_indices(column, headers)[0]
+
+            accumulators.append((c, update, final))
+
+        return accumulators
+
     @staticmethod
     def __validate_mapped_rowtype(rowtype):
         valid_datatypes = ('flux_row_cls',
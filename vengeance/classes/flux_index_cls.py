@@ -0,0 +1,111 @@
+
+from bisect import bisect_left
+from bisect import bisect_right
+from operator import itemgetter
+
+
+class flux_index_cls:
+    """ secondary index on a single column of a flux_cls, see flux_cls.create_index()
+
+    kind='hash'
+        {value: [row, row, ...]}, O(1) lookups of equal values
+    kind='sorted'
+        parallel lists of sorted values and rows, O(log n) lookups of
+        equal values and of value ranges (rows with None values are kept
+        separately, and are only returned by lookups of None)
+
+    rows are returned in their order in flux.matrix, (or in value order
+    for ranges from a sorted index)
+
+    the index only holds row references: it is marked stale by the flux_cls methods
+    that add, remove or reorder rows and is rebuilt the next time it is used, but
+    modifying indexed values directly through rows (eg, row.col_a = 'a') is not tracked
+    """
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+
+        self.is_stale = True
+        self.matrix   = None
+        self.num_rows = None
+
+        self.mapping   = None
+        self.keys      = None
+        self.rows      = None
+        self.none_rows = None
+
+    def is_current(self, matrix):
+        return (not self.is_stale) and \
+               (self.matrix is matrix) and \
+               (self.num_rows == len(matrix))
+
+    def build(self, matrix, i, rows):
+        """
+        :param matrix: flux.matrix, to detect modifications made directly to the matrix
+        :param i:      column index of self.name
+        :param rows:   iterable of flux_row_cls, excluding header row
+        """
+        if self.kind == 'hash':
+            mapping = {}
+
+            for row in rows:
+                v = row.values[i]
+
+                matches = mapping.get(v)
+                if matches is None: mapping[v] = [row]
+                else:               matches.append(row)
+
+            self.mapping = mapping
+        else:
+            pairs = [(row.values[i], row) for row in rows]
+
+            self.none_rows = [row for v, row in pairs if v is None]
+            pairs          = [p for p in pairs if p[0] is not None]
+
+            try:
+                pairs.sort(key=itemgetter(0))
+            except TypeError as e:
+                raise TypeError("sorted index on '{}' requires comparable values: {}".format(self.name, e)) from e
+
+            self.keys = [v for v, _ in pairs]
+            self.rows = [row for _, row in pairs]
+
+        self.is_stale = False
+        self.matrix   = matrix
+        self.num_rows = len(matrix)
+
+        return self
+
+    def lookup(self, value):
+        if self.kind == 'hash':
+            return list(self.mapping.get(value, ()))
+
+        if value is None:
+            return list(self.none_rows)
+
+        # a value that cannot be compared to the indexed values is not equal to any of them
+        try:
+            i_1 = bisect_left(self.keys, value)
+            i_2 = bisect_right(self.keys, value, i_1)
+        except TypeError:
+            return []
+
+        return self.rows[i_1:i_2]
+
+    def between(self, value_1, value_2):
+        """ values are inclusive: value_1 <= v <= value_2 """
+        if self.kind == 'hash':
+            raise TypeError("range queries require kind='sorted', "
+                            "index on '{}' is kind='hash'".format(self.name))
+
+        i_1 = bisect_left(self.keys, value_1)
+        i_2 = bisect_right(self.keys, value_2, i_1)
+
+        return self.rows[i_1:i_2]
+
+    def __repr__(self):
+        stale_label = ' (stale)' if self.is_stale else ''
+        return "{}: '{}', kind='{}'{}".format(self.__class__.__name__,
+                                             self.name,
+                                             self.kind,
+                                             stale_label)
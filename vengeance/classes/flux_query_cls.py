@@ -0,0 +1,213 @@
+
+from collections import namedtuple
+from itertools import chain
+from itertools import islice
+
+from typing import Generator
+
+from .flux_row_cls import specialized_row_class
+
+from ..util.iter import standardize_variable_arity_values
+from ..util.iter import sort_by_keys
+from ..util.text import function_name
+
+
+class flux_query_cls:
+    """ lazy query pipeline, see flux_cls.lazy()
+
+    operations are only recorded until .collect() is called, which then executes
+    all of them in as few passes over the rows as possible and returns a new flux_cls
+
+    eg:
+        flux_b = (flux_a.lazy()
+                        .filter(lambda row: row.col_a > 10)
+                        .sort('col_b')
+                        .unique('col_c')
+                        .map(f)
+                        .collect())
+
+    compare to:
+        flux_b = flux_a.filtered(lambda row: row.col_a > 10)    # full copy of every row
+        flux_b = flux_b.sorted('col_b')                          # full copy of every row
+        flux_b = flux_b.filtered_by_unique('col_c')              # full copy of every row
+
+    * filters are moved ahead of sorts, so that fewer rows need to be sorted
+    * consecutive sorts are combined into a single sort
+    * filter, unique, map and shorten_to operations between sorts are evaluated in one pass
+    * rows are only copied once: for the new flux_cls returned by .collect(), or before
+      the first .map() operation, so that the original flux is never modified
+
+    because filters may be moved, filter functions should not depend on the order in
+    which rows are evaluated
+    """
+    operation_nt = namedtuple('Operation', ('name',
+                                            'args',
+                                            'kwargs'))
+
+    def __init__(self, flux):
+        """ :type flux: vengeance.flux_cls """
+        self.flux       = flux
+        self.operations = []
+
+    def filter(self, f, *args, **kwargs):
+        """ eg: .filter(lambda row: row.col_a > 10) """
+        return self.__append_operation('filter', (f,) + args, kwargs)
+
+    def sort(self, *names, reverse=False):
+        """ eg: .sort('col_a', 'col_b', reverse=[True, False]) """
+        names = standardize_variable_arity_values(names, depth=1)
+        if not names:
+            return self
+
+        reverses = [bool(v) for v in standardize_variable_arity_values(reverse, depth=1)]
+        reverses.extend([False] * (len(names) - len(reverses)))
+
+        return self.__append_operation('sort', (names, reverses), {})
+
+    def unique(self, *names):
+        """ keep first row for each unique value, (like flux_cls.filter_by_unique) """
+        return self.__append_operation('unique', names, {})
+
+    def map(self, f, *args, **kwargs):
+        """ f(row) is called for each row, to modify row values in-place
+
+        eg:
+            def f(row):
+                row.col_a = row.col_a.upper()
+        """
+        return self.__append_operation('map', (f,) + args, kwargs)
+
+    def shorten_to(self, nrows):
+        if nrows < 0:
+            raise ValueError('nrows must be positive')
+
+        return self.__append_operation('shorten_to', (nrows,), {})
+
+    def plan(self):
+        """ :return: list of Operations in the order they will be executed
+
+        * filters are moved ahead of any immediately preceding sorts
+        * consecutive sorts are combined, eg
+            .sort('col_a').sort('col_b')  ->  .sort('col_b', 'col_a')
+        """
+        planned = []
+
+        for op in self.operations:
+            if op.name == 'filter':
+                i = len(planned)
+                while i > 0 and planned[i - 1].name == 'sort':
+                    i -= 1
+
+                planned.insert(i, op)
+
+            elif op.name == 'sort' and planned and self.__are_sorts_combinable(planned[-1], op):
+                names_1, reverses_1 = planned[-1].args
+                names_2, reverses_2 = op.args
+
+                planned[-1] = self.operation_nt('sort', (list(names_2) + list(names_1),
+                                                         list(reverses_2) + list(reverses_1)), {})
+            else:
+                planned.append(op)
+
+        return planned
+
+    def collect(self):
+        """ :return: new flux_cls """
+        flux   = self.flux
+        header = [[*flux.matrix[0].values]]
+        rows   = iter(flux)
+
+        is_copied = False
+
+        for op in self.plan():
+            if op.name == 'filter':
+                f, *args = op.args
+                rows     = self.__filtered_rows(rows, f, args, op.kwargs)
+
+            elif op.name == 'unique':
+                rva  = flux.row_values_accessor(*op.args)
+                rows = self.__unique_rows(rows, rva)
+
+            elif op.name == 'map':
+                if not is_copied:
+                    rows      = self.__copied_rows(rows, flux.headers)
+                    is_copied = True
+
+                f, *args = op.args
+                rows     = self.__mapped_rows(rows, f, args, op.kwargs)
+
+            elif op.name == 'sort':
+                names, reverses = op.args
+                rows = self.__sorted_rows(rows, names, reverses)
+
+            elif op.name == 'shorten_to':
+                rows = islice(rows, op.args[0])
+
+        if is_copied:
+            values = (row.values for row in rows)
+        else:
+            values = ([*row.values] for row in rows)
+
+        return flux._from_values(list(chain(header, values)))
+
+    def __sorted_rows(self, rows, names, reverses):
+        rvas = [self.flux.row_values_accessor(name) for name in names]
+        return sort_by_keys(rows, rvas, reverses)
+
+    @staticmethod
+    def __filtered_rows(rows, f, args, kwargs) -> Generator:
+        for row in rows:
+            if f(row, *args, **kwargs):
+                yield row
+
+    @staticmethod
+    def __unique_rows(rows, rva) -> Generator:
+        u = set()
+
+        for row in rows:
+            v = rva(row)
+
+            if v not in u:
+                u.add(v)
+                yield row
+
+    @staticmethod
+    def __mapped_rows(rows, f, args, kwargs) -> Generator:
+        for row in rows:
+            f(row, *args, **kwargs)
+            yield row
+
+    @staticmethod
+    def __copied_rows(rows, headers) -> Generator:
+        row_cls = specialized_row_class(headers)
+
+        for row in rows:
+            yield row_cls(headers, [*row.values], row.row_label)
+
+    @staticmethod
+    def __are_sorts_combinable(op_1, op_2):
+        if op_1.name != 'sort' or op_2.name != 'sort':
+            return False
+
+        names = list(op_1.args[0]) + list(op_2.args[0])
+
+        return not any(callable(n) or isinstance(n, slice) for n in names)
+
+    def __append_operation(self, name, args, kwargs):
+        self.operations.append(self.operation_nt(name, tuple(args), kwargs))
+        return self
+
+    def __repr__(self):
+        ops = []
+        for op in self.plan():
+            if op.name in ('filter', 'map'):
+                f, *args = op.args
+                ops.append('.{}({})'.format(op.name, function_name(f)))
+            elif op.name == 'sort':
+                ops.append('.sort({}, reverse={})'.format(*op.args))
+            else:
+                ops.append('.{}({})'.format(op.name, ', '.join(repr(a) for a in op.args)))
+
+        return '{}: {}.lazy(){}'.format(self.__class__.__name__,
+                                        self.flux.__class__.__name__,
+                                        ''.join(ops))
@@ -2,6 +2,7 @@
 from collections import namedtuple
 from copy import copy
 from copy import deepcopy
+from functools import lru_cache
 from typing import Dict
 from typing import List
 from typing import Union
@@ -22,6 +23,14 @@ if numpy_installed:
 
 
 class flux_row_cls:
+    """
+    __slots__ instead of an instance __dict__:
+        at tens of millions of rows, a separate __dict__ for each row costs
+        more memory than the row values themselves
+    """
+    __slots__ = ('headers',
+                 'values',
+                 'row_label')
 
     @classmethod
     def reserved_names(cls):
@@ -38,7 +47,7 @@ class flux_row_cls:
             allows for centralized and instantaneous updatdes
         :param values: list of underlying data
 
-        properties must be set on self.__dict__ instead of directly on self to prevent
+        properties must be set with object.__setattr__ instead of directly on self to prevent
         premature __setattr__ lookups
         """
         ''' @types '''
@@ -46,9 +55,9 @@ class flux_row_cls:
         self.values:    List
         self.row_label: Union[int, str]
 
-        self.__dict__['headers']   = headers
-        self.__dict__['values']    = values
-        self.__dict__['row_label'] = row_label
+        object.__setattr__(self, 'headers',   headers)
+        object.__setattr__(self, 'values',    values)
+        object.__setattr__(self, 'row_label', row_label)
 
     @property
     def _preview_as_tuple(self) -> List:
@@ -60,7 +69,7 @@ class flux_row_cls:
         names.extend(['🗲missing🗲']  * (c_m - len(names)))
         values.extend(['🗲missing🗲'] * (c_m - len(values)))
 
-        label = self.__dict__['row_label']
+        label = self.row_label
 
         if isinstance(label, int):
             names.insert(0,  '{label}')
@@ -141,8 +150,8 @@ class flux_row_cls:
         if not isinstance(other, flux_row_cls):
             raise TypeError('row expected to be flux_row_cls')
 
-        headers_self  = self.__dict__['headers']
-        headers_other = other.__dict__['headers']
+        headers_self  = self.headers
+        headers_other = other.headers
 
         names_both = names or (headers_self.keys() & headers_other.keys())
         if not names_both:
@@ -151,8 +160,8 @@ class flux_row_cls:
         if isinstance(names_both, str):
             names_both = [names_both]
 
-        values_self  = self.__dict__['values']
-        values_other = other.__dict__['values']
+        values_self  = self.values
+        values_other = other.values
 
         for name in names_both:
             i_s = headers_self[name]
@@ -161,20 +170,14 @@ class flux_row_cls:
             values_self[i_s] = values_other[i_o]
 
     def copy(self, deep=False):
-        """
-        # other_attributes = {k: v for k, v in self.__dict__.items()
-        #                          if k not in {'headers', 'values', 'row_label'}}
-        # flux_row.__dict__.update(other_attributes)
-        """
-
         if deep:
-            headers   = deepcopy(self.__dict__['headers'])
-            values    = deepcopy(self.__dict__['values'])
+            headers   = deepcopy(self.headers)
+            values    = deepcopy(self.values)
             row_label = None
         else:
-            headers   = copy(self.__dict__['headers'])
-            values    = copy(self.__dict__['values'])
-            row_label = self.__dict__['row_label']
+            headers   = copy(self.headers)
+            values    = copy(self.values)
+            row_label = self.row_label
 
         flux_row = self.__class__(headers,
                                   values,
@@ -199,8 +202,8 @@ class flux_row_cls:
             i = self.headers.get(name, name)
             self.values[i] = value
         except (TypeError, IndexError) as e:
-            if name in self.__dict__:
-                self.__dict__[name] = value
+            if name in flux_row_cls.__slots__:
+                object.__setattr__(self, name, value)
             elif isinstance(self.values, tuple):
                 raise e
             else:
@@ -227,8 +230,8 @@ class flux_row_cls:
             i = self.headers.get(name, name)
             self.values[i] = value
         except (TypeError, IndexError) as e:
-            if name in self.__dict__:
-                self.__dict__[name] = value
+            if name in flux_row_cls.__slots__:
+                object.__setattr__(self, name, value)
             elif isinstance(name, slice):
                 self.values[name] = value
             elif isinstance(self.values, tuple):
@@ -246,16 +249,36 @@ class flux_row_cls:
         return iter(self.values)
 
     def __eq__(self, other):
-        a = id(self.__dict__['headers'])  + hash(tuple(self.__dict__['values']))
-        b = id(other.__dict__['headers']) + hash(tuple(other.__dict__['values']))
+        a = id(self.headers)  + hash(tuple(self.values))
+        b = id(other.headers) + hash(tuple(other.values))
 
         return a == b
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __getstate__(self):
+        """
+        called by copy, deepcopy and pickle.dump
+        __slots__ must be explicitly (de)serialized, otherwise a partially-constructed
+        row would fall through to __getattr__ before self.headers has been set
+        """
+        return (self.headers,
+                self.values,
+                self.row_label)
+
+    def __setstate__(self, state):
+        """
+        called by copy, deepcopy and pickle.load
+        """
+        headers, values, row_label = state
+
+        object.__setattr__(self, 'headers',   headers)
+        object.__setattr__(self, 'values',    values)
+        object.__setattr__(self, 'row_label', row_label)
+
     def __repr__(self):
-        row_label    = self.__dict__['row_label']
+        row_label    = self.row_label
         jagged_label = ''
 
         if isinstance(row_label, int):
@@ -296,3 +319,80 @@ class flux_row_cls:
 
         raise AttributeError(err_msg) from None
 
+
+def specialized_row_class(headers) -> type:
+    """ :return: a subclass of flux_row_cls with a property for each column name
+
+    attribute access on flux_row_cls has to go through __getattr__, which is only
+    called after normal attribute lookup has already failed, then through a
+    self.headers lookup. A property maps the column name directly to its index
+    (about 7x faster for reads)
+
+    classes are cached for each header signature; because column indices are fixed
+    into the properties, rows must be re-assigned to a new class whenever headers
+    are modified (see flux_cls.reset_headers)
+    """
+    signature = tuple(headers.items())
+    return __specialized_row_class(signature)
+
+
+@lru_cache(maxsize=256)
+def __specialized_row_class(signature):
+    """
+    __setattr__ is reverted to object.__setattr__ so that column properties, as well as
+    the 'headers', 'values', 'row_label' slots, are assigned without the overhead of
+    flux_row_cls.__setattr__. Any names that are not in the signature will still raise
+    AttributeError, and __getattr__, __getitem__ and __setitem__ are unchanged
+
+    __init__ assigns the slots directly, (about 2x faster than object.__setattr__ calls)
+    """
+    # region {closure functions}
+    def __init__(row, headers, values, row_label=None):
+        row.headers   = headers
+        row.values    = values
+        row.row_label = row_label
+
+    def column_property(name, i):
+        # a jagged row shorter than the headers raises AttributeError, same as flux_row_cls
+        def fget(row):
+            try:
+                return row.values[i]
+            except IndexError:
+                return flux_row_cls.__getattr__(row, name)
+
+        def fset(row, value):
+            try:
+                row.values[i] = value
+            except IndexError:
+                flux_row_cls.__setattr__(row, name, value)
+
+        return property(fget, fset)
+
+    def __reduce__(row):
+        return (__specialized_row, (row.headers,
+                                   row.values,
+                                   row.row_label))
+    # endregion
+
+    reserved  = set(flux_row_cls.reserved_names())
+    namespace = {'__slots__':    (),
+                 '__module__':   flux_row_cls.__module__,
+                 '__qualname__': flux_row_cls.__qualname__,
+                 '__init__':     __init__,
+                 '__setattr__':  object.__setattr__,
+                 '__reduce__':   __reduce__}
+
+    for name, i in signature:
+        if not isinstance(name, str):
+            continue
+
+        is_dunder = name.startswith('__') and name.endswith('__')
+        if (name not in reserved) and (not is_dunder):
+            namespace[name] = column_property(name, i)
+
+    return type(flux_row_cls.__name__, (flux_row_cls,), namespace)
+
+
+def __specialized_row(headers, values, row_label=None):
+    """ reconstructor for pickle.load, specialized classes cannot be looked up by name """
+    return specialized_row_class(headers)(headers, values, row_label)
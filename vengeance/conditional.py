@@ -15,6 +15,10 @@ loads_excel_module:
     determines if excel_com module should be loaded in vengeance.__init__ 
     if environment is expected to support Windows COM interface, load vengeance.excel_com module
     
+win32com_installed:
+    if False, vengeance.excel_com modules are imported against an in-memory stand-in for
+    the Excel object model (see vengeance.excel_com.fake_excel), eg for benchmarking lev_cls
+    
     vengeance.excel_com functions:
         vengeance.open_workbook
         vengeance.close_workbook
@@ -39,6 +43,7 @@ dateutil_installed      = False
 ultrajson_installed     = False
 numpy_installed         = False
 line_profiler_installed = False
+win32com_installed      = False
 loads_excel_module      = is_windows_os
 
 if python_version >= (3, 6):
@@ -80,8 +85,10 @@ if is_windows_os:
         import comtypes
         import win32com
 
+        win32com_installed = True
         loads_excel_module = True
     except ImportError:
+        win32com_installed = False
         loads_excel_module = False
 
 
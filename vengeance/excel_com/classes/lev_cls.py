@@ -1,14 +1,22 @@
 
 import re
 
-# noinspection PyUnresolvedReferences
-from pythoncom import com_error as pythoncom_error
+from contextlib import contextmanager
+
+from ... conditional import win32com_installed
+
+if win32com_installed:
+    # noinspection PyUnresolvedReferences
+    from pythoncom import com_error as pythoncom_error
+else:
+    from .. fake_excel import com_error as pythoncom_error
 
 from typing import Generator
 from typing import List
 from typing import Any
 
 from ... classes.flux_row_cls import flux_row_cls
+from ... classes.flux_row_cls import specialized_row_class
 
 from .. import excel_address
 from .. import worksheet
@@ -63,8 +71,24 @@ class lev_cls:
     lev.clear('*f *f:*l *l')
     lev['*f *h'] = matrix
 
+    range boundaries:
+        when the worksheet's UsedRange has no more than bulk_boundary_max_cells cells,
+        its values are read in a single call and the boundaries and headers are found
+        in python; larger worksheets are searched with Range.Find() instead
+        (each COM call is a cross-process round trip)
+
+        lev_cls.bulk_boundary_max_cells = 0     # always use Range.Find()
+
+        after lev[reference] = m, boundaries are updated from the shape of m when possible,
+        otherwise they are rescanned the next time they are used. if the worksheet is modified
+        by anything other than this lev_cls, call lev.invalidate() or lev.set_range_boundaries()
+
+        with lev.batch():
+            for c, column in enumerate(columns):
+                lev['*a *h'] = column           # headers are re-indexed once, at end of block
     """
     allow_focus = True
+    bulk_boundary_max_cells = 25_000
 
     def __init__(self, ws, *,
                        first_c=None,
@@ -87,6 +111,11 @@ class lev_cls:
         else:
             self.ws_name = "(no 'Name' attribute)"
 
+        self._is_stale         = False           # boundaries unknown, rescan before next use
+        self._is_headers_stale = False           # headers need re-indexing, (deferred by lev.batch())
+        self._batch_depth      = 0
+        self._is_empty    = None
+
         self.headers   = ordereddict()
         self.m_headers = ordereddict()
 
@@ -105,6 +134,62 @@ class lev_cls:
         self.set_range_boundaries(index_meta=True,
                                   index_header=True)
 
+    # region {range boundaries}
+    @property
+    def first_c(self):
+        self.__rescan_if_stale()
+        return self._first_c
+
+    @first_c.setter
+    def first_c(self, c):
+        self._first_c = c
+
+    @property
+    def last_c(self):
+        self.__rescan_if_stale()
+        return self._last_c
+
+    @last_c.setter
+    def last_c(self, c):
+        self._last_c = c
+
+    @property
+    def first_r(self):
+        self.__rescan_if_stale()
+        return self._first_r
+
+    @first_r.setter
+    def first_r(self, r):
+        self._first_r = r
+
+    @property
+    def last_r(self):
+        self.__rescan_if_stale()
+        return self._last_r
+
+    @last_r.setter
+    def last_r(self, r):
+        self._last_r = r
+
+    @property
+    def headers(self):
+        self.__rescan_if_stale(index_headers=True)
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers):
+        self._headers = headers
+
+    @property
+    def m_headers(self):
+        self.__rescan_if_stale(index_headers=True)
+        return self._m_headers
+
+    @m_headers.setter
+    def m_headers(self, m_headers):
+        self._m_headers = m_headers
+    # endregion
+
     @property
     def is_worksheet_type(self):
         """ ie,
@@ -177,6 +262,10 @@ class lev_cls:
         if self.is_empty():
             return self.header_r or self.meta_r or 1
 
+        # boundaries were found from data, so first_r cannot be an empty row
+        if (self.last_r > self.first_r) and not any(self._fixed_rows):
+            return self.last_r + 1
+
         a = '{}{}:{}{}'.format(self.first_c, self.first_r,
                                self.last_c, self.first_r)
         first_data_row = self.ws.Range(a)
@@ -210,11 +299,14 @@ class lev_cls:
         if self.last_r > self.first_r:
             return False
 
-        r_1 = self.header_r or self.meta_r or 1
-        r_2 = self.last_r
-        a = '{}{}:{}{}'.format(self.first_c, r_1, self.last_c, r_2)
+        if self._is_empty is None:
+            r_1 = self.header_r or self.meta_r or 1
+            r_2 = self.last_r
+            a = '{}{}:{}{}'.format(self.first_c, r_1, self.last_c, r_2)
+
+            self._is_empty = worksheet.is_range_empty(self.ws.Range(a))
 
-        return worksheet.is_range_empty(self.ws.Range(a))
+        return self._is_empty
 
     def values(self, r_1='*h', r_2='*l') -> Generator[List, Any, Any]:
         if self.is_empty():
@@ -246,10 +338,11 @@ class lev_cls:
 
         r_1 = excel_range.Row
         c_1, c_2 = self.first_c, self.last_c
+        row_cls  = specialized_row_class(headers)
 
         for r, row in enumerate(worksheet.escape_excel_range_errors(excel_range), r_1):
             a = '${}${}:${}${}'.format(c_1, r, c_2, r)
-            yield flux_row_cls(headers, row, a)
+            yield row_cls(headers, row, a)
 
     def activate(self):
         if self.allow_focus:
@@ -297,19 +390,52 @@ class lev_cls:
         if clear_values:
             excel_range.ClearContents()
 
-            index_meta   = (r_1 <= self.meta_r)
-            index_header = (r_1 <= self.header_r)
-            self.set_range_boundaries(index_meta, index_header)
+            self.invalidate()
 
         if clear_colors:
             excel_range.Interior.Color = xlNone
 
+    @contextmanager
+    def batch(self):
+        """ defer re-indexing headers until the end of the block
+
+        writes to meta / header rows, or writes that add columns, would otherwise re-index
+        headers before the next reference is resolved; range boundaries are still kept
+        current within the block, so that eg lev['*f *a'] = m appends after the last row
+
+        headers are not re-indexed within the block: write header rows before entering it
+        if their names are used as references, (eg, lev['col_a *f'])
+        """
+        self.__rescan_if_stale(index_headers=True)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.__rescan_if_stale(index_headers=True)
+
+    def invalidate(self):
+        """ rescan range boundaries and headers the next time they are used,
+        eg, after the worksheet has been modified outside of this lev_cls
+        """
+        self._is_stale = True
+
+    def __rescan_if_stale(self, index_headers=False):
+        if self._is_stale:
+            self.set_range_boundaries()
+        elif index_headers and self._is_headers_stale and self._batch_depth == 0:
+            self.set_range_boundaries()
+
     def set_range_boundaries(self, index_meta=True, index_header=True):
         """ find the edges of data in worksheet
 
         worksheet filter MUST be cleared from worksheet to
         determine these boundaries correctly
         """
+        self._is_stale         = False
+        self._is_headers_stale = False
+        self._is_empty         = None
 
         if not self.is_worksheet_type:
             self.first_c = ''
@@ -319,17 +445,43 @@ class lev_cls:
             return
 
         worksheet.clear_worksheet_filter(self.ws)
-        self.__range_boundaries()
+        used_values = self.__range_boundaries()
 
         if index_meta:
-            self.__index_meta_columns()
+            self.__index_meta_columns(used_values)
 
         if index_header:
-            self.__index_header_columns()
+            self.__index_header_columns(used_values)
 
     def __range_boundaries(self):
+        """ :return: (r_0, c_0, m) values of UsedRange if they were read, else None """
         used_range = self.ws.UsedRange
 
+        try:
+            r_0, c_0, r_n, c_n = excel_address.address_bounds(used_range.Address)
+        except ValueError:
+            r_0, c_0, r_n, c_n = 1, 1, used_range.Rows.Count, used_range.Columns.Count
+
+        num_cells = (r_n - r_0 + 1) * (c_n - c_0 + 1)
+
+        if num_cells <= self.bulk_boundary_max_cells:
+            m = used_range.Value
+            m = modify_iteration_depth(m, depth=2)
+
+            self.__range_boundaries_from_values(r_0, c_0, m)
+            used_values = (r_0, c_0, m)
+        else:
+            self.__range_boundaries_from_find(used_range, r_n)
+            used_values = None
+
+        self.first_c = excel_address.col_letter(self.first_c)
+        self.last_c  = excel_address.col_letter(self.last_c)
+        self.first_r = int(self.first_r)
+        self.last_r  = int(self.last_r)
+
+        return used_values
+
+    def __range_boundaries_from_find(self, used_range, r_2):
         first_c, last_c = self._fixed_columns
         first_r, last_r = self._fixed_rows
 
@@ -337,7 +489,6 @@ class lev_cls:
         self.last_c  = last_c  or worksheet.last_col(used_range, default=self.first_c)
 
         r_1 = max(self.meta_r, self.header_r) + 1
-        r_2 = used_range.Rows.Count
 
         a = '{}{}:{}{}'.format(self.first_c, r_1,
                                self.last_c,  r_2)
@@ -346,10 +497,71 @@ class lev_cls:
         self.first_r = first_r or worksheet.first_row(excel_range, default=r_1)
         self.last_r  = last_r  or worksheet.last_row(excel_range,  default=self.first_r)
 
-        self.first_c = excel_address.col_letter(self.first_c)
-        self.last_c  = excel_address.col_letter(self.last_c)
-        self.first_r = int(self.first_r)
-        self.last_r  = int(self.last_r)
+    def __range_boundaries_from_values(self, r_0, c_0, m):
+        """ same boundaries as __range_boundaries_from_find(), from the values of UsedRange
+        (cells containing None or '' are not matched by Range.Find('*'))
+        """
+        # region {closure functions}
+        def has_value(v):
+            return (v is not None) and (v != '')
+
+        def first_index(indices, is_filled):
+            return next((i for i in indices if is_filled(i)), None)
+
+        def column_is_filled(i):
+            return any(has_value(row[i]) for row in m)
+
+        def row_is_filled(i):
+            row = m[i]
+            return any(has_value(row[j]) for j in range(j_1, j_2))
+        # endregion
+
+        first_c, last_c = self._fixed_columns
+        first_r, last_r = self._fixed_rows
+
+        num_cols = len(m[0])
+        num_rows = len(m)
+
+        i_1 = first_index(range(num_cols), column_is_filled)
+        i_2 = first_index(reversed(range(num_cols)), column_is_filled)
+
+        if first_c:
+            first_c = excel_address.col_number(first_c)
+        elif i_1 is not None:
+            first_c = c_0 + i_1
+        else:
+            first_c = 1
+
+        if last_c:
+            last_c = excel_address.col_number(last_c)
+        elif i_2 is not None:
+            last_c = max(c_0 + i_2, first_c)
+        else:
+            last_c = first_c
+
+        r_1 = max(self.meta_r, self.header_r) + 1
+        r_2 = r_0 + num_rows - 1
+
+        # rows and columns of UsedRange within search range (Excel orders the corners of a range)
+        j_1 = max(min(first_c, last_c) - c_0, 0)
+        j_2 = min(max(first_c, last_c) - c_0 + 1, num_cols)
+        rows = range(max(min(r_1, r_2) - r_0, 0),
+                     min(max(r_1, r_2) - r_0 + 1, num_rows))
+
+        if not first_r:
+            i = first_index(rows, row_is_filled)
+            if i is None: first_r = r_1
+            else:         first_r = max(r_0 + i, r_1)
+
+        if not last_r:
+            i = first_index(reversed(rows), row_is_filled)
+            if i is None: last_r = first_r
+            else:         last_r = max(r_0 + i, int(first_r))
+
+        self.first_c = first_c
+        self.last_c  = last_c
+        self.first_r = first_r
+        self.last_r  = last_r
 
     @classmethod
     def index_headers(cls, ws, row_int=None):
@@ -369,32 +581,58 @@ class lev_cls:
     def __index_row_headers(cls, excel_range):
         row = excel_range.Rows(1)
         row = worksheet.escape_excel_range_errors(row)[0]
+
+        return cls.__index_row_values(row, excel_range.Column)
+
+    @staticmethod
+    def __index_row_values(row, c_1):
         if not any(row):
             return ordereddict()
 
-        c_1 = excel_range.Column
         headers = map_values_to_enum(row, c_1)
         headers = ordereddict((h, excel_address.col_letter(v)) for h, v in headers.items())
 
         return headers
 
-    def __index_headers(self, row_ref):
+    def __index_headers(self, row_ref, used_values=None):
+        if used_values is not None:
+            c_1 = excel_address.col_number(self.first_c)
+            c_2 = excel_address.col_number(self.last_c)
+            row = self.__row_from_values(getattr(self, row_ref), c_1, c_2, used_values)
+
+            # error cells must be escaped with SpecialCells(), (see worksheet.escape_excel_range_errors)
+            if not any((type(v) is int) and (v in excel_errors) for v in row):
+                return self.__index_row_values(row, c_1)
+
         a = '*f {} :*l {}'.format(row_ref, row_ref)
         excel_range = self.range(a)
 
         return self.__index_row_headers(excel_range)
 
-    def __index_meta_columns(self):
+    @staticmethod
+    def __row_from_values(r, c_1, c_2, used_values):
+        r_0, c_0, m = used_values
+
+        i = r - r_0
+        if 0 <= i < len(m):
+            row = m[i]
+        else:
+            row = ()
+
+        return [row[c - c_0] if (0 <= c - c_0 < len(row)) else None
+                             for c in range(c_1, c_2 + 1)]
+
+    def __index_meta_columns(self, used_values=None):
         if self.meta_r == 0:
             return
 
-        self.m_headers = self.__index_headers('meta_r')
+        self.m_headers = self.__index_headers('meta_r', used_values)
 
-    def __index_header_columns(self):
+    def __index_header_columns(self, used_values=None):
         if self.header_r == 0:
             return
 
-        self.headers = self.__index_headers('header_r')
+        self.headers = self.__index_headers('header_r', used_values)
 
     def range(self, reference):
         if not self.is_worksheet_type:
@@ -432,18 +670,107 @@ class lev_cls:
         """ write value(s) to excel range """
         excel_range = self.range(reference)
 
-        m = self.__validate_matrix_within_range_boundaries(v, excel_range)
+        r = excel_range.Row
+        c = excel_range.Column
+        m = self.__validate_matrix_within_range_boundaries(v, r, c)
 
         was_filtered = self.has_filter
         worksheet.write_to_excel_range(m, excel_range)
 
-        r = excel_range.Row
-        self.set_range_boundaries(index_meta=(r   <= self.meta_r),
-                                  index_header=(r <= self.header_r))
+        if not self.__update_range_boundaries(m, r, c):
+            self.invalidate()
 
         if was_filtered:
             self.reapply_filter()
 
+    def __update_range_boundaries(self, m, r_1, c_1):
+        """ update boundaries from the shape of matrix m, just written at row r_1, column c_1
+
+        :return: False if the boundaries cannot be determined from m and the worksheet
+        needs to be rescanned: eg, when empty values were written over existing data
+        (cells containing None or '' are not data), or when rows are fixed
+
+        headers are marked for re-indexing when m was written to meta / header rows,
+        or when m added columns
+        """
+        # region {closure functions}
+        def has_value(v):
+            return (v is not None) and (v != '')
+
+        def column_has_value(j):
+            return any(has_value(row[j]) for row in m)
+        # endregion
+
+        if self._is_stale:
+            return False
+
+        # with fixed rows, or a single row, last_r > first_r does not tell whether data was found
+        if (self._last_r <= self._first_r) or any(self._fixed_rows):
+            return False
+
+        fixed_first_c, fixed_last_c = self._fixed_columns
+
+        first_c = excel_address.col_number(self._first_c)
+        last_c  = excel_address.col_number(self._last_c)
+        first_r = self._first_r
+        last_r  = self._last_r
+
+        num_cols = len(m[0])
+        r_0      = max(self.meta_r, self.header_r) + 1
+
+        # empty values written over existing data in first_c or last_c may remove these columns,
+        # (rows above r_0 are not known to be empty)
+        edge_columns = [j for j, is_fixed in ((first_c - c_1, fixed_first_c),
+                                              (last_c  - c_1, fixed_last_c))
+                        if (0 <= j < num_cols) and not is_fixed]
+
+        for r, row in enumerate(m, r_1):
+            if (r < r_0 or first_r <= r <= last_r) and not all(has_value(row[j]) for j in edge_columns):
+                return False
+
+        # columns added by m
+        if not fixed_first_c:
+            j = next((j for j in range(min(first_c - c_1, num_cols)) if column_has_value(j)), None)
+            if j is not None:
+                first_c = c_1 + j
+
+        if not fixed_last_c:
+            j = next((j for j in reversed(range(max(last_c - c_1 + 1, 0), num_cols))
+                      if column_has_value(j)), None)
+            if j is not None:
+                last_c = c_1 + j
+
+        # columns of m within first_c:last_c
+        j_1 = min(max(first_c - c_1, 0), num_cols)
+        j_2 = max(min(last_c - c_1 + 1, num_cols), j_1)
+
+        filled_rows = []
+        for r, row in enumerate(m, r_1):
+            if r < r_0:
+                continue
+
+            if any(has_value(v) for v in row[j_1:j_2]):
+                filled_rows.append(r)
+            elif first_r <= r <= last_r:
+                return False
+
+        if filled_rows:
+            first_r = min(first_r, filled_rows[0])
+            last_r  = max(last_r,  filled_rows[-1])
+
+        is_new_c = (first_c, last_c) != (excel_address.col_number(self._first_c),
+                                         excel_address.col_number(self._last_c))
+        if (r_1 < r_0) or is_new_c:
+            self._is_headers_stale = True
+
+        self._first_c  = excel_address.col_letter(first_c)
+        self._last_c   = excel_address.col_letter(last_c)
+        self._first_r  = first_r
+        self._last_r   = last_r
+        self._is_empty = None
+
+        return True
+
     def __iter__(self) -> Generator[flux_row_cls, Any, Any]:
         return self.flux_rows('*f')
 
@@ -465,7 +792,7 @@ class lev_cls:
 
         return "'{}' {}".format(self.ws_name, a)
 
-    def __validate_matrix_within_range_boundaries(self, v, excel_range):
+    def __validate_matrix_within_range_boundaries(self, v, r_1, c_1):
         """
         if lev has fixed columns or rows, these should not be exceeded
         make sure matrix fits in allowed destination space
@@ -479,9 +806,6 @@ class lev_cls:
         first_c, last_c = self._fixed_columns
         first_r, last_r = self._fixed_rows
 
-        c_1 = excel_range.Column
-        r_1 = excel_range.Row
-
         if last_c:
             first_c = excel_address.col_number(first_c) or excel_address.col_number(c_1)
             last_c  = excel_address.col_number(last_c)
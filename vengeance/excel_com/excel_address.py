@@ -6,6 +6,24 @@ max_rows = 1048575           # 2**20
 max_cols = 16384             # 2**14
 
 
+def address_bounds(a):
+    """ :return: (r_1, c_1, r_2, c_2) as integers
+
+    eg:
+        (1, 1, 10, 3) = address_bounds('$A$1:$C$10')
+        (2, 2, 2, 2)  = address_bounds('B2')
+    """
+    match = re.match(r'^\$?([a-z]{1,3})\$?(\d+)(?::\$?([a-z]{1,3})\$?(\d+))?$', a.strip(), re.I)
+    if not match:
+        raise ValueError("'{}' is not a cell or range of cells address".format(a))
+
+    c_1, r_1, c_2, r_2 = match.groups()
+    if c_2 is None:
+        c_2, r_2 = c_1, r_1
+
+    return int(r_1), col_number(c_1), int(r_2), col_number(c_2)
+
+
 def col_letter_offset(cs, offset):
     return col_letter(col_number(cs) + offset)
 
@@ -0,0 +1,893 @@
+
+import re
+import time
+
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from datetime import datetime
+from typing import List
+from typing import Tuple
+
+from .excel_address import col_letter
+from .excel_address import col_number
+from .excel_constants import *
+
+"""
+in-memory stand-in for the Excel object model, so that lev_cls and excel_com.worksheet
+can be run (and benchmarked) without Windows, pywin32 or a running Excel application
+
+    excel_app = fake_excel_application(latency=0.001)
+    wb        = excel_app.Workbooks.Add()
+    ws        = wb.Sheets['Sheet1']
+
+    with count_com_calls(excel_app) as com_calls:
+        lev = lev_cls(ws, header_r=1)
+
+    num_round_trips = sum(com_calls.values())
+
+classes are named after the COM interfaces they imitate, (eg, excel_com.worksheet.is_win32_worksheet_instance()
+checks for '_Worksheet'), and implement only the members used by excel_com:
+    _Application    Workbooks, WorksheetFunction, Visible, WindowState, Hwnd, ...
+    _Workbook       Sheets, Worksheets, Names, Name, Application, ...
+    _Worksheet      Range, UsedRange, AutoFilter, AutoFilterMode, ShowAllData, Name, Parent, ...
+    Range           Value, Find, SpecialCells, Resize, Rows, Columns, Cells, Count, Address,
+                    Row, Column, AutoFilter, ClearContents, ...
+
+every access to a capitalized member (property get, property put, method call, collection item)
+is counted as one COM round trip, and an optional latency is slept on each of them
+"""
+excel_max_rows = 1_048_576
+excel_max_cols = 16_384
+excel_na_error = -2146826246
+
+com_error_exception = -2147352567
+com_error_no_cells  = -2146827284
+
+address_pattern = re.compile(r'''^\$?(?P<c>[A-Z]{1,3})?\$?(?P<r>[0-9]+)?$''', re.I)
+
+
+def fake_excel_application(latency=0.0) -> '_Application':
+    """
+    :param latency: seconds slept on every COM round trip, eg 0.0005
+    """
+    return _Application(latency)
+
+
+@contextmanager
+def count_com_calls(excel_app):
+    """ yield a Counter of {'Interface.Member': number of round trips} made within the block
+
+    property puts are counted with a trailing '=', (eg, 'Range.Value=')
+    """
+    com_calls = Counter()
+    excel_app.call_counters.append(com_calls)
+
+    try:
+        yield com_calls
+    finally:
+        excel_app.call_counters.remove(com_calls)
+
+
+def benchmark_lev_cls(num_rows=10_000,
+                      num_cols=10,
+                      latency=0.0,
+                      print_results=True) -> List[Tuple[str, int, float]]:
+    """ :return: list of (operation, COM round trips, seconds) for lev_cls read and write paths
+
+    eg:
+        python -m vengeance.excel_com.fake_excel
+    """
+    from .classes.lev_cls import lev_cls
+
+    excel_app = fake_excel_application(latency)
+    ws        = excel_app.Workbooks.Add().Sheets['Sheet1']
+
+    m = [['col_{}'.format(c) for c in range(num_cols)]]
+    m.extend([[r * c for c in range(num_cols)] for r in range(num_rows)])
+    appended = m[1:101]
+    columns  = [[['added_{}'.format(c)]] + [[r] for r in range(10)] for c in range(20)]
+
+    lev = None
+
+    def construct(): nonlocal lev; lev = lev_cls(ws, header_r=1)
+    def write():      lev['*f *h'] = m
+    def values():     list(lev.values())
+    def flux_rows():  list(lev)
+    def append():     lev['*f *a'] = appended
+    def clear():      lev.clear('*f *f:*l *l')
+
+    def append_rows():
+        for row in appended:
+            lev['*f *a'] = [row]
+
+    # each column written to the header row re-indexes headers, unless deferred by lev.batch()
+    def add_columns():
+        for column in columns[:10]:
+            lev['*a *h'] = column
+
+    def add_columns_batch():
+        with lev.batch():
+            for column in columns[10:]:
+                lev['*a *h'] = column
+
+    operations = [('lev_cls(ws, header_r=1)',  construct),
+                  ("lev['*f *h'] = m",         write),
+                  ('lev_cls(ws, header_r=1)',  construct),
+                  ('list(lev.values())',       values),
+                  ('list(lev)',                flux_rows),
+                  ("lev['*f *a'] = 100 rows",  append),
+                  ("lev['*f *a'] = row, x100", append_rows),
+                  ("lev['*a *h'] = column, x10", add_columns),
+                  ('... within lev.batch()',   add_columns_batch),
+                  ("lev.clear('*f *f:*l *l')", clear)]
+
+    results = []
+    for name, f in operations:
+        with count_com_calls(excel_app) as com_calls:
+            t = time.perf_counter()
+            f()
+            t = time.perf_counter() - t
+
+        results.append((name, sum(com_calls.values()), t))
+
+    if print_results:
+        print('lev_cls: {:,} rows x {} columns, latency: {} sec'.format(num_rows, num_cols, latency))
+        for name, round_trips, t in results:
+            print('    {:<28}{:>6,} round trips    {:.4f} sec'.format(name, round_trips, t))
+
+    return results
+
+
+# region {Windows api stand-ins, (see excel_com.workbook)}
+# noinspection PyUnusedLocal
+def FindWindowExA(*args):
+    """ no Excel windows exist, so excel_com.workbook.all_excel_instances() yields nothing """
+    return 0
+
+
+# noinspection PyUnusedLocal
+def SetForegroundWindow(hwnd):
+    return 1
+
+
+def com_unavailable(*args, **kwargs):
+    raise NotImplementedError('Excel automation requires Windows with pywin32 and comtypes installed, '
+                              '(see excel_com.fake_excel.fake_excel_application() for an in-memory stand-in)')
+# endregion
+
+
+class com_error(Exception):
+    """ stand-in for pythoncom.com_error: (hresult, strerror, excepinfo, argerror) """
+    def __init__(self, hresult=com_error_exception, strerror='Exception occurred.', excepinfo=None, argerror=None):
+        super().__init__(hresult, strerror, excepinfo, argerror)
+
+        self.hresult   = hresult
+        self.strerror  = strerror
+        self.excepinfo = excepinfo
+        self.argerror  = argerror
+
+
+class com_object:
+    """ every capitalized member accessed on an instance is counted as a COM round trip """
+    def __getattribute__(self, name):
+        if name[:1].isupper():
+            object.__getattribute__(self, 'excel_app').record_call(self, name)
+
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, v):
+        if name[:1].isupper():
+            object.__getattribute__(self, 'excel_app').record_call(self, name + '=')
+
+        object.__setattr__(self, name, v)
+
+    def set_uncounted(self, **attributes):
+        """ set attributes without counting COM round trips, (eg, initial property values) """
+        for name, v in attributes.items():
+            object.__setattr__(self, name, v)
+
+
+class _Application(com_object):
+    def __init__(self, latency=0.0):
+        self.excel_app = self
+
+        self.latency       = latency
+        self.com_calls     = Counter()
+        self.call_counters = []
+
+        self.workbooks          = []
+        self.worksheet_function = WorksheetFunction(self)
+
+        self.set_uncounted(Visible=False,
+                           WindowState=xlNormal,
+                           Hwnd=0,
+                           DisplayAlerts=True,
+                           EnableEvents=True,
+                           ScreenUpdating=True,
+                           Calculation=xlCalculationAutomatic)
+
+    def record_call(self, o, name):
+        name = '{}.{}'.format(o.__class__.__name__, name)
+
+        self.com_calls[name] += 1
+        for com_calls in self.call_counters:
+            com_calls[name] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def num_com_calls(self):
+        return sum(self.com_calls.values())
+
+    @property
+    def Application(self):
+        return self
+
+    @property
+    def Workbooks(self):
+        return Workbooks(self)
+
+    @property
+    def WorksheetFunction(self):
+        return self.worksheet_function
+
+    def Quit(self):
+        self.workbooks.clear()
+
+    def __repr__(self):
+        return '{}: {:,} COM calls'.format(self.__class__.__name__, self.num_com_calls)
+
+
+class Workbooks(com_object):
+    def __init__(self, excel_app):
+        self.excel_app = excel_app
+
+    @property
+    def Count(self):
+        return len(self.excel_app.workbooks)
+
+    def Add(self, *sheet_names):
+        wb = _Workbook(self.excel_app, 'Book{}'.format(len(self.excel_app.workbooks) + 1), sheet_names or ('Sheet1',))
+        self.excel_app.workbooks.append(wb)
+
+        return wb
+
+    def Item(self, i):
+        return self.excel_app.workbooks[i - 1]
+
+    def __call__(self, i):
+        self.excel_app.record_call(self, 'Item')
+        return self.excel_app.workbooks[i - 1]
+
+    def __iter__(self):
+        for wb in list(self.excel_app.workbooks):
+            self.excel_app.record_call(self, 'Item')
+            yield wb
+
+
+class _Workbook(com_object):
+    def __init__(self, excel_app, name, sheet_names):
+        self.excel_app = excel_app
+
+        self.worksheets = [_Worksheet(excel_app, self, sheet_name) for sheet_name in sheet_names]
+        self.names      = []
+
+        self.set_uncounted(Name=name,
+                           FullName=name,
+                           Saved=True,
+                           ReadOnly=False)
+
+    @property
+    def Application(self):
+        return self.excel_app
+
+    @property
+    def Parent(self):
+        return self.excel_app
+
+    @property
+    def Sheets(self):
+        return Sheets(self)
+
+    @property
+    def Worksheets(self):
+        return Sheets(self)
+
+    @property
+    def Names(self):
+        return Names(self)
+
+    def Activate(self):
+        pass
+
+    def Close(self, save_changes=False):
+        if self in self.excel_app.workbooks:
+            self.excel_app.workbooks.remove(self)
+
+    def __repr__(self):
+        return "{}: '{}'".format(self.__class__.__name__, object.__getattribute__(self, 'Name'))
+
+
+class Sheets(com_object):
+    def __init__(self, wb):
+        self.excel_app = wb.excel_app
+        self.wb        = wb
+
+    @property
+    def Count(self):
+        return len(self.wb.worksheets)
+
+    def Add(self, name=None):
+        name = name or 'Sheet{}'.format(len(self.wb.worksheets) + 1)
+        ws   = _Worksheet(self.excel_app, self.wb, name)
+        self.wb.worksheets.append(ws)
+
+        return ws
+
+    def Item(self, i):
+        return self.worksheet(i)
+
+    def __call__(self, i):
+        self.excel_app.record_call(self, 'Item')
+        return self.worksheet(i)
+
+    def __getitem__(self, i):
+        self.excel_app.record_call(self, 'Item')
+        return self.worksheet(i)
+
+    def worksheet(self, i):
+        if isinstance(i, int):
+            return self.wb.worksheets[i - 1]
+
+        for ws in self.wb.worksheets:
+            if object.__getattribute__(ws, 'Name').lower() == str(i).lower():
+                return ws
+
+        raise com_error(strerror="worksheet '{}' not found".format(i))
+
+    def __iter__(self):
+        for ws in list(self.wb.worksheets):
+            self.excel_app.record_call(self, 'Item')
+            yield ws
+
+
+class Names(com_object):
+    def __init__(self, wb):
+        self.excel_app = wb.excel_app
+        self.wb        = wb
+
+    @property
+    def Count(self):
+        return len(self.wb.names)
+
+    def Add(self, name, refers_to, visible=True):
+        """ eg: wb.Names.Add('prices', '=Sheet1!$A$1:$C$10') """
+        sheet_name, a = refers_to.lstrip('=').rsplit('!', 1)
+        sheet_name    = sheet_name.strip("'")
+
+        ws   = self.wb.Sheets[sheet_name]
+        name = Name(self.excel_app, name, ws, a, visible)
+
+        self.wb.names.append(name)
+        return name
+
+    def __iter__(self):
+        for name in list(self.wb.names):
+            self.excel_app.record_call(self, 'Item')
+            yield name
+
+
+class Name(com_object):
+    def __init__(self, excel_app, name, ws, a, visible):
+        self.excel_app = excel_app
+
+        self.ws = ws
+        self.a  = a
+        self.set_uncounted(Name=name,
+                           Visible=visible)
+
+    @property
+    def RefersTo(self):
+        return "='{}'!{}".format(object.__getattribute__(self.ws, 'Name'), self.a)
+
+    @property
+    def RefersToRange(self):
+        return self.ws.range_from_address(self.a)
+
+
+class WorksheetFunction(com_object):
+    def __init__(self, excel_app):
+        self.excel_app = excel_app
+
+    @staticmethod
+    def CountBlank(excel_range):
+        ws = excel_range.ws
+        r_1, c_1, r_2, c_2 = excel_range.bounds
+
+        num_values = sum(1 for (r, c), v in ws.cells_within(r_1, c_1, r_2, c_2) if v != '')
+        return excel_range.num_cells - num_values
+
+
+class AutoFilter(com_object):
+    def __init__(self, excel_app, excel_range):
+        self.excel_app = excel_app
+
+        self.set_uncounted(Range=excel_range,
+                           FilterMode=False)
+
+
+class Interior(com_object):
+    def __init__(self, excel_app):
+        self.excel_app = excel_app
+        self.set_uncounted(Color=xlNone)
+
+
+class _Worksheet(com_object):
+    def __init__(self, excel_app, wb, name):
+        self.excel_app = excel_app
+        self.wb        = wb
+
+        self.rows        = {}               # {r: {c: value}}, non-empty cells only
+        self.auto_filter = None
+
+        self.set_uncounted(Name=name,
+                           Visible=True)
+
+    # region {fake worksheet methods}
+    def cells_within(self, r_1, c_1, r_2, c_2):
+        """ :return: list of ((r, c), value) of non-empty cells within bounds, in row order """
+        rows = self.rows
+
+        if (r_2 - r_1) < len(rows):
+            rs = [r for r in range(r_1, r_2 + 1) if r in rows]
+        else:
+            rs = sorted(r for r in rows if r_1 <= r <= r_2)
+
+        return [((r, c), v) for r in rs
+                            for c, v in rows[r].items() if c_1 <= c <= c_2]
+
+    def used_bounds(self):
+        rows = self.rows
+        if not rows:
+            return 1, 1, 1, 1
+
+        return (min(rows),
+                min(map(min, rows.values())),
+                max(rows),
+                max(map(max, rows.values())))
+
+    def set_value(self, r, c, v):
+        if v is not None:
+            self.rows.setdefault(r, {})[c] = v
+            return
+
+        row = self.rows.get(r)
+        if row is not None and row.pop(c, None) is not None and not row:
+            del self.rows[r]
+
+    def range_from_address(self, a_1, a_2=None):
+        if isinstance(a_1, Range):
+            a_1 = a_1.address
+        if isinstance(a_2, Range):
+            a_2 = a_2.address
+
+        r_1, c_1, r_2, c_2 = _parse_address(a_1)
+        if a_2 is not None:
+            r_3, c_3, r_4, c_4 = _parse_address(a_2)
+            r_1, c_1, r_2, c_2 = min(r_1, r_3), min(c_1, c_3), max(r_2, r_4), max(c_2, c_4)
+
+        return Range(self, r_1, c_1, r_2, c_2)
+
+    def set_error(self, a, error_code=excel_na_error):
+        """ place an error value, (eg, excel_errors key) in a cell, as if returned by a formula """
+        r, c, _, _ = _parse_address(a)
+        self.set_value(r, c, error_code)
+    # endregion
+
+    @property
+    def Application(self):
+        return self.excel_app
+
+    @property
+    def Parent(self):
+        return self.wb
+
+    @property
+    def UsedRange(self):
+        return Range(self, *self.used_bounds())
+
+    @property
+    def Cells(self):
+        return Range(self, 1, 1, excel_max_rows, excel_max_cols, 'cells')
+
+    def Range(self, a_1, a_2=None):
+        return self.range_from_address(a_1, a_2)
+
+    @property
+    def AutoFilter(self):
+        return self.auto_filter
+
+    @property
+    def AutoFilterMode(self):
+        return self.auto_filter is not None
+
+    @AutoFilterMode.setter
+    def AutoFilterMode(self, v):
+        if not v:
+            self.auto_filter = None
+
+    @property
+    def FilterMode(self):
+        return False
+
+    def ShowAllData(self):
+        pass
+
+    def Activate(self):
+        pass
+
+    def __repr__(self):
+        return "{}: '{}'".format(self.__class__.__name__, object.__getattribute__(self, 'Name'))
+
+
+class Range(com_object):
+    def __init__(self, ws, r_1, c_1, r_2, c_2, count_by='cells', union=None):
+        """
+        :param count_by: 'cells', 'rows' or 'columns', how .Count and items are enumerated,
+                         (eg, excel_range.Rows.Count)
+        :param union:    list of (r, c) for a non-contiguous range, (eg, from SpecialCells)
+        """
+        self.excel_app = ws.excel_app
+        self.ws = ws
+        object.__setattr__(self, 'bounds', (r_1, c_1, r_2, c_2))
+        self.count_by = count_by
+        self.union = union
+
+    # region {fake range methods}
+    @property
+    def num_rows(self):
+        r_1, _, r_2, _ = self.bounds
+        return r_2 - r_1 + 1
+
+    @property
+    def num_cols(self):
+        _, c_1, _, c_2 = self.bounds
+        return c_2 - c_1 + 1
+
+    @property
+    def num_cells(self):
+        if self.union is not None:
+            return len(self.union)
+
+        return self.num_rows * self.num_cols
+
+    @property
+    def address(self):
+        if self.union is not None:
+            return ','.join(_cell_address(r, c) for r, c in self.union)
+
+        r_1, c_1, r_2, c_2 = self.bounds
+        if (r_1, c_1) == (r_2, c_2):
+            return _cell_address(r_1, c_1)
+
+        return '{}:{}'.format(_cell_address(r_1, c_1), _cell_address(r_2, c_2))
+
+    def item(self, i, j=None):
+        r_1, c_1, r_2, c_2 = self.bounds
+        ws = self.ws
+
+        if j is not None:
+            return Range(ws, r_1 + i - 1, c_1 + j - 1, r_1 + i - 1, c_1 + j - 1)
+
+        if self.count_by == 'rows':
+            return Range(ws, r_1 + i - 1, c_1, r_1 + i - 1, c_2)
+        if self.count_by == 'columns':
+            return Range(ws, r_1, c_1 + i - 1, r_2, c_1 + i - 1)
+
+        if self.union is not None:
+            r, c = self.union[i - 1]
+        else:
+            r, c = divmod(i - 1, self.num_cols)
+            r, c = r_1 + r, c_1 + c
+
+        return Range(ws, r, c, r, c)
+
+    def as_count_by(self, count_by):
+        return Range(self.ws, *self.bounds, count_by=count_by, union=self.union)
+    # endregion
+
+    @property
+    def Application(self):
+        return self.excel_app
+
+    @property
+    def Parent(self):
+        return self.ws
+
+    @property
+    def Worksheet(self):
+        return self.ws
+
+    @property
+    def Address(self):
+        return self.address
+
+    @property
+    def Row(self):
+        return self.bounds[0]
+
+    @property
+    def Column(self):
+        return self.bounds[1]
+
+    @property
+    def Rows(self):
+        return self.as_count_by('rows')
+
+    @property
+    def Columns(self):
+        return self.as_count_by('columns')
+
+    @property
+    def Cells(self):
+        return self.as_count_by('cells')
+
+    @property
+    def Count(self):
+        if self.count_by == 'rows':    return self.num_rows
+        if self.count_by == 'columns': return self.num_cols
+
+        return self.num_cells
+
+    @property
+    def Interior(self):
+        return Interior(self.excel_app)
+
+    @property
+    def Value(self):
+        rows = self.ws.rows
+        r_1, c_1, r_2, c_2 = self.bounds
+
+        if (r_1, c_1) == (r_2, c_2):
+            return rows.get(r_1, {}).get(c_1)
+
+        empty = {}
+        cols  = range(c_1, c_2 + 1)
+
+        return tuple(tuple(map(rows.get(r, empty).get, cols)) for r in range(r_1, r_2 + 1))
+
+    @Value.setter
+    def Value(self, m):
+        """
+        a single value is written to every cell, a single row is repeated for every row,
+        cells outside the bounds of a smaller matrix are filled with #N/A, (as in Excel)
+        """
+        ws = self.ws
+        r_1, c_1, r_2, c_2 = self.bounds
+
+        if not isinstance(m, (list, tuple)):
+            m = [[m]]
+        elif not m or not isinstance(m[0], (list, tuple)):
+            m = [m]
+
+        is_single = (len(m) == 1 and len(m[0]) == 1)
+        is_row    = (len(m) == 1)
+
+        for i, r in enumerate(range(r_1, r_2 + 1)):
+            if is_single or is_row:
+                row = m[0]
+            elif i < len(m):
+                row = m[i]
+            else:
+                row = ()
+
+            for j, c in enumerate(range(c_1, c_2 + 1)):
+                if is_single:
+                    v = row[0]
+                elif j < len(row):
+                    v = row[j]
+                else:
+                    v = excel_na_error
+
+                ws.set_value(r, c, _com_value(v))
+
+    @property
+    def Value2(self):
+        return self.Value
+
+    def Resize(self, num_rows=None, num_cols=None):
+        r_1, c_1, r_2, c_2 = self.bounds
+
+        num_rows = num_rows or self.num_rows
+        num_cols = num_cols or self.num_cols
+
+        return Range(self.ws, r_1, c_1, r_1 + num_rows - 1, c_1 + num_cols - 1)
+
+    def Offset(self, row_offset=0, col_offset=0):
+        r_1, c_1, r_2, c_2 = self.bounds
+        return Range(self.ws, r_1 + row_offset, c_1 + col_offset, r_2 + row_offset, c_2 + col_offset)
+
+    def Find(self, What,
+                   After=None,
+                   LookIn=xlValues,
+                   LookAt=xlPart,
+                   SearchOrder=xlByRows,
+                   SearchDirection=xlNext,
+                   MatchCase=False):
+        """ search starts after the After cell and wraps around the range, (After is searched last) """
+        r_1, c_1, r_2, c_2 = self.bounds
+        is_match = _find_predicate(What, LookAt, MatchCase)
+
+        if SearchOrder == xlByColumns:
+            order_key = lambda rc: (rc[1], rc[0])
+        else:
+            order_key = lambda rc: rc
+
+        keys = [order_key(rc) for rc, v in self.ws.cells_within(r_1, c_1, r_2, c_2) if is_match(v)]
+        if not keys:
+            return None
+
+        if After is None:
+            After = self.item(1) if SearchDirection == xlPrevious else self.item(self.num_cells)
+
+        k_after = order_key(After.bounds[:2])
+
+        if SearchDirection == xlPrevious:
+            before = [k for k in keys if k < k_after]
+            k = max(before) if before else max(keys)
+        else:
+            after = [k for k in keys if k > k_after]
+            k = min(after) if after else min(keys)
+
+        r, c = order_key(k)
+        return Range(self.ws, r, c, r, c)
+
+    def SpecialCells(self, Type, Value=None):
+        """ raises com_error when no cells are found, (as in Excel) """
+        ws = self.ws
+        r_1, c_1, r_2, c_2 = self.bounds
+
+        if Type == xlCellTypeLastCell:
+            _, _, r, c = ws.used_bounds()
+            return Range(ws, r, c, r, c)
+
+        is_error = lambda v: type(v) is int and v in excel_errors
+
+        if Type == xlCellTypeFormulas:
+            union = [rc for rc, v in ws.cells_within(r_1, c_1, r_2, c_2) if is_error(v)]
+            if Value is not None and not (Value & xlErrors):
+                union = []
+
+        elif Type == xlCellTypeConstants:
+            union = [rc for rc, v in ws.cells_within(r_1, c_1, r_2, c_2) if not is_error(v)]
+
+        elif Type == xlCellTypeBlanks:
+            u_1, _, u_2, _ = ws.used_bounds()
+            union = [(r, c) for r in range(max(r_1, u_1), min(r_2, u_2) + 1)
+                            for c in range(c_1, c_2 + 1)
+                            if ws.rows.get(r, {}).get(c, '') == '']
+        else:
+            raise NotImplementedError('SpecialCells type not implemented: {}'.format(Type))
+
+        if not union:
+            raise com_error(com_error_no_cells, 'No cells were found.')
+
+        union.sort()
+        return Range(ws, *union[0], *union[-1], union=union)
+
+    def AutoFilter(self, *args, **kwargs):
+        self.ws.auto_filter = AutoFilter(self.excel_app, self)
+        return True
+
+    def ClearContents(self):
+        r_1, c_1, r_2, c_2 = self.bounds
+
+        for (r, c), _ in self.ws.cells_within(r_1, c_1, r_2, c_2):
+            self.ws.set_value(r, c, None)
+
+    def Calculate(self):
+        pass
+
+    def Select(self):
+        pass
+
+    def __call__(self, i, j=None):
+        self.excel_app.record_call(self, 'Item')
+        return self.item(i, j)
+
+    def __iter__(self):
+        if self.count_by == 'rows':      count = self.num_rows
+        elif self.count_by == 'columns': count = self.num_cols
+        else:                            count = self.num_cells
+
+        for i in range(1, count + 1):
+            self.excel_app.record_call(self, 'Item')
+            yield self.item(i)
+
+    def __repr__(self):
+        return "{}: '{}'!{}".format(self.__class__.__name__,
+                                    object.__getattribute__(self.ws, 'Name'),
+                                    self.address)
+
+
+def _parse_address(a):
+    """ eg: '$A$1:$C$10' -> (1, 1, 10, 3), 'A:C' -> (1, 1, max_rows, 3), '2:5' -> (2, 1, 5, max_cols) """
+    try:
+        a = str(a).replace(' ', '')
+        if ',' in a or not a:
+            raise ValueError
+
+        bounds = []
+        for a_i in a.split(':'):
+            match = address_pattern.match(a_i)
+            if match is None or not (match.group('c') or match.group('r')):
+                raise ValueError
+
+            bounds.append((match.group('c'), match.group('r')))
+
+        (c_1, r_1), (c_2, r_2) = bounds[0], bounds[-1]
+
+        r_1 = int(r_1) if r_1 else 1
+        r_2 = int(r_2) if r_2 else (excel_max_rows if len(bounds) > 1 or not c_2 else r_1)
+        c_1 = col_number(c_1) if c_1 else 1
+        c_2 = col_number(c_2) if c_2 else excel_max_cols
+
+    except (ValueError, TypeError):
+        raise com_error(com_error_exception, "Method 'Range' of object '_Worksheet' failed: '{}'".format(a)) from None
+
+    return min(r_1, r_2), min(c_1, c_2), max(r_1, r_2), max(c_1, c_2)
+
+
+def _cell_address(r, c):
+    return '${}${}'.format(col_letter(c), r)
+
+
+def _com_value(v):
+    """ values are stored as Excel would return them through COM: numbers as float, dates as datetime """
+    if v is None or v == '':
+        return None
+    if isinstance(v, bool):
+        return v
+    if type(v) is int and v in excel_errors:
+        return v
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, (str, datetime)):
+        return v
+    if isinstance(v, date):
+        return datetime(v.year, v.month, v.day)
+
+    raise TypeError("Objects of type '{}' can not be converted to a COM VARIANT".format(type(v).__name__))
+
+
+def _find_predicate(what, look_at, match_case):
+    what = str(what)
+
+    if what == '*' and look_at == xlPart:
+        return lambda v: v is not None and v != ''
+
+    pattern = ''.join('.*' if char == '*' else
+                      '.'  if char == '?' else re.escape(char) for char in what)
+    flags   = 0 if match_case else re.I
+
+    if look_at == xlWhole:
+        pattern = re.compile(pattern + r'\Z', flags).match
+    else:
+        pattern = re.compile(pattern, flags).search
+
+    return lambda v: v is not None and pattern(_display_text(v)) is not None
+
+
+def _display_text(v):
+    if isinstance(v, bool):
+        return str(v).upper()
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+
+    return str(v)
+
+
+if __name__ == '__main__':
+    benchmark_lev_cls()
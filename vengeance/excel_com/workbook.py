@@ -2,27 +2,37 @@
 import ctypes
 import gc
 import os
-import pythoncom
 
-# noinspection PyUnresolvedReferences
-from pythoncom import com_error as pythoncom_error
-from _ctypes import COMError as ctypes_error
+from time import sleep
 
-from ctypes import byref
-from ctypes import c_void_p
-from ctypes import py_object
-from ctypes import POINTER
-from ctypes import PyDLL
-from ctypes.wintypes import BOOL
+from ..conditional import win32com_installed
 
-from comtypes                 import IUnknown
-from comtypes.client          import CreateObject as comtypes_createobject
-from comtypes.automation      import IDispatch    as comtypes_idispatch
-from comtypes.client.dynamic  import Dispatch     as comtypes_dispatch       # late-bound references
+if win32com_installed:
+    import pythoncom
 
-from time import sleep
+    # noinspection PyUnresolvedReferences
+    from pythoncom import com_error as pythoncom_error
+    from _ctypes import COMError as ctypes_error
+
+    from ctypes import byref
+    from ctypes import c_void_p
+    from ctypes import py_object
+    from ctypes import POINTER
+    from ctypes import PyDLL
+    from ctypes.wintypes import BOOL
+
+    from comtypes                 import IUnknown
+    from comtypes.client          import CreateObject as comtypes_createobject
+    from comtypes.automation      import IDispatch    as comtypes_idispatch
+    from comtypes.client.dynamic  import Dispatch     as comtypes_dispatch       # late-bound references
 
-from win32com.client.gencache import EnsureDispatch                          # early-bound references
+    from win32com.client.gencache import EnsureDispatch                          # early-bound references
+else:
+    # Excel object model stand-in, (see excel_com.fake_excel)
+    from .fake_excel import com_error as pythoncom_error
+    from .fake_excel import com_error as ctypes_error
+    from .fake_excel import com_unavailable as comtypes_createobject
+    from .fake_excel import com_unavailable as EnsureDispatch
 
 from ..util.filesystem import parse_path
 from ..util.filesystem import standardize_path
@@ -36,12 +46,20 @@ from .excel_constants import (xlMaximized,
                               xlMinimized)
 
 # Windows api functions
-FindWindowExA              = ctypes.windll.user32.FindWindowExA
-SetForegroundWindow        = ctypes.windll.user32.SetForegroundWindow
-AccessibleObjectFromWindow = ctypes.oledll.oleacc.AccessibleObjectFromWindow
-OpenProcess                = ctypes.windll.kernel32.OpenProcess
-TerminateProcess           = ctypes.windll.kernel32.TerminateProcess
-CloseHandle                = ctypes.windll.kernel32.CloseHandle
+if win32com_installed:
+    FindWindowExA              = ctypes.windll.user32.FindWindowExA
+    SetForegroundWindow        = ctypes.windll.user32.SetForegroundWindow
+    AccessibleObjectFromWindow = ctypes.oledll.oleacc.AccessibleObjectFromWindow
+    OpenProcess                = ctypes.windll.kernel32.OpenProcess
+    TerminateProcess           = ctypes.windll.kernel32.TerminateProcess
+    CloseHandle                = ctypes.windll.kernel32.CloseHandle
+else:
+    from .fake_excel import FindWindowExA
+    from .fake_excel import SetForegroundWindow
+    from .fake_excel import com_unavailable as AccessibleObjectFromWindow
+    from .fake_excel import com_unavailable as OpenProcess
+    from .fake_excel import com_unavailable as TerminateProcess
+    from .fake_excel import com_unavailable as CloseHandle
 
 corrupt_hwnds = set()
 
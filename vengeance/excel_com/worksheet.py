@@ -2,8 +2,13 @@
 from datetime import date
 from datetime import datetime
 
-# noinspection PyUnresolvedReferences
-from pythoncom import com_error as pythoncom_error
+from ..conditional import win32com_installed
+
+if win32com_installed:
+    # noinspection PyUnresolvedReferences
+    from pythoncom import com_error as pythoncom_error
+else:
+    from .fake_excel import com_error as pythoncom_error
 
 from .excel_constants import *
 from .workbook import excel_application_to_foreground
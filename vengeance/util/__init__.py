@@ -9,6 +9,7 @@ from .dates import parse_timedelta
 from .dates import parse_seconds
 
 from .filesystem import read_file
+from .filesystem import iter_file
 from .filesystem import write_file
 from .filesystem import parse_path
 from .filesystem import traverse_dir
@@ -26,6 +27,7 @@ __all__ = ['print_runtime',
            'parse_seconds',
 
            'read_file',
+           'iter_file',
            'write_file',
            'parse_path',
            'traverse_dir',
@@ -0,0 +1,152 @@
+
+"""
+runnable benchmarks for flux_cls storage and file io, (see also excel_com.fake_excel.benchmark_lev_cls)
+
+eg:
+    python -m vengeance.util.benchmarks
+"""
+import os
+import pickle
+import tempfile
+import time
+import tracemalloc
+
+from typing import List
+from typing import Tuple
+
+
+def benchmark_row_memory(num_rows=200_000,
+                         num_cols=3,
+                         print_results=True) -> List[Tuple[str, float]]:
+    """ :return: list of (row layout, bytes per row) allocated by flux_cls(m) over a prebuilt matrix
+
+    the row values lists are shared with the matrix, so only the row objects themselves are measured;
+    rows with a separate instance __dict__, (the layout before flux_row_cls used __slots__),
+    are measured for comparison
+    """
+    from ..classes.flux_cls import flux_cls
+
+    class dict_row_cls:
+        def __init__(self, headers, values, row_label=None):
+            self.__dict__['headers']   = headers
+            self.__dict__['values']    = values
+            self.__dict__['row_label'] = row_label
+
+    m = [['col_{}'.format(c) for c in range(num_cols)]]
+    m.extend([[r] * num_cols for r in range(num_rows)])
+    headers = {h: i for i, h in enumerate(m[0])}
+
+    def flux_rows(): return flux_cls(m)
+    def dict_rows(): return [dict_row_cls(headers, row, i) for i, row in enumerate(m)]
+
+    layouts = [('flux_cls(m), __slots__ rows', flux_rows),
+               ('rows with __dict__',          dict_rows)]
+
+    results = []
+    for name, f in layouts:
+        tracemalloc.start()
+        o = f()
+        nbytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del o
+
+        results.append((name, nbytes / (num_rows + 1)))
+
+    if print_results:
+        print('row memory: {:,} rows x {} columns'.format(num_rows, num_cols))
+        for name, bytes_per_row in results:
+            print('    {:<30}{:>8.1f} bytes per row'.format(name, bytes_per_row))
+
+    return results
+
+
+def benchmark_pickle(num_rows=300_000,
+                     num_cols=4,
+                     repeat=5,
+                     print_results=True) -> List[Tuple[str, float]]:
+    """ :return: list of (operation, seconds) for pickle round trips and deep copies of flux_cls,
+    against a plain list of lists as a baseline, (fastest of repeat runs)
+    """
+    from ..classes.flux_cls import flux_cls
+
+    m = [['col_{}'.format(c) for c in range(num_cols)]]
+    m.extend([[(r, float(r), str(r), None)[c % 4] for c in range(num_cols)] for r in range(num_rows)])
+
+    flux    = flux_cls(m)
+    flux_c  = flux_cls(m, storage='columns')
+    highest = pickle.HIGHEST_PROTOCOL
+
+    def pickle_round_trip(o): return pickle.loads(pickle.dumps(o, highest))
+
+    operations = [('pickle list of lists',               lambda: pickle_round_trip(m)),
+                  ('pickle flux_cls',                    lambda: pickle_round_trip(flux)),
+                  ("pickle flux_cls, storage='columns'", lambda: pickle_round_trip(flux_c)),
+                  ('flux.copy(deep=True)',               lambda: flux.copy(deep=True))]
+
+    results = [(name, __best_of(f, repeat)) for name, f in operations]
+
+    if print_results:
+        print('pickle: {:,} rows x {} columns'.format(num_rows, num_cols))
+        for name, t in results:
+            print('    {:<36}{:.4f} sec'.format(name, t))
+
+    return results
+
+
+def benchmark_parallel_csv(num_rows=1_000_000,
+                           num_cols=7,
+                           workers=4,
+                           repeat=3,
+                           print_results=True) -> List[Tuple[str, float]]:
+    """ :return: list of (read, seconds) for flux_cls.from_csv() serial and with workers, (fastest of repeat runs)
+
+    workers are capped at os.cpu_count(), so on a machine with a single cpu
+    both reads are serial; the parallel result is checked against the serial one
+    """
+    from ..classes.flux_cls import flux_cls
+
+    m = [['col_{}'.format(c) for c in range(num_cols)]]
+    m.extend([[r, 'name_{}'.format(r), r * 0.5, 'a, "b"', '', r % 7, 'x'][c % 7] for c in range(num_cols)]
+             for r in range(num_rows))
+
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        path = os.path.join(dir_tmp, 'benchmark.csv')
+        flux_cls(m).to_csv(path)
+
+        flux_serial   = flux_cls.from_csv(path)
+        flux_parallel = flux_cls.from_csv(path, workers=workers)
+        if list(flux_parallel.values()) != list(flux_serial.values()):
+            raise AssertionError('parallel csv read does not match serial read')
+
+        mb = os.path.getsize(path) / 1_000_000
+        reads = [('from_csv(path)',
+                        lambda: flux_cls.from_csv(path)),
+                 ('from_csv(path, workers={})'.format(workers),
+                        lambda: flux_cls.from_csv(path, workers=workers))]
+
+        results = [(name, __best_of(f, repeat)) for name, f in reads]
+
+    if print_results:
+        print('parallel csv: {:,} rows x {} columns, {:.0f} MB, {} cpu(s) (workers are capped at cpu count)'
+              .format(num_rows, num_cols, mb, os.cpu_count()))
+        for name, t in results:
+            print('    {:<36}{:.4f} sec'.format(name, t))
+
+    return results
+
+
+def __best_of(f, repeat):
+    """ :return: fastest time of f() in seconds """
+    t_best = float('inf')
+    for _ in range(repeat):
+        t = time.perf_counter()
+        f()
+        t_best = min(t_best, time.perf_counter() - t)
+
+    return t_best
+
+
+if __name__ == '__main__':
+    benchmark_row_memory()
+    benchmark_pickle()
+    benchmark_parallel_csv()
@@ -0,0 +1,122 @@
+
+from copy import deepcopy
+from pickle import PickleBuffer
+
+
+class mapped_column_cls:
+    """ list-like column of a .fluxb file, (see util.fluxb.read_fluxb())
+
+    reads are served directly from a memoryview of the memory-mapped file, or from a list
+    that is only decoded the first time the column is accessed; any modification
+    (eg, column[i] = v, column.append(v), column.sort()) first copies the values into
+    a regular list, so that the file itself is never written to
+
+    eg:
+        column = mapped_column_cls(memoryview(mm)[o_1:o_2].cast('q'))
+        column = mapped_column_cls(None, decode=lambda: [...], length=1_000_000)
+    """
+    __slots__ = ('view',
+                 'decode',
+                 'length',
+                 'values')
+
+    def __init__(self, view, decode=None, length=None):
+        """
+        :param view:   zero-copy memoryview of values, or None
+        :param decode: function() -> list of values, called once on first access when view is None
+        :param length: number of values, so that len() does not require decoding
+        """
+        self.view   = view
+        self.decode = decode
+        self.length = length
+        self.values = None
+
+    @classmethod
+    def from_buffer(cls, buffer, view_format, length):
+        return cls(memoryview(buffer).cast('B').cast(view_format), length=length)
+
+    @property
+    def is_decoded(self):
+        return self.values is not None
+
+    def as_list(self):
+        """ decode values into a modifiable list, (once) """
+        if self.values is None:
+            if self.view is not None:
+                self.values = self.view.tolist()
+            else:
+                self.values = self.decode()
+
+            self.view   = None
+            self.decode = None
+
+        return self.values
+
+    def __readable(self):
+        if self.values is not None:
+            return self.values
+        if self.view is not None:
+            return self.view
+
+        return self.as_list()
+
+    def __len__(self):
+        if self.values is None and self.length is not None:
+            return self.length
+
+        return len(self.__readable())
+
+    def __getitem__(self, i):
+        values = self.__readable()
+
+        if isinstance(i, slice) and values is self.view:
+            return values[i].tolist()
+
+        return values[i]
+
+    def __iter__(self):
+        return iter(self.__readable())
+
+    def __reversed__(self):
+        return reversed(self.__readable())
+
+    def __contains__(self, v):
+        return v in self.__readable()
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __setitem__(self, i, v):
+        self.as_list()[i] = v
+
+    def __delitem__(self, i):
+        del self.as_list()[i]
+
+    def __getattr__(self, name):
+        """ list methods (eg, append, extend, insert, sort, reverse) """
+        return getattr(self.as_list(), name)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(list(self), memo)
+
+    def __reduce_ex__(self, protocol):
+        """ columns that are still read zero-copy are pickled as a single buffer,
+        (out-of-band with pickle protocol 5 and a buffer_callback) """
+        if self.view is not None and protocol >= 5:
+            return (self.__class__.from_buffer, (PickleBuffer(self.view),
+                                                 self.view.format,
+                                                 len(self.view)))
+
+        return (list, (list(self),))
+
+    def __repr__(self):
+        if self.is_decoded:
+            return repr(self.values)
+
+        return '{}: {:,} values (not decoded)'.format(self.__class__.__name__, len(self))
@@ -0,0 +1,35 @@
+
+class reversed_value_cls:
+    """
+    inverts comparisons of the wrapped value, so that a single sort key
+    can mix ascending and descending columns, eg
+        sorted(rows, key=lambda row: (row.col_a, reversed_value_cls(row.col_b)))
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __gt__(self, other):
+        return other.value > self.value
+
+    def __le__(self, other):
+        return other.value <= self.value
+
+    def __ge__(self, other):
+        return other.value >= self.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.value)
@@ -9,7 +9,16 @@ from ..conditional import dateutil_installed
 if dateutil_installed:
     from dateutil.parser import parse as dateutil_parse
 
-excel_epoch = datetime(1900, 1, 1)
+excel_epoch      = datetime(1899, 12, 30)
+excel_epoch_1904 = datetime(1904, 1, 1)
+
+common_date_formats = ('%m-%d-%Y',       # 01-01-2000
+                       '%m/%d/%Y',       # 01/01/2000
+                       '%Y-%m-%d',       # 2000-01-01
+                       '%Y/%m/%d',       # 2000/01/01
+                       '%Y-%b-%d',       # 2000-Jan-01
+                       '%d-%b-%Y',       # 01-Jan-2000
+                       '%Y%m%d')         # 20000101
 
 
 def to_datetime(v, d_format=None):
@@ -69,17 +78,35 @@ def parse_date_unix_timestamp(v):
         return None
 
 
-def parse_date_excel_serial(v):
-    """ number of days since 1900-01-01 """
+def parse_date_excel_serial(v, date1904=False):
+    """ eg:
+        datetime.datetime(2000, 1, 1, 0, 0) = parse_date_excel_serial(36526)
+
+    serial 1 is 1900-01-01, but Excel also counts a non-existent 1900-02-29 (serial 60),
+    so serials from 61 onwards are days since 1899-12-30
+    fractional serials include the time of day
+
+    :param date1904: workbooks using the 1904 date system count days since 1904-01-01
+    """
     try:
+        if date1904:
+            return excel_epoch_1904 + timedelta(days=v)
+        if 0 < v < 60:
+            return excel_epoch + timedelta(days=v + 1)
+
         return excel_epoch + timedelta(days=v)
-    except ValueError:
+    except (ValueError, TypeError, OverflowError):
         return None
 
 
 def to_excel_serial(v):
     v = to_datetime(v)
-    return (v - excel_epoch).days
+    serial = (v - excel_epoch).days
+
+    if serial < 61:
+        serial -= 1
+
+    return serial
 
 
 def parse_date_numeric_string(v):
@@ -109,14 +136,44 @@ def parse_date_string(s, d_format):
     return date_time
 
 
+def infer_date_format(values):
+    """ :return: the first date format that parses every value, or None
+
+    'isoformat' is returned for values accepted by datetime.fromisoformat(),
+    otherwise the format is one of common_date_formats
+
+    eg:
+        '%m/%d/%Y' = infer_date_format(['01/31/2000', '02/01/2000'])
+    """
+    values = [v for v in values if isinstance(v, str)]
+    if not values:
+        return None
+
+    if __all_parse(datetime.fromisoformat, values):
+        return 'isoformat'
+
+    if not all(__compatible_with_strptime_lengths(v, common_date_formats) for v in values):
+        return None
+
+    for d_format in common_date_formats:
+        if __all_parse(lambda v: datetime.strptime(v, d_format), values):
+            return d_format
+
+    return None
+
+
+def __all_parse(parse, values):
+    try:
+        for v in values:
+            parse(v)
+    except ValueError:
+        return False
+
+    return True
+
+
 def __parse_date_strptime(s):
-    common_formats = ('%m-%d-%Y',       # 01-01-2000
-                      '%m/%d/%Y',       # 01/01/2000
-                      '%Y-%m-%d',       # 2000-01-01
-                      '%Y/%m/%d',       # 2000/01/01
-                      '%Y-%b-%d',       # 2000-Jan-01
-                      '%d-%b-%Y',       # 01-Jan-2000
-                      '%Y%m%d')         # 20000101
+    common_formats = common_date_formats
 
     if 'T' in s:
         try:
@@ -0,0 +1,212 @@
+
+import gc
+import re
+
+from datetime import date
+from datetime import datetime
+from typing import Dict
+from typing import List
+from typing import Union
+
+from .dates import infer_date_format
+from .iter import ColumnNameError
+
+int_pattern   = re.compile(r'[+-]?(0|[1-9][0-9]*)\Z')
+zero_pattern  = re.compile(r'[+-]?0[0-9]+\Z')
+float_pattern = re.compile(r'[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?\Z')
+bool_values   = {'true':  True,
+                 'false': False}
+
+conversion_errors = (ValueError,
+                     TypeError,
+                     KeyError,
+                     OverflowError)
+
+
+def infer_dtype(values) -> type:
+    """ :return: int, float, bool, date, datetime or str
+
+    values are expected to be strings (eg, from a csv file), blank values are ignored
+    integers with leading zeros (eg, zip codes) are kept as str
+
+    eg:
+        int = infer_dtype(['1', '2', '', '3'])
+    """
+    values = [v for v in values if v != '' and v is not None]
+
+    if not values or not all(isinstance(v, str) for v in values):
+        return str
+
+    if any(zero_pattern.match(v)  for v in values): return str
+    if all(int_pattern.match(v)   for v in values): return int
+    if all(float_pattern.match(v) for v in values): return float
+    if all(v.lower() in bool_values for v in values): return bool
+
+    d_format = infer_date_format(values)
+    if d_format == 'isoformat':
+        if all(len(v) == 10 for v in values):
+            return date
+
+        return datetime
+    elif d_format is not None:
+        return date
+
+    return str
+
+
+def column_converters(names, rows, dtypes, sample_size=1_000) -> List[Union[callable, None]]:
+    """ :return: list of conversion functions, one for each column (None where values are left as str)
+
+    :param names:       header names
+    :param rows:        rows of values, (the first sample_size rows are used for inference)
+    :param dtypes:      'infer', or dictionary of {name: type or function}, where type is
+                        int, float, bool, date, datetime or str
+    :param sample_size: number of rows used to infer types and date formats
+    """
+    names  = list(names)
+    sample = rows[:sample_size]
+
+    if isinstance(dtypes, str):
+        if dtypes.lower() != 'infer':
+            raise ValueError("dtypes must be 'infer' or a dictionary of {{name: type}}, not '{}'".format(dtypes))
+
+        dtypes = {c: infer_dtype(__column_sample(sample, c)) for c in range(len(names))}
+    elif isinstance(dtypes, dict):
+        dtypes = {__validate_column_index(name, names): dtype for name, dtype in dtypes.items()}
+    else:
+        raise TypeError("dtypes must be 'infer' or a dictionary of {name: type}")
+
+    converters = [None] * len(names)
+    for c, dtype in dtypes.items():
+        converters[c] = __dtype_converter(dtype, __column_sample(sample, c))
+
+    return converters
+
+
+def convert_rows(rows, converters, names=None, strict=False, r_1=1) -> List[List]:
+    """ :return: new list of rows with converted values
+
+    values are converted one whole column at a time with map(), only a column
+    with a value that cannot be converted is re-evaluated value by value:
+        blank values ('') are converted to None
+        strict=False: values that cannot be converted are left unchanged
+        strict=True:  ValueError is raised for the first value that cannot be converted
+
+    :param names: header names, for error messages
+    :param r_1:   row number of the first row, for error messages, (eg, when rows are read in chunks)
+    """
+    typed = [(c, f) for c, f in enumerate(converters) if f is not None]
+    if not rows or not typed:
+        return rows
+
+    names    = list(names or range(len(converters)))
+    num_cols = len(rows[0])
+
+    gc_enabled   = gc.isenabled()
+    if gc_enabled: gc.disable()
+
+    is_jagged = any(len(row) != num_cols for row in rows)
+    if is_jagged or num_cols < len(converters):
+        rows = [__convert_row(i, row, typed, names, strict) for i, row in enumerate(rows, r_1)]
+    else:
+        columns = list(zip(*rows))
+        for c, f in typed:
+            columns[c] = __convert_column(columns[c], f, names[c], strict, r_1)
+
+        rows = list(map(list, zip(*columns)))
+
+    if gc_enabled: gc.enable()
+
+    return rows
+
+
+def __convert_column(values, f, name, strict, r_1):
+    try:
+        return list(map(f, values))
+    except conversion_errors:
+        pass
+
+    # blank values are the most common reason for a failed conversion
+    try:
+        return [None if v == '' else f(v) for v in values]
+    except conversion_errors:
+        pass
+
+    return [__convert_value(i, v, f, name, strict) for i, v in enumerate(values, r_1)]
+
+
+def __convert_row(i, row, typed, names, strict):
+    row = list(row)
+
+    for c, f in typed:
+        if c < len(row):
+            row[c] = __convert_value(i, row[c], f, names[c], strict)
+
+    return row
+
+
+def __convert_value(i, v, f, name, strict):
+    if v == '' or v is None:
+        return None
+
+    try:
+        return f(v)
+    except conversion_errors as e:
+        if strict:
+            raise ValueError("row {:,}, column '{}': cannot convert value {!r} ({})".format(i, name, v, e)) from e
+
+        return v
+
+
+def __dtype_converter(dtype, sample):
+    if dtype in (str, None):
+        return None
+
+    if dtype is int:      return int
+    if dtype is float:    return float
+    if dtype is bool:     return lambda v: bool_values[v.lower()] if isinstance(v, str) else bool(v)
+    if dtype is date:     return __date_converter(sample, as_date=True)
+    if dtype is datetime: return __date_converter(sample, as_date=False)
+
+    if callable(dtype):
+        return dtype
+
+    raise TypeError('invalid dtype: {}, dtypes must be int, float, bool, date, datetime, str '
+                    'or a conversion function'.format(dtype))
+
+
+def __date_converter(sample, as_date):
+    """ date strings are parsed once per unique value, then cached """
+    # region {closure classes}
+    class parsed_dates(dict):
+        def __missing__(self, v):
+            d = parse(v)
+            if as_date and isinstance(d, datetime):
+                d = d.date()
+
+            self[v] = d
+            return d
+    # endregion
+
+    d_format = infer_date_format([v for v in sample if v != '' and v is not None])
+
+    if d_format is None or d_format == 'isoformat':
+        parse = datetime.fromisoformat
+    else:
+        parse = lambda v: datetime.strptime(v, d_format)
+
+    return parsed_dates().__getitem__
+
+
+def __column_sample(rows, c):
+    return [row[c] for row in rows if c < len(row)]
+
+
+def __validate_column_index(name, names):
+    if isinstance(name, int) and not isinstance(name, bool):
+        if -len(names) <= name < len(names):
+            return name % len(names)
+    elif name in names:
+        return names.index(name)
+
+    raise ColumnNameError("dtypes column '{}' does not exist, available columns: {}".format(name, names))
@@ -1,20 +1,41 @@
 
+import bz2
+import codecs
 import csv
 import gc
+import gzip
+import locale
+import lzma
+import mmap
 import os
 import pickle
 import shutil
 
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import date
 from datetime import datetime
 from functools import lru_cache
+from functools import partial
 from glob import glob
 from io import StringIO
+from io import TextIOWrapper
+from itertools import chain
+from itertools import dropwhile
+from itertools import islice
+from itertools import repeat
+from operator import itemgetter
 from os.path import isdir  as os_isdir
 from os.path import isfile as os_isfile
 from urllib.parse import urlparse
 from urllib.request import urlopen
+from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED
+
+from .xlsx import read_xlsx
+from .xlsx import iter_xlsx
+from .xlsx import write_xlsx
 
 from ..conditional import is_windows_os
 from ..conditional import ultrajson_installed
@@ -28,6 +49,21 @@ else:
 pickle_extensions = {'.flux',
                      '.pkl',
                      '.pickle'}
+jsonl_extensions  = {'.jsonl',
+                     '.ndjson'}
+xlsx_extensions   = {'.xlsx',
+                     '.xlsm'}
+
+csv_parallel_range_size = 1 << 20
+csv_range_separator     = '\x00'
+
+compression_extensions = {'.gz':   'gzip',
+                          '.gzip': 'gzip',
+                          '.bz2':  'bz2',
+                          '.bz':   'bz2',
+                          '.xz':   'lzma',
+                          '.lzma': 'lzma',
+                          '.zip':  'zip'}
 
 
 def read_file(path,
@@ -47,24 +83,32 @@ def read_file(path,
                                        kwargs,
                                        'read')
 
+    f_open = __file_opener(path)
+
     gc_enabled   = gc.isenabled()
     if gc_enabled: gc.disable()
 
     if filetype == '.csv':
-        data = __read_csv(path, mode, encoding, kwargs)
+        data = __read_csv(path, mode, encoding, f_open, kwargs)
 
     elif filetype == '.json':
-        data = __read_json(path, mode, encoding, kwargs)
+        data = __read_json(path, mode, encoding, f_open, kwargs)
+
+    elif filetype in jsonl_extensions:
+        data = __read_jsonl(path, mode, encoding, f_open, kwargs)
+
+    elif filetype in xlsx_extensions:
+        data = read_xlsx(path, **kwargs)
 
     elif is_path_a_url(path):
         data = __url_request(path, encoding=encoding)
 
     elif filetype in pickle_extensions:
-        with open(path, mode) as f:
+        with f_open(path, mode) as f:
             data = pickle.load(f, **kwargs)
 
     else:
-        with open(path, mode, encoding=encoding) as f:
+        with f_open(path, mode, encoding=encoding) as f:
             data = f.read()
 
     if gc_enabled: gc.enable()
@@ -72,6 +116,50 @@ def read_file(path,
     return data
 
 
+def iter_file(path,
+              encoding=None,
+              mode='r',
+              filetype=None,
+              chunksize=100_000,
+              **kwargs):
+    """ yield lists of rows from a csv file or url, so that only one chunk of
+    rows is ever held in memory
+
+    the first chunk also includes the header row, (chunksize + 1 rows)
+    nrows, exclude_header_row and csv dialect keyword arguments are the same as read_file()
+
+    .jsonl / .ndjson files yield lists of (at most chunksize) decoded json records
+    .xlsx / .xlsm files are streamed one worksheet row at a time, (sheet, header_row
+    and nrows keyword arguments, see util.xlsx.read_xlsx())
+
+    eg:
+        for m in iter_file('file.csv', chunksize=50_000):
+            ...
+    """
+    (path,
+     encoding,
+     filetype,
+     mode,
+     kwargs) = __validate_io_arguments(path,
+                                       encoding,
+                                       mode,
+                                       filetype,
+                                       kwargs,
+                                       'read')
+
+    chunksize = __validate_chunksize(chunksize)
+    f_open    = __file_opener(path)
+
+    if filetype == '.csv':
+        return __iter_csv(path, mode, encoding, chunksize, f_open, kwargs)
+    if filetype in jsonl_extensions:
+        return __iter_jsonl(path, mode, encoding, chunksize, f_open, kwargs)
+    if filetype in xlsx_extensions:
+        return iter_xlsx(path, chunksize=chunksize, **kwargs)
+
+    raise NotImplementedError("chunked reading not supported for file type: '{}'".format(filetype))
+
+
 def write_file(path,
                data,
                encoding=None,
@@ -91,21 +179,33 @@ def write_file(path,
                                        'write',
                                        is_data_bytes=isinstance(data, bytes))
 
+    compresslevel = kwargs.pop('compresslevel', None)
+    f_open        = __file_opener(path, compresslevel)
+
     gc_enabled   = gc.isenabled()
     if gc_enabled: gc.disable()
 
     if filetype == '.csv':
-        __write_csv(path, data, mode, encoding, kwargs)
+        __write_csv(path, data, mode, encoding, f_open, kwargs)
 
     elif filetype == '.json':
-        __write_json(path, data, mode, encoding, kwargs)
+        __write_json(path, data, mode, encoding, f_open, kwargs)
+
+    elif filetype in jsonl_extensions:
+        __write_jsonl(path, data, mode, encoding, f_open, kwargs)
+
+    elif filetype in xlsx_extensions:
+        if 'a' in mode:
+            raise ValueError('cannot append to {} files'.format(filetype))
+
+        write_xlsx(path, data, compresslevel=compresslevel, **kwargs)
 
     elif filetype in pickle_extensions:
-        with open(path, mode) as f:
+        with f_open(path, mode) as f:
             pickle.dump(data, f, **kwargs)
 
     else:
-        with open(path, mode, encoding=encoding) as f:
+        with f_open(path, mode, encoding=encoding) as f:
             f.write(data)
 
     if gc_enabled: gc.enable()
@@ -145,20 +245,21 @@ def __validate_path(path):
 def __validate_filetype(path, filetype):
     """ check for file types that require specialized io libraries / protocols """
     notimplemented_extensions = {'.7z',
-                                 '.zip',
-                                 '.gzip',
-                                 '.bz',
                                  '.tar',
                                  '.pdf'}
 
-    filetype = filetype or parse_file_extension(path, include_dot=True)
+    filetype = filetype or parse_file_extension(path, include_dot=True, ignore_compression=True)
     filetype = filetype.lower()
 
     if not filetype.startswith('.'):
         filetype = '.' + filetype
 
-    if filetype.startswith('.xl') or filetype in notimplemented_extensions:
+    is_excel_binary = filetype.startswith('.xl') and (filetype not in xlsx_extensions)
+
+    if is_excel_binary or filetype in notimplemented_extensions:
         raise NotImplementedError("file type not supported: '{}'".format(filetype))
+    if filetype in xlsx_extensions and file_compression(path) is not None:
+        raise ValueError('{} files are already zip-compressed: {}'.format(filetype, path))
 
     return filetype
 
@@ -230,7 +331,7 @@ def __validate_read_or_write(path, mode, read_or_write):
     return read_or_write
 
 
-def __read_csv(path, mode, encoding, kwargs):
+def __read_csv(path, mode, encoding, f_open, kwargs):
     """
     _csv.Error: new-line character seen in unquoted field - do you need to open the file in universal-newline mode?
         fixed by passing lineterminator='\r'
@@ -281,8 +382,23 @@ def __read_csv(path, mode, encoding, kwargs):
     newline            = kwargs.pop('newline')
     nrows              = kwargs.pop('nrows')
     exclude_header_row = kwargs.pop('exclude_header_row')
+    workers            = kwargs.pop('workers', None)
     read_all_rows      = (nrows is None)
 
+    is_parallel = (workers is not None and workers > 1 and
+                   read_all_rows and
+                   newline == '' and
+                   f_open is open and
+                   not is_path_a_url(path))
+    if is_parallel:
+        csv_m = __read_csv_parallel(path, encoding, workers, kwargs)
+
+        if csv_m is not None:
+            if exclude_header_row:
+                del csv_m[0:1]
+
+            return csv_m
+
     if is_path_a_url(path):
         s = __url_request(path, encoding)
 
@@ -296,14 +412,296 @@ def __read_csv(path, mode, encoding, kwargs):
 
             return csv_m
     else:
-        with open(path, mode, encoding=encoding, newline=newline) as f:
+        with f_open(path, mode, encoding=encoding, newline=newline) as f:
             csv_reader = csv.reader(f, **kwargs)
             csv_m      = read_csv_rows()
 
             return csv_m
 
 
-def __write_csv(path, data, mode, encoding, kwargs):
+def __read_csv_parallel(path, encoding, workers, kwargs):
+    """ :return: list of rows, or None if the file cannot be split safely (the file is then read serially)
+
+    the file is split into byte ranges that end on a newline outside of any quoted field,
+    (determined by the parity of quote characters before the newline) and each range is
+    parsed by csv.reader in a separate process, ranges are concatenated in their original order
+
+    transferring rows back from the worker processes as pickled lists of strings would cost
+    about as much as parsing them, so each worker joins its values into one string instead,
+    which the main process splits back into rows, (see __csv_range_block())
+
+    ranges are parsed with strict=True: if a range ends inside a quoted field (eg, because
+    of a quote character in the middle of an unquoted field), csv.Error is raised and
+    the whole file is read serially instead, so results are always identical to serial parsing
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    dialect  = csv.reader(StringIO(''), **kwargs).dialect
+    workers  = min(workers, os.cpu_count() or 1)
+
+    if workers < 2:
+        return None
+    if not __is_ascii_compatible(encoding):
+        return None
+    if dialect.escapechar is not None or not dialect.doublequote:
+        return None
+
+    num_ranges = min(workers * 4, os.path.getsize(path) // csv_parallel_range_size)
+    if num_ranges < 2:
+        return None
+
+    if dialect.quoting == csv.QUOTE_NONE:
+        quotechar = None
+    else:
+        quotechar = dialect.quotechar.encode(encoding)
+
+    offsets = __csv_range_offsets(path, num_ranges, quotechar)
+    if len(offsets) < 3:
+        return None
+
+    kwargs = {**kwargs, 'strict': True}
+
+    gc_enabled   = gc.isenabled()
+    if gc_enabled: gc.disable()
+
+    csv_m = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        blocks = executor.map(__parse_csv_range, repeat(path),
+                                                 offsets[:-1],
+                                                 offsets[1:],
+                                                 repeat(encoding),
+                                                 repeat(kwargs))
+        for block in blocks:
+            if block is None:
+                csv_m = None
+                break
+
+            csv_m.extend(__csv_block_rows(block))
+
+    if gc_enabled: gc.enable()
+
+    return csv_m
+
+
+def __csv_range_offsets(path, num_ranges, quotechar):
+    """ :return: byte offsets of record boundaries, starting with 0 and ending with file size """
+    size    = os.path.getsize(path)
+    step    = size // num_ranges
+    offsets = [0]
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for k in range(1, num_ranges):
+                i = max(k * step, offsets[-1] + 1)
+                if quotechar is None:
+                    num_quotes = 0
+                else:
+                    num_quotes = mm[offsets[-1]:i].count(quotechar)
+
+                while True:
+                    i_nl = mm.find(b'\n', i)
+                    if i_nl == -1:
+                        i = size
+                        break
+
+                    if quotechar is not None:
+                        num_quotes += mm[i:i_nl].count(quotechar)
+
+                    i = i_nl + 1
+                    if num_quotes % 2 == 0:
+                        break
+
+                if i >= size:
+                    break
+
+                offsets.append(i)
+
+    offsets.append(size)
+
+    return offsets
+
+
+def __parse_csv_range(path, i_1, i_2, encoding, kwargs):
+    """ runs in a worker process, see __read_csv_parallel() """
+    with open(path, 'rb') as f:
+        f.seek(i_1)
+        s = f.read(i_2 - i_1).decode(encoding)
+
+    gc.disable()
+
+    try:
+        rows = list(csv.reader(StringIO(s, newline=''), **kwargs))
+    except csv.Error:
+        return None
+
+    return __csv_range_block(rows, s)
+
+
+def __csv_range_block(rows, s):
+    """ :return: (joined values, num_cols), or (rows, None) for jagged rows or values
+    that contain the separator character """
+    if not rows:
+        return rows, None
+
+    num_cols = len(rows[0])
+    if num_cols == 0 or csv_range_separator in s or any(len(row) != num_cols for row in rows):
+        return rows, None
+
+    return csv_range_separator.join(chain.from_iterable(rows)), num_cols
+
+
+def __csv_block_rows(block):
+    values, num_cols = block
+    if num_cols is None:
+        return values
+
+    values = values.split(csv_range_separator)
+
+    return [values[i:i + num_cols] for i in range(0, len(values), num_cols)]
+
+
+def __is_ascii_compatible(encoding):
+    """ newline and quote bytes can only be searched for directly in ascii-compatible encodings """
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+
+    if name == 'utf-8-sig':
+        return True
+
+    return '\n"'.encode(name) == b'\n"'
+
+
+def __iter_csv(path, mode, encoding, chunksize, f_open, kwargs):
+    # region {closures}
+    def csv_chunks(csv_reader, is_url):
+        if exclude_header_row:
+            next(csv_reader, None)
+
+        if is_url:
+            csv_reader = dropwhile(lambda row: row and is_path_a_url(row[0]), csv_reader)
+
+        if nrows is not None:
+            csv_reader = islice(csv_reader, nrows)
+
+        n = chunksize + 1
+        while True:
+            gc_enabled   = gc.isenabled()
+            if gc_enabled: gc.disable()
+
+            m = list(islice(csv_reader, n))
+
+            if gc_enabled: gc.enable()
+
+            if not m:
+                return
+
+            yield m
+            n = chunksize
+    # endregion
+
+    kwargs = __validate_csv_keyword_args(kwargs)
+
+    newline            = kwargs.pop('newline')
+    nrows              = kwargs.pop('nrows')
+    exclude_header_row = kwargs.pop('exclude_header_row')
+
+    if is_path_a_url(path):
+        with urlopen(path) as request:
+            if request.code != 200:
+                raise IOError('bad url request: ({}) {}'.format(request.code, path))
+
+            with TextIOWrapper(request, encoding=encoding or 'utf-8', newline=newline) as f:
+                yield from csv_chunks(csv.reader(f, **kwargs), is_url=True)
+    else:
+        with f_open(path, mode, encoding=encoding, newline=newline) as f:
+            yield from csv_chunks(csv.reader(f, **kwargs), is_url=False)
+
+
+def __file_opener(path, compresslevel=None):
+    """ :return: function with the same arguments as open(), for the compression of path """
+    compression = file_compression(path)
+
+    if compression is None and compresslevel is None:
+        return open
+
+    return partial(__open_file, compression=compression,
+                                compresslevel=compresslevel)
+
+
+@contextmanager
+def __open_file(path, mode, encoding=None, newline=None, compression=None, compresslevel=None):
+    """ stream through gzip, bz2, lzma or single-member zip archives
+
+    eg:
+        file.csv.gz, file.json.bz2, file.jsonl.xz, file.csv.zip
+    """
+    is_bytes_mode = ('b' in mode)
+    text_mode     = mode if is_bytes_mode else mode.replace('t', '') + 't'
+
+    if compression is None:
+        with open(path, mode, encoding=encoding, newline=newline) as f:
+            yield f
+
+    elif compression == 'zip':
+        with __open_zip_member(path, mode, compresslevel) as f_b:
+            if is_bytes_mode:
+                yield f_b
+            else:
+                with TextIOWrapper(f_b, encoding=encoding, newline=newline) as f:
+                    yield f
+    else:
+        codec_open = {'gzip': gzip.open,
+                      'bz2':  bz2.open,
+                      'lzma': lzma.open}[compression]
+
+        codec_kwargs = {}
+        if compresslevel is not None and 'r' not in mode:
+            if compression == 'lzma': codec_kwargs['preset']        = compresslevel
+            else:                     codec_kwargs['compresslevel'] = compresslevel
+
+        if is_bytes_mode:
+            with codec_open(path, mode, **codec_kwargs) as f:
+                yield f
+        else:
+            with codec_open(path, text_mode, encoding=encoding, newline=newline, **codec_kwargs) as f:
+                yield f
+
+
+@contextmanager
+def __open_zip_member(path, mode, compresslevel):
+    """ zip archives are read and written with exactly one member file """
+    if 'a' in mode:
+        raise ValueError('append mode is not supported for zip archives')
+
+    if 'r' in mode:
+        with ZipFile(path, 'r') as zf:
+            names = [n for n in zf.namelist() if not n.endswith('/')]
+            if len(names) != 1:
+                raise ValueError('zip archive must contain exactly one file, {} contains {}: {}'
+                                 .format(path, len(names), names))
+
+            with zf.open(names[0], 'r') as f:
+                yield f
+    else:
+        name = os.path.basename(path)[:-len('.zip')]
+
+        with ZipFile(path, 'w', compression=ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+            with zf.open(name, 'w') as f:
+                yield f
+
+
+def __validate_chunksize(chunksize):
+    if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+        raise TypeError('chunksize must be an integer')
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive')
+
+    return chunksize
+
+
+def __write_csv(path, data, mode, encoding, f_open, kwargs):
     for invalid_kw in ('nrows', 'exclude_header_row'):
         if invalid_kw in kwargs:
             raise TypeError("'{}' is an invalid keyword argument for csv write".format(invalid_kw))
@@ -314,7 +712,7 @@ def __write_csv(path, data, mode, encoding, kwargs):
     del kwargs['nrows']
     del kwargs['exclude_header_row']
 
-    with open(path, mode, encoding=encoding, newline=newline) as f:
+    with f_open(path, mode, encoding=encoding, newline=newline) as f:
         csv.writer(f, **kwargs).writerows(data)
 
 
@@ -326,7 +724,7 @@ def __validate_csv_keyword_args(kwargs):
     return kwargs
 
 
-def __read_json(path, mode, encoding, kwargs):
+def __read_json(path, mode, encoding, f_open, kwargs):
     for invalid_kw in ('default',):
         if invalid_kw in kwargs:
             raise TypeError("'{}' is an invalid keyword argument for json read".format(invalid_kw))
@@ -335,17 +733,163 @@ def __read_json(path, mode, encoding, kwargs):
         s = __url_request(path, encoding=encoding)
         return json.loads(s, **kwargs)
     else:
-        with open(path, mode, encoding=encoding) as f:
+        with f_open(path, mode, encoding=encoding) as f:
             return json.load(f, **kwargs)
 
 
-def __write_json(path, data, mode, encoding, kwargs):
+def __write_json(path, data, mode, encoding, f_open, kwargs):
     kwargs = __validate_json_keyword_args(kwargs, encoding)
 
-    with open(path, mode, encoding=encoding) as f:
+    with f_open(path, mode, encoding=encoding) as f:
         json.dump(data, f, **kwargs)
 
 
+def __read_jsonl(path, mode, encoding, f_open, kwargs):
+    nrows = kwargs.pop('nrows', None)
+
+    if is_path_a_url(path):
+        s = __url_request(path, encoding)
+
+        if isinstance(s, bytes):
+            s = s.decode()
+
+        with StringIO(s) as f:
+            return list(chain.from_iterable(__jsonl_chunks(f, nrows, 10_000, kwargs)))
+    else:
+        with f_open(path, mode, encoding=encoding) as f:
+            return list(chain.from_iterable(__jsonl_chunks(f, nrows, 10_000, kwargs)))
+
+
+def __iter_jsonl(path, mode, encoding, chunksize, f_open, kwargs):
+    nrows = kwargs.pop('nrows', None)
+
+    if is_path_a_url(path):
+        with urlopen(path) as request:
+            if request.code != 200:
+                raise IOError('bad url request: ({}) {}'.format(request.code, path))
+
+            with TextIOWrapper(request, encoding=encoding or 'utf-8') as f:
+                yield from __jsonl_chunks(f, nrows, chunksize, kwargs)
+    else:
+        with f_open(path, mode, encoding=encoding) as f:
+            yield from __jsonl_chunks(f, nrows, chunksize, kwargs)
+
+
+def __jsonl_chunks(f, nrows, chunksize, kwargs):
+    """ yield lists of json records, one record per line (blank lines are skipped)
+
+    each chunk of lines is decoded with a single json.loads() call instead of one call per line:
+    every line is wrapped as ["\\u0000", line], so that a line that is not exactly one json value
+    cannot be decoded into the expected wrappers, (the wrapper's first element cannot come
+    from the file unless some line contains '\\u0000'); otherwise the chunk is decoded line by line,
+    and an invalid line raises a ValueError with its line number
+    """
+    for invalid_kw in ('default',):
+        if invalid_kw in kwargs:
+            raise TypeError("'{}' is an invalid keyword argument for json read".format(invalid_kw))
+
+    loads   = partial(json.loads, **kwargs) if kwargs else json.loads
+    pending = []
+
+    # blank lines make some batches shorter than chunksize
+    for records in __jsonl_batches(f, nrows, chunksize, loads):
+        if not pending and len(records) == chunksize:
+            yield records
+            continue
+
+        pending.extend(records)
+        while len(pending) >= chunksize:
+            yield pending[:chunksize]
+            del pending[:chunksize]
+
+    if pending:
+        yield pending
+
+
+def __jsonl_batches(f, nrows, chunksize, loads):
+    """ yield records decoded from each batch of chunksize lines, (lines are not numbered unless one is invalid) """
+    i_0       = 0           # number of lines read before batch
+    remaining = nrows
+
+    while remaining is None or remaining > 0:
+        if remaining is None: batch = list(islice(f, chunksize))
+        else:                 batch = list(islice(f, min(chunksize, remaining)))
+
+        if not batch:
+            return
+
+        records = __jsonl_decode_lines(list(filter(str.strip, batch)), loads)
+        if records is None:
+            records = [__jsonl_decode_line(i, line, loads) for i, line in enumerate(batch, i_0 + 1)
+                                                           if line.strip()]
+        i_0 += len(batch)
+
+        if remaining is not None:
+            remaining -= len(records)
+
+        yield records
+
+
+def __jsonl_decode_lines(batch, loads):
+    """ :return: list of records, one for each line, or None if any line is not exactly one json value """
+    if not batch:
+        return []
+
+    text = '],["\\u0000",'.join(batch)
+    if text.count('\\u0000') != len(batch) - 1:
+        return None
+
+    gc_enabled   = gc.isenabled()
+    if gc_enabled: gc.disable()
+
+    try:
+        wrappers = loads('[["\\u0000",' + text + ']]')
+    except ValueError:
+        wrappers = None
+    finally:
+        if gc_enabled: gc.enable()
+
+    if wrappers is None or len(wrappers) != len(batch):
+        return None
+
+    # any other element (eg, a line of '1, 2' or '[3' is not exactly one json value) fails here
+    try:
+        if set(map(len, wrappers))            != {2} or \
+           set(map(itemgetter(0), wrappers)) != {'\x00'}:
+            return None
+    except (TypeError, KeyError):
+        return None
+
+    return list(map(itemgetter(1), wrappers))
+
+
+def __jsonl_decode_line(i, line, loads):
+    try:
+        return loads(line)
+    except ValueError as e:
+        raise ValueError('invalid json on line {:,}: {}\n{}'.format(i, e, line.rstrip()[:200])) from e
+
+
+def __write_jsonl(path, data, mode, encoding, f_open, kwargs):
+    """ :param data: iterable of records, written one line at a time """
+    kwargs = __validate_jsonl_keyword_args(kwargs, encoding)
+    dumps  = partial(json.dumps, **kwargs)
+
+    with f_open(path, mode, encoding=encoding) as f:
+        f.writelines(line + '\n' for line in map(dumps, data))
+
+
+def __validate_jsonl_keyword_args(kwargs, encoding=None):
+    if kwargs.pop('indent', None) is not None:
+        raise ValueError('indent is not supported for json lines files, each record must be written on a single line')
+
+    kwargs['separators'] = kwargs.get('separators', (',', ':'))
+    kwargs = __validate_json_keyword_args(kwargs, encoding)
+    kwargs.pop('indent', None)
+
+    return kwargs
+
+
 def __validate_json_keyword_args(kwargs, encoding=None):
     kwargs['indent']       = kwargs.get('indent',       4)
     kwargs['ensure_ascii'] = kwargs.get('ensure_ascii', encoding in (None, 'ascii'))
@@ -485,9 +1029,25 @@ def parse_file_name(path):
     return filename
 
 
-def parse_file_extension(filename, include_dot=True):
-    _, extension = os.path.splitext(filename)
-    extension    = extension.strip()
+def file_compression(path):
+    """ :return: 'gzip', 'bz2', 'lzma', 'zip' or None, from the file extension of path """
+    if not isinstance(path, str) or is_path_a_url(path):
+        return None
+
+    return compression_extensions.get(parse_file_extension(path, include_dot=True).lower())
+
+
+def parse_file_extension(filename, include_dot=True, ignore_compression=False):
+    """
+    :param ignore_compression: return the extension before any compression extension,
+                               eg '.csv' for 'file.csv.gz'
+    """
+    filename, extension = os.path.splitext(filename)
+    extension           = extension.strip()
+
+    if ignore_compression and extension.lower() in compression_extensions:
+        _, extension = os.path.splitext(filename)
+        extension    = extension.strip()
 
     has_dot = extension.startswith('.')
 
@@ -0,0 +1,282 @@
+
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+
+from array import array
+from itertools import accumulate
+from typing import List
+from typing import Tuple
+
+from .filesystem import file_compression
+from .classes.mapped_column_cls import mapped_column_cls
+
+"""
+.fluxb file layout
+    magic       8 bytes     b'FLUXB\\x00\\x01\\x00'
+    schema_size 8 bytes     little-endian unsigned integer
+    schema      json        {'byteorder': 'little',
+                             'num_rows':  1_000,
+                             'columns':   [{'name':   'col_a',
+                                            'dtype':  'int64',
+                                            'blocks': {'values': [offset, nbytes],
+                                                       'nulls':  [offset, nbytes]}},
+                                           ...]}
+    blocks      raw column blocks, each aligned to 8 bytes
+
+column dtypes
+    int64, float64, bool    fixed-width values, (None values are recorded in a 'nulls' block)
+    str                     utf-8 text of all values joined together, with an 'offsets' block
+                            of character offsets (num_rows + 1)
+    object                  pickled list, for any other values
+"""
+fluxb_magic = b'FLUXB\x00\x01\x00'
+fluxb_align = 8
+
+# array typecodes, and memoryview formats for zero-copy reads
+fixed_width_dtypes = {'int64':   'q',
+                      'float64': 'd',
+                      'bool':    'B'}
+view_formats       = {'int64':   'q',
+                      'float64': 'd',
+                      'bool':    '?'}
+null_fillers       = {'int64':   0,
+                      'float64': 0.0,
+                      'bool':    False,
+                      'str':     ''}
+
+
+def write_fluxb(path, names, columns):
+    """
+    :param names:   list of column names (str)
+    :param columns: list of column value lists, all of equal length
+
+    the file is written to a temporary path first and then moved into place with os.replace(),
+    so a partially written file is never left at path; on Windows, os.replace() fails while
+    any flux_cls still has the previous file memory-mapped, (close or delete it first)
+    """
+    # region {closure functions}
+    def add_block(block_name, b):
+        nonlocal offset
+
+        b = bytes(b)
+        blocks.append(b)
+        block_offsets[block_name] = [offset, len(b)]
+
+        offset += __padded_size(len(b))
+    # endregion
+
+    __validate_uncompressed(path)
+
+    for name in names:
+        if not isinstance(name, str):
+            raise TypeError('.fluxb column names must be strings, not {}'.format(type(name).__name__))
+
+    num_rows = len(columns[0]) if columns else 0
+    schema   = {'byteorder': sys.byteorder,
+                'num_rows':  num_rows,
+                'columns':   []}
+
+    blocks = []
+    offset = 0
+
+    for name, column in zip(names, columns):
+        dtype, encoded = __encode_column(column)
+
+        block_offsets = {}
+        for block_name, b in encoded.items():
+            add_block(block_name, b)
+
+        schema['columns'].append({'name':   name,
+                                  'dtype':  dtype,
+                                  'blocks': block_offsets})
+
+    schema_b = json.dumps(schema).encode('utf-8')
+    schema_b = schema_b + b' ' * (__padded_size(len(schema_b)) - len(schema_b))
+
+    path_tmp = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(path_tmp, 'wb') as f:
+            f.write(fluxb_magic)
+            f.write(struct.pack('<Q', len(schema_b)))
+            f.write(schema_b)
+
+            for b in blocks:
+                f.write(b)
+                f.write(b'\x00' * (__padded_size(len(b)) - len(b)))
+
+        os.replace(path_tmp, path)
+    finally:
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+
+
+def read_fluxb(path, use_mmap=True) -> Tuple[List[str], List[mapped_column_cls]]:
+    """ :return: (names, columns)
+
+    with use_mmap=True, the file is memory-mapped and no column values are read until
+    a column is first accessed: int64, float64 and bool columns without any None values
+    are read zero-copy from the file, other columns are decoded on first access
+
+    *** SECURITY ***
+    columns of mixed types are stored with pickle, only read .fluxb files from trusted sources
+    """
+    __validate_uncompressed(path)
+
+    with open(path, 'rb') as f:
+        if use_mmap:
+            b = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            b = f.read()
+
+    view = memoryview(b)
+
+    if bytes(view[:len(fluxb_magic)]) != fluxb_magic:
+        raise ValueError('invalid .fluxb file: {}'.format(path))
+
+    i_1         = len(fluxb_magic)
+    schema_size = struct.unpack('<Q', view[i_1:i_1 + 8])[0]
+    schema      = json.loads(bytes(view[i_1 + 8:i_1 + 8 + schema_size]).decode('utf-8'))
+    data        = view[i_1 + 8 + schema_size:]
+
+    num_rows     = schema['num_rows']
+    is_same_byte = (schema['byteorder'] == sys.byteorder)
+
+    names   = [c['name'] for c in schema['columns']]
+    columns = [__mapped_column(data, c['dtype'], c['blocks'], num_rows, is_same_byte)
+               for c in schema['columns']]
+
+    return names, columns
+
+
+def __encode_column(column):
+    """ :return: (dtype, {block_name: bytes}) """
+    dtype, has_nulls = __column_dtype(column)
+
+    if dtype == 'object':
+        return dtype, __encode_object(column)
+
+    encoded = {}
+    values  = column
+    if has_nulls:
+        filler = null_fillers[dtype]
+
+        encoded['nulls'] = bytes([v is None for v in column])
+        values           = [filler if v is None else v for v in column]
+
+    if dtype == 'str':
+        offsets = array('q', accumulate(map(len, values), initial=0))
+
+        encoded['values']  = ''.join(values).encode('utf-8')
+        encoded['offsets'] = offsets.tobytes()
+    else:
+        try:
+            encoded['values'] = array(fixed_width_dtypes[dtype], values).tobytes()
+        except OverflowError:
+            # the original column, (not values) so that None is not replaced by filler
+            return 'object', __encode_object(column)
+
+    return dtype, encoded
+
+
+def __encode_object(column):
+    return {'values': pickle.dumps(list(column), protocol=pickle.HIGHEST_PROTOCOL)}
+
+
+def __column_dtype(column):
+    """ :return: (dtype, has_nulls) """
+    types     = set(map(type, column))
+    has_nulls = type(None) in types
+    types.discard(type(None))
+
+    if types == {int}:   return 'int64',   has_nulls
+    if types == {float}: return 'float64', has_nulls
+    if types == {bool}:  return 'bool',    has_nulls
+    if types == {str}:   return 'str',     has_nulls
+
+    return 'object', has_nulls
+
+
+def __mapped_column(data, dtype, blocks, num_rows, is_same_byte):
+    # region {closure functions}
+    def block(block_name):
+        offset, nbytes = blocks[block_name]
+        return data[offset:offset + nbytes]
+
+    def fixed_width_values():
+        a = array(typecode)
+        a.frombytes(block('values'))
+        if not is_same_byte:
+            a.byteswap()
+
+        return a
+
+    def decode_fixed_width():
+        values = fixed_width_values().tolist()
+        if dtype == 'bool':
+            values = [bool(v) for v in values]
+
+        return with_nulls(values)
+
+    def decode_str():
+        s       = bytes(block('values')).decode('utf-8')
+        offsets = fixed_width_offsets()
+
+        values = [s[o_1:o_2] for o_1, o_2 in zip(offsets, offsets[1:])]
+        return with_nulls(values)
+
+    def fixed_width_offsets():
+        a = array('q')
+        a.frombytes(block('offsets'))
+        if not is_same_byte:
+            a.byteswap()
+
+        return a
+
+    def decode_object():
+        return pickle.loads(block('values'))
+
+    def with_nulls(values):
+        if 'nulls' in blocks:
+            for i in __null_indices(block('nulls')):
+                values[i] = None
+
+        return values
+    # endregion
+
+    typecode = fixed_width_dtypes.get(dtype)
+
+    if dtype == 'object':
+        return mapped_column_cls(None, decode_object, num_rows)
+    if dtype == 'str':
+        return mapped_column_cls(None, decode_str, num_rows)
+
+    is_zero_copy = (is_same_byte and
+                    'nulls' not in blocks and
+                    isinstance(data.obj, mmap.mmap))
+
+    if is_zero_copy:
+        return mapped_column_cls(block('values').cast(view_formats[dtype]), length=num_rows)
+
+    return mapped_column_cls(None, decode_fixed_width, num_rows)
+
+
+def __null_indices(nulls):
+    nulls = bytes(nulls)
+    i     = nulls.find(1)
+
+    while i != -1:
+        yield i
+        i = nulls.find(1, i + 1)
+
+
+def __validate_uncompressed(path):
+    if file_compression(path) is not None:
+        raise ValueError('.fluxb files are memory-mapped and cannot be compressed: {}'.format(path))
+
+
+def __padded_size(nbytes):
+    return nbytes + (-nbytes % fluxb_align)
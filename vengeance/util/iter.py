@@ -1,6 +1,8 @@
 
 import re
 from collections import namedtuple
+from decimal import Decimal
+from numbers import Real
 from typing import Generator
 from typing import Union
 from typing import Any
@@ -15,12 +17,15 @@ from typing import ValuesView
 from ..conditional import ordereddict
 from .classes.tree_cls import tree_cls
 from .classes.namespace_cls import namespace_cls
+from .classes.reversed_value_cls import reversed_value_cls
 
 
 vengeance_cls_names = {'flux_cls',
                        'lev_cls',
                        'excel_levity_cls'}
 
+type_ranks = {}             # cached for each type, see sort_key()
+
 
 class IterationDepthError(TypeError):
     pass
@@ -251,6 +256,125 @@ def transpose(m, astype=None) -> Generator[Union[List, Tuple], None, None]:
     return t
 
 
+def sort_by_keys(items, keys, reverses) -> List:
+    """ :return: new list of items, stable sorted on multiple key functions
+
+    :param keys:     list of key functions, in order of precedence
+    :param reverses: list of booleans, one for each key function
+
+    each key function is called once for every item, then item indices are sorted on each
+    key in its own pass (last key first), which, on CPython, is considerably faster than a
+    single pass over composite tuple keys, as every comparison stays on scalar values
+
+    if any key has None values or values of mixed types (see is_directly_sortable()),
+    all keys are sorted together with sorted_indices() instead, before any pass is made
+    """
+    items   = list(items)
+    columns = [list(map(key, items)) for key in keys]
+
+    if all(map(is_directly_sortable, columns)):
+        i_sorted = list(range(len(items)))
+        for column, reverse in zip(reversed(columns), reversed(reverses)):
+            i_sorted.sort(key=column.__getitem__, reverse=reverse)
+    else:
+        i_sorted = sorted_indices(columns, reverses)
+
+    return list(map(items.__getitem__, i_sorted))
+
+
+def sorted_indices(columns, reverses) -> List[int]:
+    """ :return: row indices in sorted order, from a single stable sort
+
+    :param columns:  list of column values, one list for each sort column
+    :param reverses: list of booleans, one for each sort column
+
+    ascending and descending columns can be mixed in the same sort, and None values
+    or columns of mixed types are handled explicitly instead of raising TypeError:
+        None values are always sorted last, in either direction
+        values of different types are grouped by type (numbers first, then other
+        types by type name) and are sorted within each group
+
+    eg:
+        i_sorted = sorted_indices([column_a, column_b], [True, False])
+        rows     = [rows[i] for i in i_sorted]
+    """
+    keys = [__sort_key_column(column, reverse) for column, reverse in zip(columns, reverses)]
+
+    if len(keys) == 1: keys = keys[0]
+    else:              keys = list(zip(*keys))
+
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def __sort_key_column(column, reverse):
+    """ :return: list of sort keys for each value in column
+
+    numeric descending values are negated, other descending values are wrapped
+    in reversed_value_cls, so that comparisons are only inverted where needed
+    """
+    types    = set(map(type, column))
+    has_none = type(None) in types
+    types.discard(type(None))
+
+    is_numeric = all(issubclass(t, (Real, Decimal)) for t in types)
+    is_mixed   = (len(types) > 1) and not is_numeric
+
+    if is_mixed:
+        rank = {t: __type_rank(t) for t in types}
+
+        if reverse: return [(v is None, reversed_value_cls((rank.get(type(v)), v))) for v in column]
+        else:       return [(v is None, rank.get(type(v)), v) for v in column]
+
+    if reverse:
+        if is_numeric: keys = [v if v is None else -v for v in column]
+        else:          keys = [reversed_value_cls(v) for v in column]
+    else:
+        keys = column
+
+    if has_none:
+        keys = [(v is None, k) for v, k in zip(column, keys)]
+
+    return keys
+
+
+def is_directly_sortable(values) -> bool:
+    """ :return: True if values can be compared as they are, in the same order as sorted_indices(),
+    (no None values, and values are either all numbers or all of the same type)
+    """
+    types = set(map(type, values))
+    if type(None) in types:
+        return False
+
+    return len(types) <= 1 or all(issubclass(t, (Real, Decimal)) for t in types)
+
+
+def sort_key(v, reverse=False):
+    """ :return: sort key for a single value, for keys that are compared one at a time,
+    (eg, heapq.merge(), or checking that rows are already sorted)
+
+    keys are in the same order as sorted_indices(): None values last, values of different
+    types grouped by type, (numbers first, then other types by type name); with reverse=True,
+    keys are meant to be compared in reverse, (None values are still last)
+
+    eg:
+        rows = heapq.merge(rows_a, rows_b, key=lambda row: sort_key(row.col_a))
+    """
+    if v is None:
+        return (not reverse,)
+
+    t    = type(v)
+    rank = type_ranks.get(t)
+    if rank is None:
+        rank = type_ranks[t] = __type_rank(t)
+
+    return (reverse, rank, v)
+
+
+def __type_rank(t):
+    """ numbers are sorted first, other types by type name """
+    return '' if issubclass(t, (Real, Decimal)) else t.__name__
+
+
 def to_grouped_dict(flat_dict: Dict) -> Dict[Any, Dict]:
     """ re-map keys (tuples) to a nested structure
 
@@ -0,0 +1,816 @@
+
+import os
+import posixpath
+import re
+
+from datetime import date
+from datetime import datetime
+from itertools import chain
+from itertools import islice
+from math import isfinite
+from typing import Generator
+from typing import List
+from xml.etree.ElementTree import XMLParser
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import escape as xml_escape
+from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED
+
+from .dates import excel_epoch
+from .dates import parse_date_excel_serial
+
+"""
+offline .xlsx / .xlsm reading and writing with zipfile and incremental xml parsing,
+(no Excel application required)
+
+an .xlsx file is a zip archive of xml parts:
+    xl/workbook.xml             sheet names and relationship ids, date1904 setting
+    xl/_rels/workbook.xml.rels  relationship ids -> part paths
+    xl/worksheets/sheet1.xml    <sheetData><row r="1"><c r="A1" t="s" s="0"><v>0</v></c> ...
+    xl/sharedStrings.xml        <sst><si><t>text</t></si> ...
+    xl/styles.xml               <cellXfs><xf numFmtId="14"/> ..., (cell s attribute -> number format)
+
+worksheet rows are parsed (or written) one at a time, so that memory does not grow with
+the number of rows in a sheet, (only the shared strings table is held in memory)
+"""
+xml_block_size = 1 << 16
+
+xlsx_max_rows           = 1_048_576
+xlsx_max_cols           = 16_384
+xlsx_max_string_length  = 32_767
+xlsx_max_shared_strings = 1_000_000
+xlsx_string_sample_size = 1_000
+
+spreadsheet_ns   = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+relationships_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+package_rels_ns  = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# cell styles written by write_xlsx(): 0 general, 1 date (numFmtId 14), 2 date and time (numFmtId 22)
+date_style     = 1
+datetime_style = 2
+
+# builtin number format ids that display dates / times
+date_format_ids = {14, 15, 16, 17, 22, 27, 30, 36, 50, 57}
+time_format_ids = {18, 19, 20, 21, 45, 46, 47}
+
+escaped_char_pattern   = re.compile(r'_x([0-9A-Fa-f]{4})_')
+unescaped_char_pattern = re.compile(r'[&<>\x00-\x08\x0b-\x1f\ufffe\uffff]|_(?=x[0-9A-Fa-f]{4}_)')
+format_literal_pattern = re.compile(r'"[^"]*"|\[(?![hms]+\])[^\]]*\]|\\.', re.IGNORECASE)
+
+
+def xlsx_sheet_names(path) -> List[str]:
+    with ZipFile(path) as z:
+        return [name for name, _ in __workbook_sheets(z)[0]]
+
+
+def read_xlsx(path,
+              sheet=None,
+              header_row=1,
+              nrows=None) -> List[List]:
+    """
+    :param sheet:      sheet name, or 0-based sheet index, (default is the first sheet)
+    :param header_row: Excel row number of the header row, rows above are skipped
+    :param nrows:      maximum number of rows to read after the header row
+
+    eg:
+        m = read_xlsx('file.xlsx', sheet='Sheet1')
+    """
+    return list(__xlsx_rows(path, sheet, header_row, nrows))
+
+
+def iter_xlsx(path,
+              sheet=None,
+              header_row=1,
+              nrows=None,
+              chunksize=100_000) -> Generator[List[List], None, None]:
+    """ yield lists of rows, the first chunk also includes the header row, (chunksize + 1 rows) """
+    rows = __xlsx_rows(path, sheet, header_row, nrows)
+    n    = chunksize + 1
+
+    while True:
+        m = list(islice(rows, n))
+        if not m:
+            return
+
+        yield m
+        n = chunksize
+
+
+def write_xlsx(path,
+               rows,
+               sheet='Sheet1',
+               strings='auto',
+               compresslevel=None):
+    """ write rows to a workbook with a single worksheet
+
+    rows are consumed one at a time and written directly into the compressed worksheet part,
+    values are converted the same way as excel_com.worksheet.convert_python_types():
+        str, int, float, bool   unchanged, (nan and inf are written as text)
+        datetime.datetime       date and time
+        datetime.date           datetime, (with a date-only number format)
+        None                    empty cell
+        anything else           str(v)
+
+    :param strings: 'auto', 'shared' or 'inline'
+        'shared': each distinct string is stored once in the shared strings table
+        'inline': strings are written into every cell
+        'auto':   shared strings for columns where at most half of the strings in the
+                  first 1,000 rows are distinct, inline strings for all other columns
+
+    eg:
+        write_xlsx('report.xlsx', flux.values(), sheet='report')
+    """
+    strings = __validate_strings(strings)
+    sheet   = __validate_sheet_name(sheet)
+
+    rows   = iter(rows)
+    sample = list(islice(rows, xlsx_string_sample_size))
+    rows   = chain(sample, rows)
+
+    is_shared_column = __shared_string_columns(sample, strings)
+    is_macro_enabled = path.lower().endswith('.xlsm')
+
+    path_tmp = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with ZipFile(path_tmp, 'w', ZIP_DEFLATED, compresslevel=compresslevel) as z:
+            with z.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as f:
+                shared_strings = __write_sheet_rows(f, rows, is_shared_column)
+
+            if shared_strings:
+                with z.open('xl/sharedStrings.xml', 'w', force_zip64=True) as f:
+                    __write_shared_strings(f, shared_strings)
+
+            __write_workbook_parts(z, sheet, bool(shared_strings), is_macro_enabled)
+
+        os.replace(path_tmp, path)
+    finally:
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+
+
+def __xlsx_rows(path, sheet, header_row, nrows):
+    """
+    cell values:
+        shared / inline / formula strings   str
+        numbers                             int or float
+        numbers with a date or time format  datetime, (or time)
+        booleans                            bool
+        errors                              str, eg '#N/A'
+        empty cells                         None
+
+    every row is padded with None to the width of the header row, empty rows
+    between rows are yielded as rows of None
+    """
+    if not isinstance(header_row, int) or header_row < 1:
+        raise ValueError('header_row must be an Excel row number (>= 1), not {}'.format(header_row))
+
+    with ZipFile(path) as z:
+        sheets, date1904, rels = __workbook_sheets(z)
+        sheet_part = __validate_sheet(sheet, sheets)
+
+        shared_strings = __shared_strings(z, rels.get('sharedStrings'))
+        date_styles    = __date_styles(z, rels.get('styles'))
+
+        with z.open(sheet_part) as f:
+            rows = __sheet_rows(f, shared_strings, date_styles, date1904)
+
+            num_cols = None
+            r_expect = header_row
+            r_last   = (header_row + nrows) if nrows is not None else None
+
+            for r, row in rows:
+                if r < header_row:
+                    continue
+                if r_last is not None and r > r_last:
+                    break
+
+                if num_cols is None:
+                    num_cols = len(row)
+
+                while r_expect < r:
+                    yield [None] * num_cols
+                    r_expect += 1
+
+                if len(row) < num_cols:
+                    row.extend([None] * (num_cols - len(row)))
+
+                yield row
+                r_expect = r + 1
+
+
+def __sheet_rows(f, shared_strings, date_styles, date1904):
+    """ yield (row number, values) from a worksheet xml part
+
+    the xml is fed to the parser in blocks, and parser callbacks build row values directly,
+    (no Element objects are created for cells)
+    """
+    # region {closure classes}
+    class sheet_target:
+        def __init__(self):
+            self.ns   = None
+            self.rows = []
+
+            self.r   = 0
+            self.row = None
+            self.t   = None
+            self.s   = None
+
+            self.text        = []
+            self.is_text     = False
+            self.is_phonetic = False
+
+        def start(self, tag, attrib):
+            if self.ns is None:
+                self.set_tags(tag)
+
+            if tag == self.c_tag:
+                ref = attrib.get('r')
+                if ref is not None:
+                    row = self.row
+                    i   = cell_column(ref)
+
+                    if i > len(row):
+                        row.extend([None] * (i - len(row)))
+
+                self.t    = attrib.get('t')
+                self.s    = attrib.get('s')
+                self.text = []
+
+            elif tag == self.v_tag or tag == self.t_tag:
+                self.is_text = not self.is_phonetic
+
+            elif tag == self.row_tag:
+                r        = attrib.get('r')
+                self.r   = int(r) if r is not None else (self.r + 1)
+                self.row = []
+
+            elif tag == self.rph_tag:
+                self.is_phonetic = True
+
+        def data(self, text):
+            if self.is_text:
+                self.text.append(text)
+
+        def end(self, tag):
+            if tag == self.c_tag:
+                v = ''.join(self.text) if self.text else None
+                self.row.append(cell_value(v, self.t, self.s))
+
+            elif tag == self.v_tag or tag == self.t_tag:
+                self.is_text = False
+
+            elif tag == self.row_tag:
+                self.rows.append((self.r, self.row))
+                self.row = None
+
+            elif tag == self.rph_tag:
+                self.is_phonetic = False
+
+        def set_tags(self, tag):
+            self.ns = xml_namespace(tag)
+
+            self.row_tag = self.ns + 'row'
+            self.c_tag   = self.ns + 'c'
+            self.v_tag   = self.ns + 'v'
+            self.t_tag   = self.ns + 't'
+            self.rph_tag = self.ns + 'rPh'
+
+        def close(self):
+            pass
+    # endregion
+
+    # region {closure functions}
+    def xml_namespace(tag):
+        return __namespace(tag)
+
+    def cell_column(ref):
+        letters = ref.rstrip('0123456789')
+
+        i = column_indices.get(letters)
+        if i is None:
+            i = column_indices[letters] = __column_index(letters)
+
+        return i
+
+    def cell_value(v, t, s):
+        if t is None or t == 'n':
+            if v is None:
+                return None
+            if '.' in v or 'E' in v or 'e' in v:
+                v = float(v)
+            else:
+                v = int(v)
+
+            is_date = date_styles.get(int(s)) if s is not None else None
+            if is_date is None:
+                return v
+
+            d = parse_date_excel_serial(v, date1904)
+            if is_date == 'time' and d is not None:
+                return d.time()
+
+            return d
+
+        if t == 's':
+            return shared_strings[int(v)]
+        if t == 'b':
+            return v == '1'
+        if t == 'inlineStr' or t == 'str':
+            return __unescape(v or '')
+        if t == 'd':
+            return datetime.fromisoformat(v.rstrip('Z')) if v else None
+
+        # t == 'e'
+        return v
+    # endregion
+
+    column_indices = {}
+
+    target = sheet_target()
+    parser = XMLParser(target=target)
+
+    while True:
+        b = f.read(xml_block_size)
+        if not b:
+            break
+
+        parser.feed(b)
+
+        rows = target.rows
+        if rows:
+            target.rows = []
+            yield from rows
+
+    parser.close()
+    yield from target.rows
+
+
+def __write_sheet_rows(f, rows, is_shared_column):
+    """ :return: shared strings, {str: index}
+
+    each row is converted to xml and written to f in blocks of rows
+    """
+    # region {closure functions}
+    def text_cell(ref, c, s):
+        if len(s) > xlsx_max_string_length:
+            raise ValueError('row {:,}, column {}: string of {:,} characters exceeds '
+                             "Excel's cell limit ({:,})".format(r, c + 1, len(s), xlsx_max_string_length))
+
+        if c < num_shared_columns and is_shared_column[c]:
+            i = shared_strings.get(s)
+            if i is None and len(shared_strings) < xlsx_max_shared_strings:
+                i = shared_strings[s] = len(shared_strings)
+
+            if i is not None:
+                return '<c r="%s" t="s"><v>%d</v></c>' % (ref, i)
+
+        return '<c r="%s" t="inlineStr"><is>%s</is></c>' % (ref, __text_element(s))
+
+    def number_cell(ref, c, v):
+        if isfinite(v):
+            return '<c r="%s"><v>%r</v></c>' % (ref, v)
+
+        return text_cell(ref, c, str(v))
+
+    def datetime_cell(ref, c, v, style):
+        if style == date_style:
+            serial = __excel_serial(datetime(v.year, v.month, v.day))
+        else:
+            serial = __excel_serial(v)
+
+        if serial < 1:
+            return text_cell(ref, c, str(v))
+
+        return '<c r="%s" s="%d"><v>%r</v></c>' % (ref, style, serial)
+
+    def cell(ref, c, v):
+        """ same conversions as excel_com.worksheet.convert_python_types() """
+        if isinstance(v, bool):
+            return '<c r="%s" t="b"><v>%d</v></c>' % (ref, v)
+        if isinstance(v, str):
+            return text_cell(ref, c, v)
+        if isinstance(v, int):
+            return number_cell(ref, c, int(v))
+        if isinstance(v, float):
+            return number_cell(ref, c, float(v))
+        if isinstance(v, datetime):
+            return datetime_cell(ref, c, v, datetime_style)
+        if type(v) == date:
+            return datetime_cell(ref, c, v, date_style)
+
+        return text_cell(ref, c, str(v))
+    # endregion
+
+    shared_strings     = {}
+    num_shared_columns = len(is_shared_column)
+    column_letters     = []
+
+    f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="{}" xmlns:r="{}"><sheetData>'.format(spreadsheet_ns, relationships_ns)
+            .encode('utf-8'))
+
+    block = []
+    r     = 0
+
+    for r, row in enumerate(rows, 1):
+        if r > xlsx_max_rows:
+            raise ValueError("number of rows exceeds Excel's row limit ({:,})".format(xlsx_max_rows))
+
+        if len(row) > len(column_letters):
+            column_letters.extend(__column_letters(c) for c in range(len(column_letters), len(row)))
+
+        r_s   = str(r)
+        cells = ['<row r="' + r_s + '">']
+
+        for c, v in enumerate(row):
+            if v is None:
+                continue
+
+            ref = column_letters[c] + r_s
+            t   = type(v)
+
+            if t is str:
+                cells.append(text_cell(ref, c, v))
+            elif t is int or (t is float and isfinite(v)):
+                cells.append('<c r="%s"><v>%r</v></c>' % (ref, v))
+            else:
+                cells.append(cell(ref, c, v))
+
+        cells.append('</row>')
+        block.append(''.join(cells))
+
+        if len(block) == 1_000:
+            f.write(''.join(block).encode('utf-8'))
+            block = []
+
+    block.append('</sheetData></worksheet>')
+    f.write(''.join(block).encode('utf-8'))
+
+    return shared_strings
+
+
+def __write_shared_strings(f, shared_strings):
+    f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<sst xmlns="{}" uniqueCount="{}">'.format(spreadsheet_ns, len(shared_strings))
+            .encode('utf-8'))
+
+    strings = iter(shared_strings)
+    while True:
+        block = ['<si>{}</si>'.format(__text_element(s)) for s in islice(strings, 1_000)]
+        if not block:
+            break
+
+        f.write(''.join(block).encode('utf-8'))
+
+    f.write(b'</sst>')
+
+
+def __write_workbook_parts(z, sheet, has_shared_strings, is_macro_enabled):
+    xml_declaration = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    content_type    = 'application/vnd.openxmlformats-officedocument.spreadsheetml.{}+xml'
+    relationship    = '<Relationship Id="{}" Type="{}/{}" Target="{}"/>'
+
+    if is_macro_enabled:
+        workbook_type = 'application/vnd.ms-excel.sheet.macroEnabled.main+xml'
+    else:
+        workbook_type = content_type.format('sheet.main')
+
+    overrides = [('/xl/workbook.xml',          workbook_type),
+                 ('/xl/worksheets/sheet1.xml', content_type.format('worksheet')),
+                 ('/xl/styles.xml',            content_type.format('styles'))]
+    workbook_rels = [('rId1', 'worksheet', 'worksheets/sheet1.xml'),
+                     ('rId2', 'styles',    'styles.xml')]
+
+    if has_shared_strings:
+        overrides.append(('/xl/sharedStrings.xml', content_type.format('sharedStrings')))
+        workbook_rels.append(('rId3', 'sharedStrings', 'sharedStrings.xml'))
+
+    z.writestr('[Content_Types].xml',
+               xml_declaration +
+               '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+               '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+               '<Default Extension="xml" ContentType="application/xml"/>' +
+               ''.join('<Override PartName="{}" ContentType="{}"/>'.format(*o) for o in overrides) +
+               '</Types>')
+
+    z.writestr('_rels/.rels',
+               xml_declaration +
+               '<Relationships xmlns="{}">'.format(package_rels_ns) +
+               relationship.format('rId1', relationships_ns, 'officeDocument', 'xl/workbook.xml') +
+               '</Relationships>')
+
+    z.writestr('xl/workbook.xml',
+               xml_declaration +
+               '<workbook xmlns="{}" xmlns:r="{}">'.format(spreadsheet_ns, relationships_ns) +
+               '<sheets><sheet name={} sheetId="1" r:id="rId1"/></sheets>'.format(__xml_attribute(sheet)) +
+               '</workbook>')
+
+    z.writestr('xl/_rels/workbook.xml.rels',
+               xml_declaration +
+               '<Relationships xmlns="{}">'.format(package_rels_ns) +
+               ''.join(relationship.format(r_id, relationships_ns, r_type, target)
+                       for r_id, r_type, target in workbook_rels) +
+               '</Relationships>')
+
+    z.writestr('xl/styles.xml',
+               xml_declaration +
+               '<styleSheet xmlns="{}">'.format(spreadsheet_ns) +
+               '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+               '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+               '<fill><patternFill patternType="gray125"/></fill></fills>'
+               '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+               '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+               '<cellXfs count="3">'
+               '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+               '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+               '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+               '</cellXfs>'
+               '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+               '</styleSheet>')
+
+
+def __shared_string_columns(sample, strings):
+    """ :return: list of bool, whether strings in each column are written to the shared strings table """
+    num_cols = max(map(len, sample), default=0)
+
+    if strings == 'shared':
+        return [True] * xlsx_max_cols
+    if strings == 'inline':
+        return []
+
+    is_shared_column = []
+    for c in range(num_cols):
+        values = [row[c] for row in sample if c < len(row) and isinstance(row[c], str)]
+        is_shared_column.append(len(set(values)) <= len(values) / 2)
+
+    return is_shared_column
+
+
+def __excel_serial(v):
+    """ see util.dates.parse_date_excel_serial() """
+    if v.tzinfo is not None:
+        v = v.replace(tzinfo=None)
+
+    delta  = v - excel_epoch
+    serial = delta.days
+
+    if delta.seconds or delta.microseconds:
+        serial += (delta.seconds + delta.microseconds / 1_000_000) / 86_400
+    if serial < 61:
+        serial -= 1
+
+    return serial
+
+
+def __text_element(s):
+    """ eg: 'a & b' -> '<t>a &amp; b</t>' """
+    if unescaped_char_pattern.search(s) is not None:
+        s_escaped = unescaped_char_pattern.sub(__escaped_char, s)
+    else:
+        s_escaped = s
+
+    if s[:1].isspace() or s[-1:].isspace():
+        return '<t xml:space="preserve">{}</t>'.format(s_escaped)
+
+    return '<t>{}</t>'.format(s_escaped)
+
+
+def __escaped_char(match):
+    """ xml entities, or Excel's escape for characters not allowed in xml, eg: '\\r' -> '_x000D_' """
+    char = match.group()
+
+    if char in '&<>':
+        return xml_escape(char)
+
+    return '_x{:04X}_'.format(ord(char))
+
+
+def __xml_attribute(s):
+    return '"{}"'.format(xml_escape(s, {'"': '&quot;'}))
+
+
+def __column_letters(i):
+    """ eg: 0 -> 'A', 27 -> 'AB' """
+    if i >= xlsx_max_cols:
+        raise ValueError("number of columns exceeds Excel's column limit ({:,})".format(xlsx_max_cols))
+
+    letters = ''
+    i += 1
+    while i > 0:
+        i, remainder = divmod(i - 1, 26)
+        letters = chr(65 + remainder) + letters
+
+    return letters
+
+
+def __validate_strings(strings):
+    strings = str(strings).lower()
+    if strings not in ('auto', 'shared', 'inline'):
+        raise ValueError("strings must be 'auto', 'shared' or 'inline', not '{}'".format(strings))
+
+    return strings
+
+
+def __validate_sheet_name(sheet):
+    sheet = str(sheet)
+
+    if not (1 <= len(sheet) <= 31) or any(char in sheet for char in '[]:*?/\\'):
+        raise ValueError("invalid worksheet name: '{}', (1 to 31 characters, "
+                         "excluding [ ] : * ? / \\)".format(sheet))
+
+    return sheet
+
+
+def __workbook_sheets(z):
+    """ :return: ([(sheet name, part path), ...], date1904, {relationship type: part path}) """
+    workbook_part = __office_document_part(z)
+    rels          = __part_relationships(z, workbook_part)
+
+    sheets   = []
+    date1904 = False
+
+    with z.open(workbook_part) as f:
+        for _, elem in iterparse(f):
+            tag = __local_name(elem.tag)
+
+            if tag == 'workbookPr':
+                date1904 = elem.get('date1904', '').lower() in ('1', 'true')
+            elif tag == 'sheet':
+                r_id = next(v for k, v in elem.attrib.items() if __local_name(k) == 'id')
+                sheets.append((elem.get('name'), rels['ids'][r_id]))
+
+    return sheets, date1904, rels['types']
+
+
+def __office_document_part(z):
+    rels = __part_relationships(z, '')
+    return rels['types'].get('officeDocument', 'xl/workbook.xml')
+
+
+def __part_relationships(z, part):
+    """ :return: {'ids': {id: part path}, 'types': {type: part path}} """
+    part_dir, part_name = posixpath.split(part)
+    rels_part = posixpath.join(part_dir, '_rels', part_name + '.rels')
+
+    rels = {'ids':   {},
+            'types': {}}
+
+    if rels_part not in z.namelist():
+        return rels
+
+    with z.open(rels_part) as f:
+        for _, elem in iterparse(f):
+            if __local_name(elem.tag) != 'Relationship' or elem.get('TargetMode') == 'External':
+                continue
+
+            target = elem.get('Target')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(part_dir, target))
+
+            rels['ids'][elem.get('Id')] = target
+            rels['types'].setdefault(elem.get('Type').rsplit('/', 1)[-1], target)
+
+    return rels
+
+
+def __shared_strings(z, part):
+    if part is None or part not in z.namelist():
+        return []
+
+    shared_strings = []
+
+    with z.open(part) as f:
+        sst = None
+        for event, elem in iterparse(f, events=('start', 'end')):
+            if sst is None:
+                sst = elem
+                ns  = __namespace(elem.tag)
+
+                si_tag = ns + 'si'
+                t_tag  = ns + 't'
+                r_tag  = ns + 'r'
+
+            if event == 'end' and elem.tag == si_tag:
+                shared_strings.append(__rich_text(elem, t_tag, r_tag))
+                sst.clear()
+
+    return shared_strings
+
+
+def __date_styles(z, part):
+    """ :return: {cell style index: 'date' or 'time'} for styles with a date or time number format """
+    if part is None or part not in z.namelist():
+        return {}
+
+    custom_formats = {}
+    date_styles    = {}
+
+    with z.open(part) as f:
+        for _, elem in iterparse(f):
+            tag = __local_name(elem.tag)
+
+            if tag == 'numFmt':
+                custom_formats[int(elem.get('numFmtId'))] = elem.get('formatCode', '')
+
+            elif tag == 'cellXfs':
+                xfs = [xf for xf in elem if __local_name(xf.tag) == 'xf']
+
+                for i, xf in enumerate(xfs):
+                    kind = __number_format_kind(int(xf.get('numFmtId', 0)), custom_formats)
+                    if kind is not None:
+                        date_styles[i] = kind
+
+    return date_styles
+
+
+def __number_format_kind(format_id, custom_formats):
+    if format_id in custom_formats:
+        code = format_literal_pattern.sub('', custom_formats[format_id].split(';')[0]).lower()
+
+        if 'd' in code or 'y' in code:
+            return 'date'
+        if 'h' in code or 's' in code:
+            return 'time'
+        if 'm' in code:
+            return 'date'
+
+        return None
+
+    if format_id in date_format_ids:
+        return 'date'
+    if format_id in time_format_ids:
+        return 'time'
+
+    return None
+
+
+def __rich_text(elem, t_tag, r_tag):
+    """ text of <t> elements and rich text runs, (phonetic <rPh> runs are excluded) """
+    if elem is None:
+        return ''
+
+    s = []
+    for child in elem:
+        if child.tag == t_tag:
+            s.append(child.text or '')
+        elif child.tag == r_tag:
+            s.append(child.findtext(t_tag) or '')
+
+    return __unescape(''.join(s))
+
+
+def __unescape(s):
+    """ eg: '_x000D_' -> '\\r' """
+    if '_x' not in s:
+        return s
+
+    return escaped_char_pattern.sub(lambda match: chr(int(match.group(1), 16)), s)
+
+
+def __column_index(letters):
+    """ eg: 'A' -> 0, 'AB' -> 27 """
+    i = 0
+    for char in letters.upper():
+        i = i * 26 + (ord(char) - 64)
+
+    return i - 1
+
+
+def __namespace(tag):
+    """ eg: '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}worksheet' -> '{http://...main}' """
+    if tag.startswith('{'):
+        return tag[:tag.index('}') + 1]
+
+    return ''
+
+
+def __local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def __validate_sheet(sheet, sheets):
+    names = [name for name, _ in sheets]
+
+    if not sheets:
+        raise ValueError('workbook has no worksheets')
+
+    if sheet is None:
+        return sheets[0][1]
+
+    if isinstance(sheet, int) and not isinstance(sheet, bool):
+        if -len(sheets) <= sheet < len(sheets):
+            return sheets[sheet][1]
+
+        raise IndexError('sheet index {} out of range, workbook has {} sheets: {}'.format(sheet, len(sheets), names))
+
+    for name, part in sheets:
+        if name == sheet:
+            return part
+
+    lower_names = [name.lower() for name in names]
+    if str(sheet).lower() in lower_names:
+        return sheets[lower_names.index(str(sheet).lower())][1]
+
+    raise ValueError("sheet '{}' does not exist, available sheets: {}".format(sheet, names))